@@ -1,9 +1,10 @@
 from typing import Annotated, Optional, final
 
 from fastapi import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing_extensions import Self, TypeAlias
 
+from conduit.api.pagination import decode_cursor, encode_cursor
 from conduit.api.serialization import DateTime
 from conduit.application.articles.use_cases.feed_articles.use_case import (
     FeedArticlesRequest,
@@ -13,6 +14,7 @@ from conduit.application.articles.use_cases.list_articles.use_case import (
     ListArticlesRequest,
     ListArticlesResponse,
 )
+from conduit.application.common.paging import Cursor
 from conduit.domain.articles.articles import (
     ArticleWithAuthor,
     BodylessArticleWithAuthor,
@@ -21,6 +23,8 @@ from conduit.domain.articles.articles import (
 )
 from conduit.domain.users.user import User
 
+MAX_ARTICLES_PER_BATCH = 100
+
 ArticleSlug: TypeAlias = Annotated[
     str,
     Path(
@@ -30,22 +34,42 @@ ArticleSlug: TypeAlias = Annotated[
 ]
 
 
-class PagingParameters(BaseModel):
+def _encode_optional_cursor(cursor: Optional[Cursor]) -> Optional[str]:
+    return encode_cursor(cursor) if cursor else None
+
+
+class BasePagingParameters(BaseModel):
     limit: int = Field(default=20, ge=1, le=50)
     offset: int = Field(default=0, ge=0)
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque `nextCursor` of the previous page. Takes precedence over `offset`.",
+        min_length=1,
+    )
+
+    @field_validator("cursor")
+    @classmethod
+    def validate_cursor(cls, cursor: Optional[str]) -> Optional[str]:
+        if cursor is not None:
+            decode_cursor(cursor)
+        return cursor
+
+    def domain_cursor(self) -> Optional[Cursor]:
+        return decode_cursor(self.cursor) if self.cursor else None
 
+
+class PagingParameters(BasePagingParameters):
     def to_domain(self, current_user: User) -> FeedArticlesRequest:
         return FeedArticlesRequest(
             limit=self.limit,
             offset=self.offset,
+            cursor=self.domain_cursor(),
             user=current_user,
         )
 
 
 @final
-class ListArticlesFilters(BaseModel):
-    limit: int = Field(default=20, ge=1, le=50)
-    offset: int = Field(default=0, ge=0)
+class ListArticlesFilters(BasePagingParameters):
     tag: Optional[str] = Field(None, min_length=1)
     author: Optional[str] = Field(None, min_length=1)
     favorited: Optional[str] = Field(None, min_length=1)
@@ -54,6 +78,7 @@ class ListArticlesFilters(BaseModel):
         return ListArticlesRequest(
             limit=self.limit,
             offset=self.offset,
+            cursor=self.domain_cursor(),
             tag=self.tag,
             author=self.author,
             favorited=self.favorited,
@@ -99,20 +124,32 @@ class NewArticleData(BaseModel):
         alias="tagList",
     )
 
+    def to_domain(self) -> NewArticleDetails:
+        return NewArticleDetails(
+            title=self.title,
+            description=self.description,
+            body=self.body,
+            tags=list(self.tags),
+        )
+
 
 @final
 class CreateArticleApiRequest(BaseModel):
     article: NewArticleData
 
     def to_domain(self) -> NewArticleDetails:
-        article = self.article
+        return self.article.to_domain()
 
-        return NewArticleDetails(
-            title=article.title,
-            description=article.description,
-            body=article.body,
-            tags=list(article.tags),
-        )
+
+@final
+class CreateArticlesApiRequest(BaseModel):
+    articles: list[NewArticleData] = Field(
+        min_length=1,
+        max_length=MAX_ARTICLES_PER_BATCH,
+    )
+
+    def to_domain(self) -> list[NewArticleDetails]:
+        return [article.to_domain() for article in self.articles]
 
 
 @final
@@ -134,8 +171,32 @@ class ArticleData(BaseModel):
     updated_at: DateTime = Field(alias="updatedAt")
     favorited: bool
     favorites_count: int = Field(alias="favoritesCount")
+    comments_count: int = Field(alias="commentsCount")
     author: ArticleAuthorData
 
+    @classmethod
+    def from_article_with_author(cls, article: ArticleWithAuthor) -> Self:
+        author = article.author
+
+        return cls(
+            slug=article.slug,
+            title=article.title,
+            description=article.description,
+            body=article.body,
+            tagList=article.tags,
+            createdAt=article.created_at,
+            updatedAt=article.updated_at,
+            favorited=article.favorited,
+            favoritesCount=article.favorites_count,
+            commentsCount=article.comments_count,
+            author=ArticleAuthorData(
+                username=author.username,
+                bio=author.bio,
+                image=author.image,
+                following=author.following,
+            ),
+        )
+
 
 @final
 class ArticleWithAuthorApiResponse(BaseModel):
@@ -143,26 +204,19 @@ class ArticleWithAuthorApiResponse(BaseModel):
 
     @classmethod
     def from_article_with_author(cls, article: ArticleWithAuthor) -> Self:
-        author = article.author
+        return cls(article=ArticleData.from_article_with_author(article))
 
+
+@final
+class CreateArticlesApiResponse(BaseModel):
+    articles: list[ArticleData]
+    articles_count: int = Field(alias="articlesCount")
+
+    @classmethod
+    def from_articles(cls, articles: list[ArticleWithAuthor]) -> Self:
         return cls(
-            article=ArticleData(
-                slug=article.slug,
-                title=article.title,
-                description=article.description,
-                body=article.body,
-                tagList=article.tags,
-                createdAt=article.created_at,
-                updatedAt=article.updated_at,
-                favorited=article.favorited,
-                favoritesCount=article.favorites_count,
-                author=ArticleAuthorData(
-                    username=author.username,
-                    bio=author.bio,
-                    image=author.image,
-                    following=author.following,
-                ),
-            ),
+            articlesCount=len(articles),
+            articles=[ArticleData.from_article_with_author(a) for a in articles],
         )
 
 
@@ -176,6 +230,7 @@ class BodylessArticleData(BaseModel):
     updated_at: DateTime = Field(alias="updatedAt")
     favorited: bool
     favorites_count: int = Field(alias="favoritesCount")
+    comments_count: int = Field(alias="commentsCount")
     author: ArticleAuthorData
 
     @classmethod
@@ -191,6 +246,7 @@ class BodylessArticleData(BaseModel):
             updatedAt=article.updated_at,
             favorited=article.favorited,
             favoritesCount=article.favorites_count,
+            commentsCount=article.comments_count,
             author=ArticleAuthorData(
                 username=author.username,
                 bio=author.bio,
@@ -204,11 +260,16 @@ class BodylessArticleData(BaseModel):
 class ListArticlesApiResponse(BaseModel):
     articles: list[BodylessArticleData]
     articles_count: int = Field(alias="articlesCount")
+    next_cursor: Optional[str] = Field(
+        alias="nextCursor",
+        description="Pass as `cursor` to get the next page. Null on the last page.",
+    )
 
     @classmethod
     def from_articles_info(cls, articles_info: ListArticlesResponse) -> Self:
         return cls(
             articlesCount=articles_info.articles_count,
+            nextCursor=_encode_optional_cursor(articles_info.next_cursor),
             articles=[
                 BodylessArticleData.from_bodyless_article(a)
                 for a in articles_info.articles
@@ -219,6 +280,7 @@ class ListArticlesApiResponse(BaseModel):
     def from_feed_info(cls, feed_info: FeedArticlesResponse) -> Self:
         return cls(
             articlesCount=feed_info.articles_count,
+            nextCursor=_encode_optional_cursor(feed_info.next_cursor),
             articles=[
                 BodylessArticleData.from_bodyless_article(a) for a in feed_info.articles
             ],
@@ -0,0 +1,45 @@
+from typing import Annotated
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Body, Depends, status
+
+from conduit.api.endpoints.articles.contract import (
+    CreateArticlesApiRequest,
+    CreateArticlesApiResponse,
+)
+from conduit.api.security.dependencies import CurrentUser
+from conduit.application.articles.use_cases.create_articles.use_case import (
+    CreateArticlesUseCase,
+)
+from conduit.containers import Container
+from conduit.shared.api.openapi.tags import Tag
+from conduit.shared.api.openapi.unauthorized_error import unauthorized_error
+from conduit.shared.api.openapi.validation_error import validation_error
+
+router = APIRouter()
+
+
+@router.post(
+    path="/articles/batch",
+    responses={
+        **unauthorized_error(),
+        **validation_error(),
+    },
+    status_code=status.HTTP_201_CREATED,
+    summary="Create several articles at once",
+    description=(
+        "The batch is all-or-nothing: if any article is invalid, or any of them "
+        "cannot be created, none of them is."
+    ),
+    tags=[Tag.Articles],
+)
+@inject
+async def create_articles(
+    new_articles: Annotated[CreateArticlesApiRequest, Body()],
+    current_user: CurrentUser,
+    create_articles: CreateArticlesUseCase = Depends(  # noqa: FAST002
+        Provide[Container.create_articles_use_case],
+    ),
+) -> CreateArticlesApiResponse:
+    created_articles = await create_articles(new_articles.to_domain(), current_user)
+    return CreateArticlesApiResponse.from_articles(created_articles)
@@ -1,14 +1,20 @@
+from typing import Union
+
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 
 from conduit.api.endpoints.articles.contract import (
     ArticleSlug,
     ArticleWithAuthorApiResponse,
 )
+from conduit.api.etag import IfNoneMatch, compute_etag, is_not_modified, not_modified
 from conduit.api.security.dependencies import OptionalCurrentUser
 from conduit.application.articles.use_cases.get_article_by_slug.use_case import (
     GetArticleBySlugUseCase,
 )
+from conduit.application.articles.use_cases.get_article_version.use_case import (
+    GetArticleVersionUseCase,
+)
 from conduit.containers import Container
 from conduit.shared.api.openapi.not_found_error import not_found_error
 from conduit.shared.api.openapi.tags import Tag
@@ -19,6 +25,7 @@ router = APIRouter()
 
 @router.get(
     path="/articles/{slug}",
+    response_model=ArticleWithAuthorApiResponse,
     responses={
         **unauthorized_error(),
         **not_found_error("Article"),
@@ -27,18 +34,43 @@ router = APIRouter()
     tags=[Tag.Articles],
 )
 @inject
-async def get_article_by_slug(
+async def get_article_by_slug(  # noqa: PLR0913
     slug: ArticleSlug,
     optional_user: OptionalCurrentUser,
+    response: Response,
+    if_none_match: IfNoneMatch = None,
+    get_article_version: GetArticleVersionUseCase = Depends(  # noqa: FAST002
+        Provide[Container.get_article_version_use_case],
+    ),
     get_article_by_slug: GetArticleBySlugUseCase = Depends(  # noqa: FAST002
         Provide[Container.get_article_by_slug_use_case],
     ),
-) -> ArticleWithAuthorApiResponse:
-    article = await get_article_by_slug(slug, optional_user)
-    if article is None:
+) -> Union[ArticleWithAuthorApiResponse, Response]:
+    viewer_id = optional_user.id if optional_user else None
+
+    # Only a conditional request reads the version on its own, so a 304 skips
+    # loading the article. The ETag of a full response comes from the same read
+    # as its body.
+    if if_none_match is not None:
+        version = await get_article_version(slug, optional_user)
+        if version is not None:
+            etag = compute_etag("article", slug, version, viewer_id)
+            if is_not_modified(if_none_match, etag):
+                return not_modified(etag)
+
+    versioned_article = await get_article_by_slug(slug, optional_user)
+    if versioned_article is None:
         raise HTTPException(
             status_code=404,
             detail="Article not found",
         )
 
-    return ArticleWithAuthorApiResponse.from_article_with_author(article)
+    response.headers["ETag"] = compute_etag(
+        "article",
+        slug,
+        versioned_article.version,
+        viewer_id,
+    )
+    return ArticleWithAuthorApiResponse.from_article_with_author(
+        versioned_article.article,
+    )
@@ -1,11 +1,17 @@
 from typing import Annotated, Optional, final
 
 from fastapi import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing_extensions import Self, TypeAlias
 
+from conduit.api.pagination import decode_cursor, encode_cursor
 from conduit.api.serialization import DateTime
+from conduit.application.comments.use_cases.list_comments.use_case import (
+    ListArticleCommentsRequest,
+    ListArticleCommentsResponse,
+)
 from conduit.domain.comments.comments import CommentWithAuthor
+from conduit.domain.users.user import User
 
 ArticleID: TypeAlias = Annotated[int, Path()]
 
@@ -23,6 +29,35 @@ class CreateCommentApiRequest(BaseModel):
     comment: NewCommentDetails
 
 
+@final
+class ListCommentsParameters(BaseModel):
+    limit: int = Field(default=20, ge=1, le=100)
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque `nextCursor` of the previous page.",
+        min_length=1,
+    )
+
+    @field_validator("cursor")
+    @classmethod
+    def validate_cursor(cls, cursor: Optional[str]) -> Optional[str]:
+        if cursor is not None:
+            decode_cursor(cursor)
+        return cursor
+
+    def to_domain(
+        self,
+        slug: str,
+        optional_user: Optional[User],
+    ) -> ListArticleCommentsRequest:
+        return ListArticleCommentsRequest(
+            slug=slug,
+            limit=self.limit,
+            cursor=decode_cursor(self.cursor) if self.cursor else None,
+            user=optional_user,
+        )
+
+
 @final
 class CommentAuthor(BaseModel):
     username: str
@@ -47,10 +82,10 @@ class CommentData(BaseModel):
             updated_at=comment.updated_at,
             body=comment.body,
             author=CommentAuthor(
-                username="NO",
-                bio="NO",
-                image=None,
-                following=False,
+                username=comment.author.username,
+                bio=comment.author.bio,
+                image=comment.author.image,
+                following=comment.author.following,
             ),
         )
 
@@ -69,11 +104,18 @@ class CommentDetailsApiResponse(BaseModel):
 @final
 class ListCommentsApiResponse(BaseModel):
     comments: list[CommentData]
+    next_cursor: Optional[str] = Field(
+        alias="nextCursor",
+        description="Pass as `cursor` to get the next page. Null on the last page.",
+    )
 
     @classmethod
-    def from_comments(cls, comments: list[CommentWithAuthor]) -> Self:
+    def from_comments_info(cls, comments_info: ListArticleCommentsResponse) -> Self:
+        next_cursor = comments_info.next_cursor
         return cls(
+            nextCursor=encode_cursor(next_cursor) if next_cursor else None,
             comments=[
-                CommentData.from_comment_with_author(comment) for comment in comments
+                CommentData.from_comment_with_author(comment)
+                for comment in comments_info.comments
             ],
         )
@@ -1,8 +1,13 @@
+from typing import Annotated
+
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from conduit.api.endpoints.articles.contract import ArticleSlug
-from conduit.api.endpoints.comments.contract import ListCommentsApiResponse
+from conduit.api.endpoints.comments.contract import (
+    ListCommentsApiResponse,
+    ListCommentsParameters,
+)
 from conduit.api.security.dependencies import OptionalCurrentUser
 from conduit.application.comments.use_cases.list_comments.use_case import (
     ListArticleCommentsUseCase,
@@ -22,22 +27,23 @@ router = APIRouter()
         **validation_error(),
     },
     status_code=status.HTTP_200_OK,
-    summary="List all comments of an article",
+    summary="List comments of an article, the newest first",
     tags=[Tag.Comments],
 )
 @inject
 async def list_article_comments(
     slug: ArticleSlug,
     current_user: OptionalCurrentUser,
+    parameters: Annotated[ListCommentsParameters, Query()],
     list_comments: ListArticleCommentsUseCase = Depends(  # noqa: FAST002
         Provide[Container.list_article_comments_use_case],
     ),
 ) -> ListCommentsApiResponse:
-    comments = await list_comments(slug, current_user)
-    if comments is None:
+    comments_info = await list_comments(parameters.to_domain(slug, current_user))
+    if comments_info is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Article not found",
         )
 
-    return ListCommentsApiResponse.from_comments(comments)
+    return ListCommentsApiResponse.from_comments_info(comments_info)
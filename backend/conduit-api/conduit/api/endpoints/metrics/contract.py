@@ -0,0 +1,53 @@
+from typing import Final
+
+from conduit.infrastructure.metrics.registry import (
+    LATENCY_BUCKETS_MS,
+    NS_IN_ONE_MS,
+    MetricsRegistry,
+)
+
+PROMETHEUS_CONTENT_TYPE: Final = "text/plain; version=0.0.4; charset=utf-8"
+
+MS_IN_ONE_SECOND: Final = 1000
+
+
+def render_prometheus(metrics: MetricsRegistry) -> str:
+    """Renders the metrics in the Prometheus text exposition format."""
+
+    lines = [
+        "# TYPE conduit_operation_duration_seconds histogram",
+    ]
+    errors_lines = [
+        "# TYPE conduit_operation_errors_total counter",
+    ]
+    for name, operation in sorted(metrics.operations.items()):
+        label = f'operation="{name}"'
+        cumulative_count = 0
+        for bound_ms, bucket_count in zip(
+            LATENCY_BUCKETS_MS,
+            operation.bucket_counts,
+        ):
+            cumulative_count += bucket_count
+            lines.append(
+                f"conduit_operation_duration_seconds_bucket"
+                f'{{{label},le="{bound_ms / MS_IN_ONE_SECOND}"}} {cumulative_count}',
+            )
+        lines.extend(
+            (
+                f'conduit_operation_duration_seconds_bucket{{{label},le="+Inf"}} '
+                f"{operation.count}",
+                f"conduit_operation_duration_seconds_sum{{{label}}} "
+                f"{operation.total_ns / NS_IN_ONE_MS / MS_IN_ONE_SECOND}",
+                f"conduit_operation_duration_seconds_count{{{label}}} {operation.count}",
+            ),
+        )
+        errors_lines.append(
+            f"conduit_operation_errors_total{{{label}}} {operation.errors}",
+        )
+
+    lines.extend(errors_lines)
+    for name, value in sorted(metrics.gauges().items()):
+        lines.extend((f"# TYPE conduit_{name} gauge", f"conduit_{name} {value}"))
+    for name, value in sorted(metrics.counters.items()):
+        lines.extend((f"# TYPE conduit_{name} counter", f"conduit_{name} {value}"))
+    return "\n".join(lines) + "\n"
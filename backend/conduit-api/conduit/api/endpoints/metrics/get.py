@@ -0,0 +1,35 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+
+from conduit.api.endpoints.metrics.contract import (
+    PROMETHEUS_CONTENT_TYPE,
+    render_prometheus,
+)
+from conduit.containers import Container
+from conduit.infrastructure.metrics.registry import MetricsRegistry
+from conduit.settings import Settings
+from conduit.shared.api.openapi.tags import Tag
+
+router = APIRouter()
+
+
+@router.get(
+    path="/metrics",
+    response_class=Response,
+    summary="Latencies and errors of every operation, and cache statistics",
+    tags=[Tag.Health],
+)
+@inject
+async def get_metrics(
+    metrics: MetricsRegistry = Depends(Provide[Container.metrics]),  # noqa: FAST002
+    settings: Settings = Depends(Provide[Container.app_settings]),  # noqa: FAST002
+) -> Response:
+    if not settings.metrics_endpoint_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Metrics are not exposed",
+        )
+    return Response(
+        content=render_prometheus(metrics),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
@@ -33,6 +33,16 @@ class ProfileData(BaseModel):
         description="Do I follow the user with the given username?",
         examples=[True],
     )
+    followers_count: int = Field(
+        alias="followersCount",
+        description="Number of users following the user.",
+        examples=[42],
+    )
+    following_count: int = Field(
+        alias="followingCount",
+        description="Number of users the user follows.",
+        examples=[7],
+    )
 
 
 @final
@@ -47,5 +57,7 @@ class ProfileDetailsApiResponse(BaseModel):
                 bio=profile.bio,
                 image=profile.image,
                 following=profile.following,
+                followersCount=profile.followers_count,
+                followingCount=profile.following_count,
             ),
         )
@@ -1,11 +1,17 @@
+from typing import Union
+
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from conduit.api.endpoints.profiles.contract import ProfileDetailsApiResponse, Username
+from conduit.api.etag import IfNoneMatch, compute_etag, is_not_modified, not_modified
 from conduit.api.security.dependencies import OptionalCurrentUser
 from conduit.application.profiles.use_cases.get_profile_by_name.use_case import (
     GetProfileByNameUseCase,
 )
+from conduit.application.profiles.use_cases.get_profile_version.use_case import (
+    GetProfileVersionUseCase,
+)
 from conduit.containers import Container
 from conduit.shared.api.openapi.not_found_error import not_found_error
 from conduit.shared.api.openapi.tags import Tag
@@ -16,6 +22,7 @@ router = APIRouter()
 
 @router.get(
     path="/profiles/{username}",
+    response_model=ProfileDetailsApiResponse,
     responses={
         **validation_error(),
         **not_found_error("Profile"),
@@ -25,18 +32,39 @@ router = APIRouter()
     tags=[Tag.Profiles],
 )
 @inject
-async def get_profile_by_username(
+async def get_profile_by_username(  # noqa: PLR0913
     username: Username,
     optional_user: OptionalCurrentUser,
+    response: Response,
+    if_none_match: IfNoneMatch = None,
+    get_profile_version: GetProfileVersionUseCase = Depends(  # noqa: FAST002
+        Provide[Container.get_profile_version_use_case],
+    ),
     get_profile_by_name: GetProfileByNameUseCase = Depends(  # noqa: FAST002
         Provide[Container.get_profile_by_name_use_case],
     ),
-) -> ProfileDetailsApiResponse:
-    profile_details = await get_profile_by_name(username, optional_user)
-    if profile_details is None:
+) -> Union[ProfileDetailsApiResponse, Response]:
+    viewer_id = optional_user.id if optional_user else None
+
+    # A 304 needs only the version, a full response reads it with the profile.
+    if if_none_match is not None:
+        version = await get_profile_version(username, optional_user)
+        if version is not None:
+            etag = compute_etag("profile", username, version, viewer_id)
+            if is_not_modified(if_none_match, etag):
+                return not_modified(etag)
+
+    versioned_profile = await get_profile_by_name(username, optional_user)
+    if versioned_profile is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Profile not found",
         )
 
-    return ProfileDetailsApiResponse.from_profile(profile_details)
+    response.headers["ETag"] = compute_etag(
+        "profile",
+        username,
+        versioned_profile.version,
+        viewer_id,
+    )
+    return ProfileDetailsApiResponse.from_profile(versioned_profile.profile)
@@ -1,12 +1,41 @@
-from pydantic import BaseModel
+import functools
+from typing import Optional
+
+from pydantic import BaseModel, Field
 from typing_extensions import Self
 
+from conduit.application.tags.services.tags_cache import TagsList
 from conduit.domain.tags.tag import Tag
 
 
+class ListTagsParameters(BaseModel):
+    popular: Optional[int] = Field(
+        default=None,
+        description="Only the given number of tags of the most articles.",
+        ge=1,
+        le=100,
+    )
+
+
+class SuggestTagsParameters(BaseModel):
+    prefix: str = Field(
+        description="Start of the tag names, in any case.",
+        min_length=1,
+        max_length=100,
+    )
+    limit: int = Field(default=10, ge=1, le=50)
+
+
 class ListTagsApiResponse(BaseModel):
     tags: list[str]
 
     @classmethod
     def from_tags(cls, tags: list[Tag]) -> Self:
         return cls(tags=[tag.name for tag in tags])
+
+
+@functools.lru_cache(maxsize=1)
+def serialize_tags_list(tags_list: TagsList) -> bytes:
+    """Serializes the response body, once for as long as the tags are cached."""
+
+    return ListTagsApiResponse.from_tags(tags_list.tags).model_dump_json().encode()
@@ -1,22 +1,61 @@
+from typing import Annotated, Union
+
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
 
-from conduit.api.endpoints.tags.contract import ListTagsApiResponse
+from conduit.api.endpoints.tags.contract import (
+    ListTagsApiResponse,
+    ListTagsParameters,
+    serialize_tags_list,
+)
+from conduit.api.etag import IfNoneMatch, compute_etag, is_not_modified, not_modified
+from conduit.application.tags.use_cases.list_popular_tags.use_case import (
+    ListPopularTagsUseCase,
+)
 from conduit.application.tags.use_cases.list_tags.use_case import ListTagsUseCase
 from conduit.containers import Container
 from conduit.shared.api.openapi.tags import Tag
+from conduit.shared.api.openapi.validation_error import validation_error
 
 router = APIRouter()
 
 
 @router.get(
     path="/tags",
-    summary="List all tags",
+    response_model=ListTagsApiResponse,
+    responses={
+        **validation_error(),
+    },
+    summary="List all tags, or the most popular ones",
     tags=[Tag.Tags],
 )
 @inject
 async def get_all_tags(
+    response: Response,
+    parameters: Annotated[ListTagsParameters, Query()],
+    if_none_match: IfNoneMatch = None,
     list_tags: ListTagsUseCase = Depends(Provide[Container.list_tags_use_case]),  # noqa: FAST002
-) -> ListTagsApiResponse:
-    tags = await list_tags()
-    return ListTagsApiResponse.from_tags(tags)
+    list_popular_tags: ListPopularTagsUseCase = Depends(  # noqa: FAST002
+        Provide[Container.list_popular_tags_use_case],
+    ),
+) -> Union[ListTagsApiResponse, Response]:
+    if parameters.popular is not None:
+        tags = await list_popular_tags(parameters.popular)
+        # Usage counts change with every article, the tags are the version.
+        etag = compute_etag("popular_tags", [tag.name for tag in tags])
+        if is_not_modified(if_none_match, etag):
+            return not_modified(etag)
+
+        response.headers["ETag"] = etag
+        return ListTagsApiResponse.from_tags(tags)
+
+    tags_list = await list_tags()
+    etag = compute_etag("tags", tags_list.version)
+    if is_not_modified(if_none_match, etag):
+        return not_modified(etag)
+
+    return Response(
+        content=serialize_tags_list(tags_list),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
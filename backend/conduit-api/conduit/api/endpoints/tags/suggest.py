@@ -0,0 +1,34 @@
+from typing import Annotated
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Query
+
+from conduit.api.endpoints.tags.contract import (
+    ListTagsApiResponse,
+    SuggestTagsParameters,
+)
+from conduit.application.tags.use_cases.suggest_tags.use_case import (
+    SuggestTagsUseCase,
+)
+from conduit.containers import Container
+from conduit.shared.api.openapi.tags import Tag
+from conduit.shared.api.openapi.validation_error import validation_error
+
+router = APIRouter()
+
+
+@router.get(
+    path="/tags/suggest",
+    responses={
+        **validation_error(),
+    },
+    summary="Suggest tags starting with a prefix, the most used first",
+    tags=[Tag.Tags],
+)
+@inject
+async def suggest_tags(
+    parameters: Annotated[SuggestTagsParameters, Query()],
+    suggest: SuggestTagsUseCase = Depends(Provide[Container.suggest_tags_use_case]),  # noqa: FAST002
+) -> ListTagsApiResponse:
+    tags = await suggest(parameters.prefix, parameters.limit)
+    return ListTagsApiResponse.from_tags(tags)
@@ -0,0 +1,32 @@
+import hashlib
+from typing import Annotated, Optional
+
+from fastapi import Header, Response, status
+from typing_extensions import TypeAlias
+
+IfNoneMatch: TypeAlias = Annotated[
+    Optional[str],
+    Header(description="ETag of a cached response, to get 304 if it is current."),
+]
+
+
+def compute_etag(*parts: object) -> str:
+    """Computes a strong ETag of a response from everything it depends on."""
+
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def is_not_modified(if_none_match: Optional[str], etag: str) -> bool:
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # `If-None-Match` uses the weak comparison, so weak tags match too.
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,27 @@
+import base64
+import binascii
+import datetime
+
+from conduit.application.common.paging import Cursor
+
+_SEPARATOR = "|"
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    raw_cursor = f"{cursor.created_at.isoformat()}{_SEPARATOR}{cursor.id}"
+    encoded_cursor = base64.urlsafe_b64encode(raw_cursor.encode())
+    return encoded_cursor.decode().rstrip("=")
+
+
+def decode_cursor(value: str) -> Cursor:
+    padding = "=" * (-len(value) % 4)
+    try:
+        raw_cursor = base64.urlsafe_b64decode(value + padding).decode()
+        created_at, item_id = raw_cursor.split(_SEPARATOR)
+        return Cursor(
+            created_at=datetime.datetime.fromisoformat(created_at),
+            id=int(item_id),
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError) as ex:
+        msg = "Invalid cursor"
+        raise ValueError(msg) from ex
@@ -1,4 +1,7 @@
+import asyncio
 import contextlib
+import json
+import pathlib
 from collections.abc import AsyncIterator
 from typing import cast
 
@@ -23,9 +26,31 @@ async def app_lifespan(app: FastAPI) -> AsyncIterator[None]:
     if not await database.database_exists():
         await database.create_database(ModelBase)
         await db_seeder.seed_database()
+    elif await container.db_schema_upgrader().upgrade_schema():
+        # Added columns and tables start empty, their data is derived.
+        await container.db_repairer().repair_database()
+    await container.tag_ids_cache().warm_up()
+    await container.tag_suggestions_index().warm_up()
+
+    favorites_buffer = container.favorites_buffer()
+    background_tasks = [
+        asyncio.create_task(favorites_buffer.run()),
+        asyncio.create_task(container.db_maintainer().run()),
+    ]
     yield
+    for task in background_tasks:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await favorites_buffer.flush()
     await database.dispose()
 
+    metrics_dump_path = container.app_settings().metrics_dump_path
+    if metrics_dump_path:
+        pathlib.Path(metrics_dump_path).write_text(
+            json.dumps(container.metrics().snapshot(), indent=2),
+        )
+
 
 def create_app(container: Container) -> FastAPI:
     """Creates the FastAPI application."""
@@ -0,0 +1,77 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, final
+
+from conduit.application.common.paging import Cursor
+from conduit.application.common.repositories.articles import ArticlesPage, ListFilters
+from conduit.application.common.versioned_cache import VersionedCache
+from conduit.shared.application.unit_of_work import UnitOfWork
+
+
+@final
+@dataclass(frozen=True)
+class ArticlesPageKey:
+    filters: ListFilters
+    limit: int
+    offset: int
+    cursor: Optional[Cursor]
+
+
+@final
+class ArticlesListCache:
+    """In-process cache of article list pages that do not depend on the viewer.
+
+    Invalidation only bumps the version, every page cached under an older
+    version is treated as a miss and replaced on the next read.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        ttl_seconds: float,
+        max_size: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._pages: VersionedCache[ArticlesPageKey, ArticlesPage] = VersionedCache(
+            enabled=enabled,
+            ttl_seconds=ttl_seconds,
+            max_size=max_size,
+            clock=clock,
+        )
+
+    @property
+    def version(self) -> int:
+        """Version to pass to `put` when reading a page to cache.
+
+        It has to be taken before the page is read, so a page read before
+        an invalidation can never be cached as current.
+        """
+
+        return self._pages.version
+
+    @property
+    def hits(self) -> int:
+        return self._pages.hits
+
+    @property
+    def misses(self) -> int:
+        return self._pages.misses
+
+    def get(self, key: ArticlesPageKey) -> Optional[ArticlesPage]:
+        return self._pages.get(key)
+
+    def put(self, key: ArticlesPageKey, page: ArticlesPage, version: int) -> None:
+        self._pages.put(key, page, version)
+
+    def invalidate(self) -> None:
+        self._pages.invalidate()
+
+    def invalidate_after_commit(self) -> None:
+        """Invalidates cached pages once the current unit of work is committed.
+
+        Invalidating earlier would let a concurrent read cache the rows
+        that are about to change.
+        """
+
+        UnitOfWork.get_current_context().add_commit_hook(self.invalidate)
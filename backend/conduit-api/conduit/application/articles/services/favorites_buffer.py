@@ -0,0 +1,189 @@
+import asyncio
+import contextlib
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from typing import Final, Optional, final
+
+from conduit.application.articles.services.articles_list_cache import (
+    ArticlesListCache,
+)
+from conduit.application.common.repositories.favorites import (
+    FavoriteChange,
+    FavoritesRepository,
+)
+from conduit.domain.articles.articles import ArticleID
+from conduit.domain.users.user import UserID
+from conduit.shared.application.unit_of_work import UnitOfWorkFactory
+
+DEFAULT_LOGGER: Final = logging.getLogger(__name__)
+
+
+@final
+@dataclass(frozen=True)
+class _PendingFavorite:
+    # Whether the favorite was stored when it was first buffered.
+    stored: bool
+    favorited: bool
+
+
+@final
+class FavoritesBuffer:
+    """Queues favorites and unfavorites in memory and writes them in batches.
+
+    Only the last request of a user for an article is kept, so a favorite
+    followed by an unfavorite is never written at all. A batch is written
+    every `flush_interval_seconds`, or as soon as `max_pending` favorites
+    are waiting, which bounds what is lost if the process dies.
+
+    Favorites that fail to be written stay buffered, up to `max_size` of
+    them. A full buffer rejects new favorites, which the caller then has
+    to write right away.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        uow_factory: UnitOfWorkFactory,
+        favorites_repository: FavoritesRepository,
+        articles_list_cache: ArticlesListCache,
+        enabled: bool,
+        flush_interval_seconds: float,
+        max_pending: int,
+        max_size: int,
+        logger: logging.Logger = DEFAULT_LOGGER,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._favorites_repository = favorites_repository
+        self._articles_list_cache = articles_list_cache
+        self._enabled = enabled
+        self._flush_interval_seconds = flush_interval_seconds
+        self._max_pending = max_pending
+        self._max_size = max_size
+        self._logger = logger
+        self._pending: dict[tuple[ArticleID, UserID], _PendingFavorite] = {}
+        self._favorites_count_deltas: Counter[ArticleID] = Counter()
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._full = False
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def favorited(self, article_id: ArticleID, user_id: UserID) -> Optional[bool]:
+        """Returns the buffered state, `None` if nothing is buffered."""
+
+        pending = self._pending.get((article_id, user_id))
+        return pending.favorited if pending else None
+
+    def favorites_count_delta(self, article_id: ArticleID) -> int:
+        """Returns what the buffered favorites add to the stored count."""
+
+        return self._favorites_count_deltas[article_id]
+
+    def put(
+        self,
+        article_id: ArticleID,
+        user_id: UserID,
+        *,
+        stored: bool,
+        favorited: bool,
+    ) -> bool:
+        """Buffers the favorite, returns `False` if the buffer is full.
+
+        A full buffer still accepts changes of the favorites it holds.
+        """
+
+        key = (article_id, user_id)
+        pending = self._pending.get(key)
+        if pending is not None:
+            stored = pending.stored
+        elif stored == favorited:
+            return True
+        elif len(self._pending) >= self._max_size:
+            if not self._full:
+                self._full = True
+                self._logger.warning(
+                    "Favorites buffer is full with %d favorites, "
+                    "writing new favorites right away",
+                    len(self._pending),
+                )
+            return False
+        self._set(key, _PendingFavorite(stored=stored, favorited=favorited))
+
+        if len(self._pending) >= self._max_pending and self._flush_requested:
+            self._flush_requested.set()
+        return True
+
+    async def flush(self) -> None:
+        """Writes the buffered favorites in a single transaction."""
+
+        flushed = dict(self._pending)
+        changes = [
+            FavoriteChange(
+                article_id=article_id,
+                user_id=user_id,
+                favorited=pending.favorited,
+            )
+            for (article_id, user_id), pending in flushed.items()
+            if pending.favorited != pending.stored
+        ]
+        if changes:
+            async with self._uow_factory():
+                await self._favorites_repository.apply_changes(changes)
+                self._articles_list_cache.invalidate_after_commit()
+
+        # Favorites changed again while the batch was written stay buffered.
+        for key, pending in flushed.items():
+            current = self._pending.get(key)
+            if current is pending:
+                self._set(key, None)
+            elif current is not None:
+                self._set(
+                    key,
+                    _PendingFavorite(
+                        stored=pending.favorited,
+                        favorited=current.favorited,
+                    ),
+                )
+        self._full = len(self._pending) >= self._max_size
+
+    async def run(self) -> None:
+        """Flushes the buffer periodically until cancelled."""
+
+        if not self._enabled:
+            return
+
+        self._flush_requested = asyncio.Event()
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    self._flush_requested.wait(),
+                    timeout=self._flush_interval_seconds,
+                )
+            self._flush_requested.clear()
+
+            try:
+                await self.flush()
+            except Exception:
+                # Failed favorites stay buffered and are retried next time.
+                self._logger.exception("Error flushing favorites")
+
+    def _set(
+        self,
+        key: tuple[ArticleID, UserID],
+        pending: Optional[_PendingFavorite],
+    ) -> None:
+        article_id, _ = key
+        previous = self._pending.pop(key, None)
+        if previous is not None:
+            self._favorites_count_deltas[article_id] -= _count_delta(previous)
+        if pending is not None:
+            self._pending[key] = pending
+            self._favorites_count_deltas[article_id] += _count_delta(pending)
+        if not self._favorites_count_deltas[article_id]:
+            self._favorites_count_deltas.pop(article_id, None)
+
+
+def _count_delta(pending: _PendingFavorite) -> int:
+    return int(pending.favorited) - int(pending.stored)
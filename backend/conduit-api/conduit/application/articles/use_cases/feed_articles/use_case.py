@@ -1,7 +1,9 @@
 from dataclasses import dataclass
-from typing import final
+from typing import Optional, final
 
+from conduit.application.common.paging import Cursor, page_read_limit, split_page
 from conduit.application.common.repositories.articles import ArticlesRepository
+from conduit.application.common.services.articles_service import ArticlesService
 from conduit.domain.articles.articles import BodylessArticleWithAuthor
 from conduit.domain.users.user import User
 from conduit.shared.application.unit_of_work import UnitOfWorkFactory
@@ -13,6 +15,7 @@ class FeedArticlesRequest:
     user: User
     limit: int
     offset: int
+    cursor: Optional[Cursor]
 
 
 @final
@@ -20,6 +23,7 @@ class FeedArticlesRequest:
 class FeedArticlesResponse:
     articles: list[BodylessArticleWithAuthor]
     articles_count: int
+    next_cursor: Optional[Cursor]
 
 
 @final
@@ -28,22 +32,32 @@ class FeedArticlesUseCase:
         self,
         uow_factory: UnitOfWorkFactory,
         articles_repository: ArticlesRepository,
+        articles_service: ArticlesService,
     ) -> None:
         self._uof_factory = uow_factory
         self._articles_repository = articles_repository
+        self._articles_service = articles_service
 
     async def __call__(self, feed_request: FeedArticlesRequest) -> FeedArticlesResponse:
         async with self._uof_factory():
-            articles = await self._articles_repository.list_by_followings(
+            articles_page = await self._articles_repository.list_by_followings(
                 user_id=feed_request.user.id,
-                limit=feed_request.limit,
+                limit=page_read_limit(feed_request.limit),
                 offset=feed_request.offset,
+                cursor=feed_request.cursor,
             )
-            articles_count = await self._articles_repository.count_by_followings(
-                feed_request.user.id,
+            page, cursor = split_page(
+                articles_page.articles,
+                feed_request.limit,
+                articles_page.read_count,
+            )
+            articles = await self._articles_service.personalize_articles(
+                page,
+                feed_request.user,
             )
 
         return FeedArticlesResponse(
             articles=articles,
-            articles_count=articles_count,
+            articles_count=articles_page.articles_count,
+            next_cursor=cursor,
         )
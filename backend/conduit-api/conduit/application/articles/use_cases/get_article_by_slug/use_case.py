@@ -1,7 +1,7 @@
 from typing import Optional
 
+from conduit.application.common.repositories.articles import VersionedArticle
 from conduit.application.common.services.articles_service import ArticlesService
-from conduit.domain.articles.articles import ArticleWithAuthor
 from conduit.domain.users.user import User
 from conduit.shared.application.unit_of_work import UnitOfWorkFactory
 
@@ -19,6 +19,9 @@ class GetArticleBySlugUseCase:
         self,
         slug: str,
         current_user: Optional[User],
-    ) -> Optional[ArticleWithAuthor]:
+    ) -> Optional[VersionedArticle]:
         async with self._uow_factory():
-            return await self._articles_service.get_article_by_slug(slug, current_user)
+            return await self._articles_service.get_versioned_article_by_slug(
+                slug,
+                current_user,
+            )
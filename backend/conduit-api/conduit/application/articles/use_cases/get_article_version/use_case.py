@@ -0,0 +1,28 @@
+from typing import Optional, final
+
+from conduit.application.common.repositories.articles import ArticleVersion
+from conduit.application.common.services.articles_service import ArticlesService
+from conduit.domain.users.user import User
+from conduit.shared.application.unit_of_work import UnitOfWorkFactory
+
+
+@final
+class GetArticleVersionUseCase:
+    def __init__(
+        self,
+        uow_factory: UnitOfWorkFactory,
+        articles_service: ArticlesService,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._articles_service = articles_service
+
+    async def __call__(
+        self,
+        slug: str,
+        current_user: Optional[User],
+    ) -> Optional[ArticleVersion]:
+        async with self._uow_factory():
+            return await self._articles_service.get_article_version(
+                slug,
+                current_user,
+            )
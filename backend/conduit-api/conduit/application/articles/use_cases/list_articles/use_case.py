@@ -1,10 +1,17 @@
 from dataclasses import dataclass
 from typing import Optional, final
 
+from conduit.application.articles.services.articles_list_cache import (
+    ArticlesListCache,
+    ArticlesPageKey,
+)
+from conduit.application.common.paging import Cursor, page_read_limit, split_page
 from conduit.application.common.repositories.articles import (
+    ArticlesPage,
     ArticlesRepository,
     ListFilters,
 )
+from conduit.application.common.services.articles_service import ArticlesService
 from conduit.domain.articles.articles import BodylessArticleWithAuthor
 from conduit.domain.users.user import User
 from conduit.shared.application.unit_of_work import UnitOfWorkFactory
@@ -19,6 +26,7 @@ class ListArticlesRequest:
     author: Optional[str]
     favorited: Optional[str]
     user: Optional[User]
+    cursor: Optional[Cursor]
 
 
 @final
@@ -26,6 +34,7 @@ class ListArticlesRequest:
 class ListArticlesResponse:
     articles: list[BodylessArticleWithAuthor]
     articles_count: int
+    next_cursor: Optional[Cursor]
 
 
 @final
@@ -34,36 +43,58 @@ class ListArticlesUseCase:
         self,
         uow_factory: UnitOfWorkFactory,
         articles_repository: ArticlesRepository,
+        articles_service: ArticlesService,
+        articles_list_cache: ArticlesListCache,
     ) -> None:
         self._uow_factory = uow_factory
         self._articles_repository = articles_repository
+        self._articles_service = articles_service
+        self._articles_list_cache = articles_list_cache
 
     async def __call__(
         self,
         list_articles_request: ListArticlesRequest,
     ) -> ListArticlesResponse:
-        user = list_articles_request.user
-        user_id = user.id if user else None
-
-        async with self._uow_factory():
-            filters = ListFilters(
+        page_key = ArticlesPageKey(
+            filters=ListFilters(
                 tag=list_articles_request.tag,
                 author=list_articles_request.author,
                 favorited=list_articles_request.favorited,
+            ),
+            limit=list_articles_request.limit,
+            offset=list_articles_request.offset,
+            cursor=list_articles_request.cursor,
+        )
+
+        async with self._uow_factory():
+            articles_page = await self._get_articles_page(page_key)
+            page, cursor = split_page(
+                articles_page.articles,
+                list_articles_request.limit,
+                articles_page.read_count,
             )
-            articles = await self._articles_repository.list_by_filters(
-                user_id=user_id,
-                limit=list_articles_request.limit,
-                offset=list_articles_request.offset,
-                filters=filters,
-            )
-            articles_count = await self._articles_repository.count_by_filters(
-                tag=list_articles_request.tag,
-                author=list_articles_request.author,
-                favorited=list_articles_request.favorited,
+            articles = await self._articles_service.personalize_articles(
+                page,
+                list_articles_request.user,
             )
 
         return ListArticlesResponse(
             articles=articles,
-            articles_count=articles_count,
+            articles_count=articles_page.articles_count,
+            next_cursor=cursor,
+        )
+
+    async def _get_articles_page(self, page_key: ArticlesPageKey) -> ArticlesPage:
+        articles_page = self._articles_list_cache.get(page_key)
+        if articles_page is not None:
+            return articles_page
+
+        cache_version = self._articles_list_cache.version
+        articles_page = await self._articles_repository.list_by_filters(
+            limit=page_read_limit(page_key.limit),
+            offset=page_key.offset,
+            filters=page_key.filters,
+            cursor=page_key.cursor,
         )
+        self._articles_list_cache.put(page_key, articles_page, cache_version)
+        return articles_page
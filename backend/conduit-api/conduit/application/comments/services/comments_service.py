@@ -1,46 +1,32 @@
 from typing import Optional, final
 
+from conduit.application.articles.services.articles_list_cache import (
+    ArticlesListCache,
+)
 from conduit.application.common.errors import Errors
+from conduit.application.common.paging import Cursor
 from conduit.application.common.repositories.comments import CommentsRepository
 from conduit.application.common.services.articles_service import ArticlesService
-from conduit.application.common.services.profiles_service import ProfilesService
 from conduit.domain.comments.comments import (
-    Comment,
     CommentAuthor,
     CommentID,
     CommentWithAuthor,
     NewComment,
 )
-from conduit.domain.profiles.profile import Profile, ProfileID
 from conduit.domain.users.user import User
 
 
-def _to_comment_with_author(comment: Comment, author: Profile) -> CommentWithAuthor:
-    return CommentWithAuthor(
-        id=comment.id,
-        body=comment.body,
-        created_at=comment.created_at,
-        updated_at=comment.updated_at,
-        author=CommentAuthor(
-            username=author.username,
-            bio=author.bio,
-            image=author.image,
-            following=author.following,
-        ),
-    )
-
-
 @final
 class CommentsService:
     def __init__(
         self,
         comments_repository: CommentsRepository,
         articles_service: ArticlesService,
-        profiles_service: ProfilesService,
+        articles_list_cache: ArticlesListCache,
     ) -> None:
         self._comments_repository = comments_repository
         self._articles_service = articles_service
-        self._profiles_service = profiles_service
+        self._articles_list_cache = articles_list_cache
 
     async def add_comment_to_article(
         self,
@@ -48,17 +34,19 @@ class CommentsService:
         comment_body: str,
         current_user: User,
     ) -> Optional[CommentWithAuthor]:
-        article = await self._articles_service.get_article_by_slug(slug, current_user)
-        if article is None:
+        article_ref = await self._articles_service.get_article_ref_by_slug(slug)
+        if article_ref is None:
             return None
 
         comment = await self._comments_repository.add(
             NewComment(
-                article_id=article.id,
+                article_id=article_ref.id,
                 author_id=current_user.id,
                 body=comment_body,
             ),
         )
+        # Listed articles show their comments count.
+        self._articles_list_cache.invalidate_after_commit()
 
         author = current_user
         return CommentWithAuthor(
@@ -77,22 +65,20 @@ class CommentsService:
     async def list_article_comments(
         self,
         slug: str,
+        limit: int,
+        cursor: Optional[Cursor],
         current_user: Optional[User],
     ) -> Optional[list[CommentWithAuthor]]:
-        article = await self._articles_service.get_article_by_slug(slug, current_user)
-        if article is None:
+        article_ref = await self._articles_service.get_article_ref_by_slug(slug)
+        if article_ref is None:
             return None
 
-        raw_comments = await self._comments_repository.list_by_article_id(article.id)
-        profiles_map = await self._get_profiles_map(raw_comments, current_user)
-
-        return [
-            _to_comment_with_author(
-                comment,
-                profiles_map[comment.author_id],
-            )
-            for comment in raw_comments
-        ]
+        return await self._comments_repository.list_with_authors_by_article_id(
+            article_ref.id,
+            limit=limit,
+            cursor=cursor,
+            viewer_id=current_user.id if current_user else None,
+        )
 
     async def delete_comment(
         self,
@@ -100,8 +86,8 @@ class CommentsService:
         comment_id: CommentID,
         current_user: User,
     ) -> bool:
-        article = await self._articles_service.get_article_by_slug(slug, current_user)
-        if article is None:
+        article_ref = await self._articles_service.get_article_ref_by_slug(slug)
+        if article_ref is None:
             return False
 
         comment = await self._comments_repository.get(comment_id)
@@ -109,14 +95,6 @@ class CommentsService:
             raise Errors.comment_ownership()
 
         await self._comments_repository.delete(comment_id)
+        self._articles_list_cache.invalidate_after_commit()
 
         return True
-
-    async def _get_profiles_map(
-        self,
-        comments: list[Comment],
-        current_user: Optional[User],
-    ) -> dict[ProfileID, Profile]:
-        user_ids = [comment.author_id for comment in comments]
-        profiles = await self._profiles_service.list_by_user_ids(user_ids, current_user)
-        return {profile.id: profile for profile in profiles}
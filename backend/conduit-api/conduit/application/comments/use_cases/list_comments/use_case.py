@@ -1,11 +1,29 @@
+from dataclasses import dataclass
 from typing import Optional, final
 
 from conduit.application.comments.services.comments_service import CommentsService
+from conduit.application.common.paging import Cursor, page_read_limit, split_page
 from conduit.domain.comments.comments import CommentWithAuthor
 from conduit.domain.users.user import User
 from conduit.shared.application.unit_of_work import UnitOfWorkFactory
 
 
+@final
+@dataclass(frozen=True)
+class ListArticleCommentsRequest:
+    slug: str
+    limit: int
+    cursor: Optional[Cursor]
+    user: Optional[User]
+
+
+@final
+@dataclass(frozen=True)
+class ListArticleCommentsResponse:
+    comments: list[CommentWithAuthor]
+    next_cursor: Optional[Cursor]
+
+
 @final
 class ListArticleCommentsUseCase:
     def __init__(
@@ -18,11 +36,18 @@ class ListArticleCommentsUseCase:
 
     async def __call__(
         self,
-        slug: str,
-        current_user: Optional[User],
-    ) -> Optional[list[CommentWithAuthor]]:
+        list_comments_request: ListArticleCommentsRequest,
+    ) -> Optional[ListArticleCommentsResponse]:
         async with self._uow_factory():
-            return await self._comments_service.list_article_comments(
-                slug,
-                current_user,
+            comments = await self._comments_service.list_article_comments(
+                list_comments_request.slug,
+                limit=page_read_limit(list_comments_request.limit),
+                cursor=list_comments_request.cursor,
+                current_user=list_comments_request.user,
             )
+
+        if comments is None:
+            return None
+
+        page, cursor = split_page(comments, list_comments_request.limit)
+        return ListArticleCommentsResponse(comments=page, next_cursor=cursor)
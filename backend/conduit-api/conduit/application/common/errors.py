@@ -21,18 +21,6 @@ class ArticleOwningError(ApplicationError):
         super().__init__("Can't manipulate an article the user doesn't own", *args)
 
 
-@final
-class ArticleIsAlreadyFavoritedError(ApplicationError):
-    def __init__(self, *args: object) -> None:
-        super().__init__("Article is already favorited", *args)
-
-
-@final
-class ArticleIsAlreadyUnfavoritedError(ApplicationError):
-    def __init__(self, *args: object) -> None:
-        super().__init__("Article is already unfavorited", *args)
-
-
 @final
 class ProfileNotFoundError(ApplicationError):
     def __init__(self, *args: object) -> None:
@@ -82,14 +70,6 @@ class Errors:
     def article_owning_error() -> ArticleOwningError:
         return ArticleOwningError()
 
-    @staticmethod
-    def article_is_already_favorited() -> ArticleIsAlreadyFavoritedError:
-        return ArticleIsAlreadyFavoritedError()
-
-    @staticmethod
-    def article_is_already_unfavorited() -> ArticleIsAlreadyUnfavoritedError:
-        return ArticleIsAlreadyUnfavoritedError()
-
     @staticmethod
     def profile_not_found() -> ProfileNotFoundError:
         return ProfileNotFoundError()
@@ -0,0 +1,54 @@
+import datetime
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Optional, Protocol, TypeVar, final
+
+
+@final
+@dataclass(frozen=True)
+class Cursor:
+    """Keyset position of the last item of a page ordered by `(created_at, id)`."""
+
+    created_at: datetime.datetime
+    id: int
+
+
+class _Pageable(Protocol):
+    @property
+    def id(self) -> int: ...
+
+    @property
+    def created_at(self) -> datetime.datetime: ...
+
+
+_T = TypeVar("_T", bound=_Pageable)
+
+
+def page_read_limit(limit: int) -> int:
+    """Returns how many items to read for a page of `limit` items.
+
+    The one extra item only tells whether there is a next page.
+    """
+
+    return limit + 1
+
+
+def split_page(
+    items: Sequence[_T],
+    limit: int,
+    read_count: Optional[int] = None,
+) -> tuple[list[_T], Optional[Cursor]]:
+    """Returns the page and the cursor of the next one, `None` on the last page.
+
+    `read_count` is the number of items read, when some of them were dropped
+    since. Whether there is a next page is decided from what was read.
+    """
+
+    if read_count is None:
+        read_count = len(items)
+    page = list(items[:limit])
+    if read_count <= limit or not page:
+        return page, None
+
+    last_item = page[-1]
+    return page, Cursor(created_at=last_item.created_at, id=last_item.id)
@@ -1,10 +1,14 @@
 import abc
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional, final
 
+from conduit.application.common.paging import Cursor
 from conduit.domain.articles.articles import (
     Article,
     ArticleID,
+    ArticleRef,
+    ArticleWithAuthor,
     AuthorID,
     BodylessArticleWithAuthor,
     NewArticleDetailsWithSlug,
@@ -21,9 +25,67 @@ class ListFilters:
     favorited: Optional[str]
 
 
+@final
+@dataclass(frozen=True)
+class ArticlesPage:
+    """Page of articles listed without the flags of any particular viewer.
+
+    `read_count` is the number of articles the page was read with. Articles
+    deleted before they were hydrated are missing from `articles`.
+    """
+
+    articles: list[BodylessArticleWithAuthor]
+    articles_count: int
+    read_count: int
+
+
+@final
+@dataclass(frozen=True)
+class ArticleVersion:
+    """Everything a rendered article depends on, except data that never changes."""
+
+    id: ArticleID
+    updated_at: datetime
+    favorites_count: int
+    comments_count: int
+    author_updated_at: Optional[datetime]
+    favorited: bool
+    following: bool
+
+
+@final
+@dataclass(frozen=True)
+class VersionedArticle:
+    """Article read in the same statement as the version it is served with."""
+
+    article: ArticleWithAuthor
+    version: ArticleVersion
+
+
 class ArticlesRepository(abc.ABC):
     @abc.abstractmethod
-    async def get_by_slug_or_none(self, slug: str) -> Optional[Article]: ...
+    async def get_ref_by_slug(self, slug: str) -> Optional[ArticleRef]: ...
+
+    @abc.abstractmethod
+    async def get_version_by_slug(
+        self,
+        slug: str,
+        viewer_id: Optional[UserID],
+    ) -> Optional[ArticleVersion]: ...
+
+    @abc.abstractmethod
+    async def get_with_author_by_slug(
+        self,
+        slug: str,
+        viewer_id: Optional[UserID],
+    ) -> Optional[ArticleWithAuthor]: ...
+
+    @abc.abstractmethod
+    async def get_versioned_by_slug(
+        self,
+        slug: str,
+        viewer_id: Optional[UserID],
+    ) -> Optional[VersionedArticle]: ...
 
     @abc.abstractmethod
     async def add(
@@ -32,33 +94,31 @@ class ArticlesRepository(abc.ABC):
         article_details: NewArticleDetailsWithSlug,
     ) -> Article: ...
 
+    @abc.abstractmethod
+    async def add_many(
+        self,
+        author_id: AuthorID,
+        articles_details: list[NewArticleDetailsWithSlug],
+    ) -> list[Article]:
+        """Adds the articles in one statement, returned in the given order."""
+
     @abc.abstractmethod
     async def list_by_followings(
         self,
         user_id: UserID,
         limit: int,
         offset: int,
-    ) -> list[BodylessArticleWithAuthor]: ...
-
-    @abc.abstractmethod
-    async def count_by_followings(self, user_id: UserID) -> int: ...
+        cursor: Optional[Cursor],
+    ) -> ArticlesPage: ...
 
     @abc.abstractmethod
     async def list_by_filters(
         self,
-        user_id: Optional[UserID],
         limit: int,
         offset: int,
         filters: ListFilters,
-    ) -> list[BodylessArticleWithAuthor]: ...
-
-    @abc.abstractmethod
-    async def count_by_filters(
-        self,
-        tag: Optional[str],
-        author: Optional[str],
-        favorited: Optional[str],
-    ) -> int: ...
+        cursor: Optional[Cursor],
+    ) -> ArticlesPage: ...
 
     @abc.abstractmethod
     async def delete_by_id(self, article_id: ArticleID) -> None: ...
@@ -68,4 +128,5 @@ class ArticlesRepository(abc.ABC):
         self,
         slug: str,
         update_fields: UpdateArticleFields,
-    ) -> Article: ...
+    ) -> str:
+        """Returns the slug of the article, which changes with its title."""
@@ -1,7 +1,15 @@
 import abc
+from typing import Optional
 
+from conduit.application.common.paging import Cursor
 from conduit.domain.articles.articles import ArticleID
-from conduit.domain.comments.comments import Comment, CommentID, NewComment
+from conduit.domain.comments.comments import (
+    Comment,
+    CommentID,
+    CommentWithAuthor,
+    NewComment,
+)
+from conduit.domain.users.user import UserID
 
 
 class CommentsRepository(abc.ABC):
@@ -15,4 +23,11 @@ class CommentsRepository(abc.ABC):
     async def add(self, new_comment: NewComment) -> Comment: ...
 
     @abc.abstractmethod
-    async def list_by_article_id(self, article_id: ArticleID) -> list[Comment]: ...
+    async def list_with_authors_by_article_id(
+        self,
+        article_id: ArticleID,
+        limit: int,
+        cursor: Optional[Cursor],
+        viewer_id: Optional[UserID],
+    ) -> list[CommentWithAuthor]:
+        """Lists one page of comments with their authors, the newest first."""
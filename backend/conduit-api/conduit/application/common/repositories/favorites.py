@@ -1,18 +1,39 @@
 import abc
+from dataclasses import dataclass
+from typing import Optional, final
 
 from conduit.domain.articles.articles import ArticleID
 from conduit.domain.users.user import UserID
 
 
+@final
+@dataclass(frozen=True)
+class FavoriteChange:
+    article_id: ArticleID
+    user_id: UserID
+    favorited: bool
+
+
 class FavoritesRepository(abc.ABC):
     @abc.abstractmethod
-    async def add(self, article_id: ArticleID, user_id: UserID) -> None: ...
+    async def add(self, article_id: ArticleID, user_id: UserID) -> Optional[int]:
+        """Returns the new favorites count, `None` if it was already favorited."""
 
     @abc.abstractmethod
-    async def delete(self, article_id: ArticleID, user_id: UserID) -> None: ...
+    async def delete(self, article_id: ArticleID, user_id: UserID) -> Optional[int]:
+        """Returns the new favorites count, `None` if it was not favorited."""
 
     @abc.abstractmethod
-    async def exists(self, article_id: ArticleID, user_id: UserID) -> bool: ...
+    async def apply_changes(self, changes: list[FavoriteChange]) -> None:
+        """Adds and deletes favorites and updates the counts of their articles.
+
+        Changes that are already in effect and changes to articles that no
+        longer exist are skipped.
+        """
 
     @abc.abstractmethod
-    async def count(self, article_id: ArticleID) -> int: ...
+    async def list_favorited(
+        self,
+        user_id: UserID,
+        article_ids: list[ArticleID],
+    ) -> list[ArticleID]: ...
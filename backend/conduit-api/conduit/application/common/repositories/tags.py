@@ -8,8 +8,29 @@ class TagsRepository(abc.ABC):
     @abc.abstractmethod
     async def get_all_tags(self) -> list[Tag]: ...
 
+    @abc.abstractmethod
+    async def list_popular(self, limit: int) -> list[Tag]:
+        """Returns the tags of the most articles first."""
+
+    @abc.abstractmethod
+    async def suggest(self, prefix: str, limit: int) -> list[Tag]:
+        """Returns the tags starting with the prefix in any case, the most used first."""
+
+    @abc.abstractmethod
+    async def get_version(self) -> int:
+        """Changes whenever a tag is added, tags are never removed."""
+
     @abc.abstractmethod
     async def add_many(self, article_id: ArticleID, tags: list[str]) -> list[Tag]: ...
 
+    @abc.abstractmethod
+    async def add_to_articles(
+        self,
+        tags_by_article_id: dict[ArticleID, list[str]],
+    ) -> None: ...
+
     @abc.abstractmethod
     async def list_by_article_id(self, article_id: ArticleID) -> list[Tag]: ...
+
+    @abc.abstractmethod
+    async def delete_by_article_id(self, article_id: ArticleID) -> None: ...
@@ -0,0 +1,18 @@
+import abc
+
+from conduit.domain.articles.articles import Article, ArticleID
+from conduit.domain.users.user import UserID
+
+
+class TimelineRepository(abc.ABC):
+    @abc.abstractmethod
+    async def fan_out(self, article: Article) -> None: ...
+
+    @abc.abstractmethod
+    async def backfill(self, follower_id: UserID, following_id: UserID) -> None: ...
+
+    @abc.abstractmethod
+    async def prune(self, follower_id: UserID, following_id: UserID) -> None: ...
+
+    @abc.abstractmethod
+    async def delete_by_article_id(self, article_id: ArticleID) -> None: ...
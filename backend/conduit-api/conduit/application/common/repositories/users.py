@@ -1,13 +1,36 @@
 import abc
 import uuid
-from typing import Optional
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, final
 
+from conduit.domain.profiles.profile import Profile
 from conduit.domain.users.user import (
     User,
     UserID,
 )
 
 
+@final
+@dataclass(frozen=True)
+class ProfileVersion:
+    """Everything a rendered profile depends on."""
+
+    updated_at: Optional[datetime]
+    following: bool
+    followers_count: int
+    following_count: int
+
+
+@final
+@dataclass(frozen=True)
+class VersionedProfile:
+    """Profile read in the same statement as the version it is served with."""
+
+    profile: Profile
+    version: ProfileVersion
+
+
 class UsersRepository(abc.ABC):
     @abc.abstractmethod
     async def get_by_id_or_none(
@@ -28,4 +51,15 @@ class UsersRepository(abc.ABC):
     ) -> Optional[User]: ...
 
     @abc.abstractmethod
-    async def list_by_user_ids(self, user_ids: list[UserID]) -> list[User]: ...
+    async def get_profile_version_by_username(
+        self,
+        username: str,
+        viewer_id: Optional[UserID],
+    ) -> Optional[ProfileVersion]: ...
+
+    @abc.abstractmethod
+    async def get_versioned_profile_by_username(
+        self,
+        username: str,
+        viewer_id: Optional[UserID],
+    ) -> Optional[VersionedProfile]: ...
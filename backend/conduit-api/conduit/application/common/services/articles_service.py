@@ -1,15 +1,27 @@
-from typing import Optional, final
+import dataclasses
+from typing import Optional, TypeVar, final
 
+from conduit.application.articles.services.articles_list_cache import (
+    ArticlesListCache,
+)
+from conduit.application.articles.services.favorites_buffer import FavoritesBuffer
 from conduit.application.articles.services.slug_service import SlugService
 from conduit.application.common.errors import Errors
-from conduit.application.common.repositories.articles import ArticlesRepository
+from conduit.application.common.repositories.articles import (
+    ArticlesRepository,
+    ArticleVersion,
+    VersionedArticle,
+)
 from conduit.application.common.repositories.favorites import FavoritesRepository
 from conduit.application.common.repositories.tags import TagsRepository
+from conduit.application.common.repositories.timeline import TimelineRepository
 from conduit.application.common.services.profiles_service import ProfilesService
 from conduit.domain.articles.articles import (
     Article,
     ArticleAuthor,
+    ArticleRef,
     ArticleWithAuthor,
+    BodylessArticleWithAuthor,
     NewArticleDetails,
     NewArticleDetailsWithSlug,
     UpdateArticleFields,
@@ -17,40 +29,107 @@ from conduit.domain.articles.articles import (
 from conduit.domain.profiles.profile import Profile
 from conduit.domain.users.user import User
 
+_WithFavorites = TypeVar("_WithFavorites", ArticleWithAuthor, ArticleVersion)
+
+
+def _to_new_article_with_author(
+    article: Article,
+    tags: list[str],
+    author: Profile,
+) -> ArticleWithAuthor:
+    return ArticleWithAuthor(
+        id=article.id,
+        slug=article.slug,
+        description=article.description,
+        body=article.body,
+        title=article.title,
+        created_at=article.created_at,
+        updated_at=article.updated_at,
+        author=ArticleAuthor(
+            username=author.username,
+            bio=author.bio,
+            image=author.image,
+            following=author.following,
+        ),
+        tags=tags,
+        favorited=False,
+        favorites_count=0,
+        comments_count=0,
+    )
+
 
 @final
 class ArticlesService:
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         articles_repository: ArticlesRepository,
         tags_repository: TagsRepository,
         profiles_service: ProfilesService,
         favorites_repository: FavoritesRepository,
+        timeline_repository: TimelineRepository,
         slug_service: SlugService,
+        articles_list_cache: ArticlesListCache,
+        favorites_buffer: FavoritesBuffer,
     ) -> None:
         self._articles_repository = articles_repository
         self._tags_repository = tags_repository
         self._profiles_service = profiles_service
         self._favorites_repository = favorites_repository
+        self._timeline_repository = timeline_repository
         self._slug_service = slug_service
+        self._articles_list_cache = articles_list_cache
+        self._favorites_buffer = favorites_buffer
 
     async def get_article_by_slug(
         self,
         slug: str,
         current_user: Optional[User],
     ) -> Optional[ArticleWithAuthor]:
-        article = await self._articles_repository.get_by_slug_or_none(slug)
+        article = await self._articles_repository.get_with_author_by_slug(
+            slug,
+            viewer_id=current_user.id if current_user else None,
+        )
         if article is None:
             return None
+        return self._with_buffered_favorites(article, current_user)
 
-        author_profile = await self._profiles_service.get_by_user_id_or_none(
-            article.author_id,
-            current_user,
+    async def get_versioned_article_by_slug(
+        self,
+        slug: str,
+        current_user: Optional[User],
+    ) -> Optional[VersionedArticle]:
+        versioned_article = await self._articles_repository.get_versioned_by_slug(
+            slug,
+            viewer_id=current_user.id if current_user else None,
         )
-        if author_profile is None:
-            raise Errors.article_without_author()
+        if versioned_article is None:
+            return None
+        return VersionedArticle(
+            article=self._with_buffered_favorites(
+                versioned_article.article,
+                current_user,
+            ),
+            version=self._with_buffered_favorites(
+                versioned_article.version,
+                current_user,
+            ),
+        )
+
+    async def get_article_version(
+        self,
+        slug: str,
+        current_user: Optional[User],
+    ) -> Optional[ArticleVersion]:
+        version = await self._articles_repository.get_version_by_slug(
+            slug,
+            viewer_id=current_user.id if current_user else None,
+        )
+        if version is None:
+            return None
+        return self._with_buffered_favorites(version, current_user)
 
-        return await self._get_article_info(article, author_profile, current_user)
+    async def get_article_ref_by_slug(self, slug: str) -> Optional[ArticleRef]:
+        return await self._articles_repository.get_ref_by_slug(slug)
 
     async def create_article(
         self,
@@ -61,41 +140,57 @@ class ArticlesService:
         if profile is None:
             raise Errors.profile_not_found()
 
-        slugged_article = NewArticleDetailsWithSlug(
-            title=article_details.title,
-            description=article_details.description,
-            body=article_details.body,
-            slug=self._slug_service.slugify_string(article_details.title),
-            tags=article_details.tags,
-        )
-
         created_article = await self._articles_repository.add(
             current_user.id,
-            slugged_article,
+            self._with_slug(article_details),
         )
         await self._tags_repository.add_many(
             created_article.id,
             article_details.tags,
         )
+        await self._timeline_repository.fan_out(created_article)
+        self._articles_list_cache.invalidate_after_commit()
 
-        return ArticleWithAuthor(
-            id=created_article.id,
-            slug=created_article.slug,
-            description=created_article.description,
-            body=created_article.body,
-            title=created_article.title,
-            created_at=created_article.created_at,
-            updated_at=created_article.updated_at,
-            author=ArticleAuthor(
-                username=profile.username,
-                bio=profile.bio,
-                image=profile.image,
-                following=profile.following,
-            ),
-            tags=article_details.tags,
-            favorited=False,
-            favorites_count=0,
+        return _to_new_article_with_author(
+            created_article,
+            article_details.tags,
+            profile,
+        )
+
+    async def create_articles(
+        self,
+        articles_details: list[NewArticleDetails],
+        current_user: User,
+    ) -> list[ArticleWithAuthor]:
+        """Creates the articles with a few multi-row statements.
+
+        Returns the created articles in the order they were given. Either all
+        of them are created or, if the unit of work is rolled back, none.
+        """
+
+        profile = await self._profiles_service.get_by_user_id_or_none(current_user.id)
+        if profile is None:
+            raise Errors.profile_not_found()
+
+        created_articles = await self._articles_repository.add_many(
+            current_user.id,
+            [self._with_slug(article_details) for article_details in articles_details],
         )
+        created_with_details = list(zip(created_articles, articles_details))
+        await self._tags_repository.add_to_articles(
+            {
+                article.id: article_details.tags
+                for article, article_details in created_with_details
+            },
+        )
+        for created_article in created_articles:
+            await self._timeline_repository.fan_out(created_article)
+        self._articles_list_cache.invalidate_after_commit()
+
+        return [
+            _to_new_article_with_author(article, article_details.tags, profile)
+            for article, article_details in created_with_details
+        ]
 
     async def update_article(
         self,
@@ -103,86 +198,136 @@ class ArticlesService:
         update_fields: UpdateArticleFields,
         current_user: User,
     ) -> Optional[ArticleWithAuthor]:
-        article = await self._articles_repository.get_by_slug_or_none(slug)
-        if article is None:
+        article_ref = await self._articles_repository.get_ref_by_slug(slug)
+        if article_ref is None:
             return None
 
-        if article.author_id != current_user.id:
+        if article_ref.author_id != current_user.id:
             raise Errors.article_owning_error()
 
         if update_fields.title:
             update_fields.slug = self._slug_service.slugify_string(update_fields.title)
 
-        article = await self._articles_repository.update_by_slug(slug, update_fields)
-        author_profile = await self._profiles_service.get_by_user_id_or_none(
-            article.author_id,
-            current_user,
+        new_slug = await self._articles_repository.update_by_slug(slug, update_fields)
+        self._articles_list_cache.invalidate_after_commit()
+
+        updated_article = await self._articles_repository.get_with_author_by_slug(
+            new_slug,
+            viewer_id=current_user.id,
         )
-        if author_profile is None:
+        if updated_article is None:
             raise Errors.article_without_author()
 
-        return await self._get_article_info(article, author_profile, current_user)
+        return updated_article
 
     async def favorite_article(
         self,
         slug: str,
         current_user: User,
     ) -> Optional[ArticleWithAuthor]:
+        if self._favorites_buffer.enabled:
+            return await self._buffer_favorite(slug, current_user, favorited=True)
+
         article = await self.get_article_by_slug(slug, current_user)
         if article is None:
             return None
+        return await self._store_favorite(article, current_user, favorited=True)
 
-        if article.favorited:
-            raise Errors.article_is_already_favorited()
+    async def unfavorite_article(
+        self,
+        slug: str,
+        current_user: User,
+    ) -> Optional[ArticleWithAuthor]:
+        if self._favorites_buffer.enabled:
+            return await self._buffer_favorite(slug, current_user, favorited=False)
 
-        await self._favorites_repository.add(
-            article_id=article.id,
-            user_id=current_user.id,
-        )
+        article = await self.get_article_by_slug(slug, current_user)
+        if article is None:
+            return None
+        return await self._store_favorite(article, current_user, favorited=False)
+
+    async def _store_favorite(
+        self,
+        article: ArticleWithAuthor,
+        current_user: User,
+        *,
+        favorited: bool,
+    ) -> Optional[ArticleWithAuthor]:
+        if article.favorited == favorited:
+            return article
+
+        if favorited:
+            favorites_count = await self._favorites_repository.add(
+                article_id=article.id,
+                user_id=current_user.id,
+            )
+        else:
+            favorites_count = await self._favorites_repository.delete(
+                article_id=article.id,
+                user_id=current_user.id,
+            )
+        if favorites_count is None:
+            # A concurrent request has changed the favorite first.
+            return await self.get_article_by_slug(article.slug, current_user)
+        self._articles_list_cache.invalidate_after_commit()
 
-        return ArticleWithAuthor(
-            id=article.id,
-            slug=article.slug,
-            title=article.title,
-            description=article.description,
-            body=article.body,
-            tags=article.tags,
-            created_at=article.created_at,
-            updated_at=article.updated_at,
-            author=article.author,
-            favorited=True,
-            favorites_count=article.favorites_count + 1,
+        return self._with_buffered_favorites(
+            dataclasses.replace(
+                article,
+                favorited=favorited,
+                favorites_count=favorites_count,
+            ),
+            current_user,
         )
 
-    async def unfavorite_article(
+    async def _buffer_favorite(
         self,
         slug: str,
         current_user: User,
+        *,
+        favorited: bool,
     ) -> Optional[ArticleWithAuthor]:
-        article = await self.get_article_by_slug(slug, current_user)
+        article = await self._articles_repository.get_with_author_by_slug(
+            slug,
+            viewer_id=current_user.id,
+        )
         if article is None:
             return None
 
-        if not article.favorited:
-            raise Errors.article_is_already_unfavorited()
-
-        await self._favorites_repository.delete(
-            article_id=article.id,
-            user_id=current_user.id,
+        buffered = self._favorites_buffer.put(
+            article.id,
+            current_user.id,
+            stored=article.favorited,
+            favorited=favorited,
         )
+        if not buffered:
+            # Nothing is buffered for the article and user, so the stored
+            # favorite is up to date.
+            return await self._store_favorite(
+                article,
+                current_user,
+                favorited=favorited,
+            )
+        return self._with_buffered_favorites(article, current_user)
 
-        return ArticleWithAuthor(
-            id=article.id,
-            slug=article.slug,
-            title=article.title,
-            description=article.description,
-            body=article.body,
-            tags=article.tags,
-            created_at=article.created_at,
-            updated_at=article.updated_at,
-            author=article.author,
-            favorited=False,
-            favorites_count=article.favorites_count - 1,
+    def _with_buffered_favorites(
+        self,
+        article: _WithFavorites,
+        current_user: Optional[User],
+    ) -> _WithFavorites:
+        """Applies favorites that are not written to the database yet."""
+
+        if not self._favorites_buffer.enabled:
+            return article
+
+        favorited = None
+        if current_user is not None:
+            favorited = self._favorites_buffer.favorited(article.id, current_user.id)
+        return dataclasses.replace(
+            article,
+            favorited=article.favorited if favorited is None else favorited,
+            favorites_count=article.favorites_count
+            + self._favorites_buffer.favorites_count_delta(article.id),
         )
 
     async def delete_by_slug(
@@ -190,48 +335,69 @@ class ArticlesService:
         slug: str,
         current_user: User,
     ) -> None:
-        article = await self._articles_repository.get_by_slug_or_none(slug)
-        if article is None:
+        article_ref = await self._articles_repository.get_ref_by_slug(slug)
+        if article_ref is None:
             raise Errors.article_not_found()
 
-        if article.author_id != current_user.id:
+        if article_ref.author_id != current_user.id:
             raise Errors.article_owning_error()
 
-        await self._articles_repository.delete_by_id(article.id)
+        await self._timeline_repository.delete_by_article_id(article_ref.id)
+        await self._tags_repository.delete_by_article_id(article_ref.id)
+        await self._articles_repository.delete_by_id(article_ref.id)
+        self._articles_list_cache.invalidate_after_commit()
 
-    async def _get_article_info(
+    def _with_slug(
         self,
-        article: Article,
-        profile: Profile,
+        article_details: NewArticleDetails,
+    ) -> NewArticleDetailsWithSlug:
+        return NewArticleDetailsWithSlug(
+            title=article_details.title,
+            description=article_details.description,
+            body=article_details.body,
+            slug=self._slug_service.slugify_string(article_details.title),
+            tags=article_details.tags,
+        )
+
+    async def personalize_articles(
+        self,
+        articles: list[BodylessArticleWithAuthor],
         current_user: Optional[User],
-    ) -> ArticleWithAuthor:
-        tags = await self._tags_repository.list_by_article_id(article.id)
-        tag_names = [tag.name for tag in tags]
-
-        favorites_count = await self._favorites_repository.count(article.id)
-        is_favorited = (
-            await self._favorites_repository.exists(
-                current_user.id,
-                article.id,
-            )
-            if current_user
-            else False
-        )
-        return ArticleWithAuthor(
-            id=article.id,
-            slug=article.slug,
-            title=article.title,
-            description=article.description,
-            body=article.body,
-            tags=tag_names,
-            created_at=article.created_at,
-            updated_at=article.updated_at,
-            favorited=is_favorited,
-            favorites_count=favorites_count,
-            author=ArticleAuthor(
-                username=profile.username,
-                bio=profile.bio,
-                image=profile.image,
-                following=profile.following,
+    ) -> list[BodylessArticleWithAuthor]:
+        """Sets the viewer's flags on articles listed without them."""
+
+        if current_user is None or not articles:
+            return articles
+
+        favorited_ids = set(
+            await self._favorites_repository.list_favorited(
+                user_id=current_user.id,
+                article_ids=[article.id for article in articles],
             ),
         )
+        followed_ids = set(
+            await self._profiles_service.list_followed_user_ids(
+                list({article.author_id for article in articles}),
+                current_user,
+            ),
+        )
+
+        for article in articles:
+            favorited = self._favorites_buffer.favorited(article.id, current_user.id)
+            if favorited is True:
+                favorited_ids.add(article.id)
+            elif favorited is False:
+                favorited_ids.discard(article.id)
+
+        # Listed articles may be shared through the cache, so they are copied.
+        return [
+            dataclasses.replace(
+                article,
+                favorited=article.id in favorited_ids,
+                author=dataclasses.replace(
+                    article.author,
+                    following=article.author_id in followed_ids,
+                ),
+            )
+            for article in articles
+        ]
@@ -2,7 +2,12 @@ from typing import Optional, final
 
 from conduit.application.common.errors import Errors
 from conduit.application.common.repositories.followers import FollowersRepository
-from conduit.application.common.repositories.users import UsersRepository
+from conduit.application.common.repositories.timeline import TimelineRepository
+from conduit.application.common.repositories.users import (
+    ProfileVersion,
+    UsersRepository,
+    VersionedProfile,
+)
 from conduit.domain.profiles.profile import Profile
 from conduit.domain.users.user import User, UserID
 
@@ -14,6 +19,8 @@ def _to_profile(user: User, *, following: bool) -> Profile:
         bio=user.bio,
         image=user.image,
         following=following,
+        followers_count=user.followers_count,
+        following_count=user.following_count,
     )
 
 
@@ -23,9 +30,11 @@ class ProfilesService:
         self,
         users_repository: UsersRepository,
         followers_repository: FollowersRepository,
+        timeline_repository: TimelineRepository,
     ) -> None:
         self._users_repository = users_repository
         self._followers_repository = followers_repository
+        self._timeline_repository = timeline_repository
 
     async def get_by_user_id_or_none(
         self,
@@ -64,6 +73,26 @@ class ProfilesService:
 
         return _to_profile(target_user, following=is_following)
 
+    async def get_versioned_by_username(
+        self,
+        username: str,
+        current_user: Optional[User],
+    ) -> Optional[VersionedProfile]:
+        return await self._users_repository.get_versioned_profile_by_username(
+            username,
+            viewer_id=current_user.id if current_user else None,
+        )
+
+    async def get_version_by_username(
+        self,
+        username: str,
+        current_user: Optional[User],
+    ) -> Optional[ProfileVersion]:
+        return await self._users_repository.get_profile_version_by_username(
+            username,
+            viewer_id=current_user.id if current_user else None,
+        )
+
     async def follow_profile(
         self,
         username: str,
@@ -86,6 +115,10 @@ class ProfilesService:
             follower_id=current_user.id,
             following_id=target_user.id,
         )
+        await self._timeline_repository.backfill(
+            follower_id=current_user.id,
+            following_id=target_user.id,
+        )
 
     async def unfollow_profile(
         self,
@@ -109,22 +142,17 @@ class ProfilesService:
             follower_id=current_user.id,
             following_id=target_user.id,
         )
+        await self._timeline_repository.prune(
+            follower_id=current_user.id,
+            following_id=target_user.id,
+        )
 
-    async def list_by_user_ids(
+    async def list_followed_user_ids(
         self,
         user_ids: list[UserID],
-        current_user: Optional[User],
-    ) -> list[Profile]:
-        target_users = await self._users_repository.list_by_user_ids(user_ids)
-        following_user_ids = (
-            await self._followers_repository.list(
-                follower_id=current_user.id,
-                following_ids=[user.id for user in target_users],
-            )
-            if current_user
-            else []
+        current_user: User,
+    ) -> list[UserID]:
+        return await self._followers_repository.list(
+            follower_id=current_user.id,
+            following_ids=user_ids,
         )
-        return [
-            _to_profile(user, following=user.id in following_user_ids)
-            for user in target_users
-        ]
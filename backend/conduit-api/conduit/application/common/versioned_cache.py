@@ -0,0 +1,106 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Callable, Generic, Optional, TypeVar, final
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+
+@final
+@dataclass(frozen=True)
+class _Entry(Generic[_V]):
+    value: _V
+    version: int
+    expires_at: float
+
+
+@final
+class VersionedCache(Generic[_K, _V]):
+    """Bounded LRU of values that expire after a TTL or on invalidation.
+
+    Values have to be read after taking `version`, and are only cached if
+    nothing was invalidated in between, so a value read before a change
+    can never be cached as current.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        ttl_seconds: float,
+        max_size: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._enabled = enabled
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[_K, _Entry[_V]] = OrderedDict()
+        self._version = 0
+        # Entries cached under an older version are stale.
+        self._oldest_valid_version = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self) -> int:
+        """Version to pass to `put`, taken before the value is read."""
+
+        return self._version
+
+    def get(self, key: _K) -> Optional[_V]:
+        if not self._enabled:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if (
+            entry.version < self._oldest_valid_version
+            or entry.expires_at <= self._clock()
+        ):
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def put(
+        self,
+        key: _K,
+        value: _V,
+        version: int,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """Caches the value for `ttl_seconds`, the cache TTL by default."""
+
+        if not self._enabled or version != self._version:
+            return
+
+        if ttl_seconds is None:
+            ttl_seconds = self._ttl_seconds
+        self._entries[key] = _Entry(
+            value=value,
+            version=version,
+            expires_at=self._clock() + ttl_seconds,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Makes every cached value stale."""
+
+        self._version += 1
+        self._oldest_valid_version = self._version
+
+    def invalidate_key(self, key: _K) -> None:
+        """Drops one value, and any value of the key being read."""
+
+        self._version += 1
+        self._entries.pop(key, None)
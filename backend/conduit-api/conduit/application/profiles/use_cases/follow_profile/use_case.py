@@ -33,4 +33,6 @@ class FollowProfileUseCase:
                 bio=profile.bio,
                 image=profile.image,
                 following=True,
+                followers_count=profile.followers_count + 1,
+                following_count=profile.following_count,
             )
@@ -1,7 +1,7 @@
 from typing import Optional, final
 
+from conduit.application.common.repositories.users import VersionedProfile
 from conduit.application.common.services.profiles_service import ProfilesService
-from conduit.domain.profiles.profile import Profile
 from conduit.domain.users.user import User
 from conduit.shared.application.unit_of_work import UnitOfWorkFactory
 
@@ -20,9 +20,9 @@ class GetProfileByNameUseCase:
         self,
         username: str,
         current_user: Optional[User],
-    ) -> Optional[Profile]:
+    ) -> Optional[VersionedProfile]:
         async with self._uow_factory():
-            return await self._profiles_service.get_by_username_or_none(
+            return await self._profiles_service.get_versioned_by_username(
                 username,
                 current_user,
             )
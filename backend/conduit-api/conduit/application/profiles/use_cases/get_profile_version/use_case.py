@@ -0,0 +1,28 @@
+from typing import Optional, final
+
+from conduit.application.common.repositories.users import ProfileVersion
+from conduit.application.common.services.profiles_service import ProfilesService
+from conduit.domain.users.user import User
+from conduit.shared.application.unit_of_work import UnitOfWorkFactory
+
+
+@final
+class GetProfileVersionUseCase:
+    def __init__(
+        self,
+        uow_factory: UnitOfWorkFactory,
+        profiles_service: ProfilesService,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._profiles_service = profiles_service
+
+    async def __call__(
+        self,
+        username: str,
+        current_user: Optional[User],
+    ) -> Optional[ProfileVersion]:
+        async with self._uow_factory():
+            return await self._profiles_service.get_version_by_username(
+                username,
+                current_user,
+            )
@@ -33,4 +33,6 @@ class UnfollowProfileUseCase:
                 bio=profile.bio,
                 image=profile.image,
                 following=False,
+                followers_count=profile.followers_count - 1,
+                following_count=profile.following_count,
             )
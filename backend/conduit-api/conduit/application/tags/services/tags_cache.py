@@ -0,0 +1,77 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, Final, Optional, final
+
+from conduit.application.common.versioned_cache import VersionedCache
+from conduit.domain.tags.tag import Tag
+from conduit.shared.application.unit_of_work import UnitOfWork
+
+
+@final
+@dataclass(frozen=True, eq=False)
+class TagsList:
+    """All tags with the version they were read at.
+
+    Compared by identity, so that whatever is derived from a cached list,
+    like its serialized body, can be reused as long as it is cached.
+    """
+
+    tags: list[Tag]
+    version: int
+
+
+_ALL_TAGS: Final = "all"
+
+
+@final
+class TagsCache:
+    """In-process cache of the list of all tags.
+
+    New tags bump the version, the list cached under an older version is
+    treated as a miss and rebuilt on the next read. The TTL bounds how long
+    tags added by other processes are missing.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._cached: VersionedCache[str, TagsList] = VersionedCache(
+            enabled=enabled,
+            ttl_seconds=ttl_seconds,
+            max_size=1,
+            clock=clock,
+        )
+        self.rebuild_duration_ms = 0.0
+
+    @property
+    def version(self) -> int:
+        """Version to pass to `put`, taken before the tags are read."""
+
+        return self._cached.version
+
+    @property
+    def hits(self) -> int:
+        return self._cached.hits
+
+    @property
+    def misses(self) -> int:
+        return self._cached.misses
+
+    def get(self) -> Optional[TagsList]:
+        return self._cached.get(_ALL_TAGS)
+
+    def put(self, tags_list: TagsList, version: int, duration_ms: float) -> None:
+        self.rebuild_duration_ms = duration_ms
+        self._cached.put(_ALL_TAGS, tags_list, version)
+
+    def invalidate(self) -> None:
+        self._cached.invalidate()
+
+    def invalidate_after_commit(self) -> None:
+        """Invalidates the cached tags once the current unit of work is committed."""
+
+        UnitOfWork.get_current_context().add_commit_hook(self.invalidate)
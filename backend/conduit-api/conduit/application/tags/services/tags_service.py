@@ -1,12 +1,10 @@
-import logging
 import time
 from typing import Final, final
 
 from conduit.application.common.repositories.tags import TagsRepository
+from conduit.application.tags.services.tags_cache import TagsCache, TagsList
 from conduit.domain.tags.tag import Tag
 
-DEFAULT_LOGGER: Final = logging.getLogger(__name__)
-
 NS_IN_ONE_MS: Final = 1_000_000
 
 
@@ -15,25 +13,33 @@ class TagsService:
     def __init__(
         self,
         tags_repository: TagsRepository,
-        logger: logging.Logger = DEFAULT_LOGGER,
+        tags_cache: TagsCache,
     ) -> None:
         self._tags_repository = tags_repository
-        self._logger = logger
+        self._tags_cache = tags_cache
 
-    async def get_all_tags(self) -> list[Tag]:
-        self._logger.info("Retrieving tags")
-        start_time = time.perf_counter_ns()
+    async def get_tags_list(self) -> TagsList:
+        """Returns all tags, read from the database only if they have changed."""
 
-        try:
-            tags = await self._tags_repository.get_all_tags()
-        except Exception as ex:
-            self._logger.exception("Error retrieving tags", extra={"error": ex})
-            raise
+        tags_list = self._tags_cache.get()
+        if tags_list is not None:
+            return tags_list
 
-        duration_ms = (time.perf_counter_ns() - start_time) / NS_IN_ONE_MS
-        self._logger.info(
-            "Retrieving tags took %dms",
-            duration_ms,
-            extra={"duration_ms": duration_ms},
+        cache_version = self._tags_cache.version
+        start_time = time.perf_counter_ns()
+        tags_list = TagsList(
+            version=await self._tags_repository.get_version(),
+            tags=await self.get_all_tags(),
         )
-        return tags
+        duration_ms = (time.perf_counter_ns() - start_time) / NS_IN_ONE_MS
+        self._tags_cache.put(tags_list, cache_version, duration_ms)
+        return tags_list
+
+    async def list_popular_tags(self, limit: int) -> list[Tag]:
+        return await self._tags_repository.list_popular(limit)
+
+    async def suggest_tags(self, prefix: str, limit: int) -> list[Tag]:
+        return await self._tags_repository.suggest(prefix, limit)
+
+    async def get_all_tags(self) -> list[Tag]:
+        return await self._tags_repository.get_all_tags()
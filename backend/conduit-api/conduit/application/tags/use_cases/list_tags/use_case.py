@@ -1,7 +1,7 @@
 from typing import final
 
+from conduit.application.tags.services.tags_cache import TagsList
 from conduit.application.tags.services.tags_service import TagsService
-from conduit.domain.tags.tag import Tag
 from conduit.shared.application.unit_of_work import UnitOfWorkFactory
 
 
@@ -15,6 +15,6 @@ class ListTagsUseCase:
         self._uow_factory = uow_factory
         self._tags_service = tags_service
 
-    async def __call__(self) -> list[Tag]:
+    async def __call__(self) -> TagsList:
         async with self._uow_factory():
-            return await self._tags_service.get_all_tags()
+            return await self._tags_service.get_tags_list()
@@ -2,10 +2,17 @@ from typing import final
 
 from dependency_injector import containers, providers
 
+from conduit.application.articles.services.articles_list_cache import (
+    ArticlesListCache,
+)
+from conduit.application.articles.services.favorites_buffer import FavoritesBuffer
 from conduit.application.articles.services.slug_service import SlugService
 from conduit.application.articles.use_cases.create_article.use_case import (
     CreateArticleUseCase,
 )
+from conduit.application.articles.use_cases.create_articles.use_case import (
+    CreateArticlesUseCase,
+)
 from conduit.application.articles.use_cases.delete_article_by_slug.use_case import (
     DeleteArticleBySlugUseCase,
 )
@@ -18,6 +25,9 @@ from conduit.application.articles.use_cases.feed_articles.use_case import (
 from conduit.application.articles.use_cases.get_article_by_slug.use_case import (
     GetArticleBySlugUseCase,
 )
+from conduit.application.articles.use_cases.get_article_version.use_case import (
+    GetArticleVersionUseCase,
+)
 from conduit.application.articles.use_cases.list_articles.use_case import (
     ListArticlesUseCase,
 )
@@ -45,13 +55,34 @@ from conduit.application.profiles.use_cases.follow_profile.use_case import (
 from conduit.application.profiles.use_cases.get_profile_by_name.use_case import (
     GetProfileByNameUseCase,
 )
+from conduit.application.profiles.use_cases.get_profile_version.use_case import (
+    GetProfileVersionUseCase,
+)
 from conduit.application.profiles.use_cases.unfollow_profile.use_case import (
     UnfollowProfileUseCase,
 )
+from conduit.application.tags.services.tags_cache import TagsCache
 from conduit.application.tags.services.tags_service import TagsService
+from conduit.application.tags.use_cases.list_popular_tags.use_case import (
+    ListPopularTagsUseCase,
+)
 from conduit.application.tags.use_cases.list_tags.use_case import ListTagsUseCase
+from conduit.application.tags.use_cases.suggest_tags.use_case import (
+    SuggestTagsUseCase,
+)
 from conduit.infrastructure.messaging.events_subscriber import RabbitMQEventsSubscriber
+from conduit.infrastructure.metrics.instrumentation import cache_gauges, instrument
+from conduit.infrastructure.metrics.registry import MetricsRegistry
+from conduit.infrastructure.persistence.article_slugs_cache import ArticleSlugsCache
+from conduit.infrastructure.persistence.database_maintainer import (
+    DatabaseMaintainer,
+)
+from conduit.infrastructure.persistence.database_repairer import DatabaseRepairer
+from conduit.infrastructure.persistence.database_schema_upgrader import (
+    DatabaseSchemaUpgrader,
+)
 from conduit.infrastructure.persistence.database_seeder import Database, DatabaseSeeder
+from conduit.infrastructure.persistence.models import Base as ModelBase
 from conduit.infrastructure.persistence.repositories.articles import (
     SQLiteArticlesRepository,
 )
@@ -65,7 +96,14 @@ from conduit.infrastructure.persistence.repositories.followers import (
     SQLiteFollowersRepository,
 )
 from conduit.infrastructure.persistence.repositories.tags import SQLiteTagsRepository
+from conduit.infrastructure.persistence.repositories.timeline import (
+    SQLiteTimelineRepository,
+)
 from conduit.infrastructure.persistence.repositories.users import SQLiteUsersRepository
+from conduit.infrastructure.persistence.tag_ids_cache import TagIdsCache
+from conduit.infrastructure.persistence.tag_suggestions_index import (
+    TagSuggestionsIndex,
+)
 from conduit.settings import get_settings
 from conduit.shared.api.security.auth_token_service import AuthTokenService
 from conduit.shared.infrastructure.current_time import current_time
@@ -86,6 +124,7 @@ class Container(containers.DeclarativeContainer):
     db = providers.Singleton(
         Database,
         db_url=app_settings.provided.database_url,
+        sqlite_pragmas=app_settings.provided.sqlite_pragmas,
     )
 
     uow_factory = providers.Factory(
@@ -97,6 +136,29 @@ class Container(containers.DeclarativeContainer):
 
     slug_service = providers.Singleton(SlugService)
 
+    articles_list_cache = providers.Singleton(
+        ArticlesListCache,
+        enabled=app_settings.provided.articles_list_cache_enabled,
+        ttl_seconds=app_settings.provided.articles_list_cache_ttl_seconds,
+        max_size=app_settings.provided.articles_list_cache_max_size,
+    )
+
+    tags_cache = providers.Singleton(
+        TagsCache,
+        enabled=app_settings.provided.tags_cache_enabled,
+        ttl_seconds=app_settings.provided.tags_cache_ttl_seconds,
+    )
+
+    metrics = providers.Singleton(
+        MetricsRegistry,
+        enabled=app_settings.provided.metrics_enabled,
+        gauges=providers.Factory(
+            cache_gauges,
+            articles_list_cache=articles_list_cache,
+            tags_cache=tags_cache,
+        ),
+    )
+
     message_broker = providers.Singleton(
         RabbitMQBroker,
         rabbitmq_url=app_settings.provided.rabbitmq_url,
@@ -108,36 +170,126 @@ class Container(containers.DeclarativeContainer):
         now=now,
     )
 
+    db_schema_upgrader = providers.Singleton(
+        DatabaseSchemaUpgrader,
+        db=db,
+        model_type=ModelBase,
+    )
+
+    db_repairer = providers.Singleton(
+        DatabaseRepairer,
+        db=db,
+        feed_followers_limit=app_settings.provided.feed_fanout_followers_limit,
+    )
+
+    db_maintainer = providers.Singleton(
+        DatabaseMaintainer,
+        db=db,
+        enabled=app_settings.provided.database_maintenance_enabled,
+        interval_seconds=app_settings.provided.database_maintenance_interval_seconds,
+        batch_size=app_settings.provided.database_maintenance_batch_size,
+        vacuum_pages=app_settings.provided.database_maintenance_vacuum_pages,
+        metrics=metrics,
+    )
+
+    article_slugs_cache = providers.Singleton(
+        ArticleSlugsCache,
+        enabled=app_settings.provided.article_slugs_cache_enabled,
+        max_size=app_settings.provided.article_slugs_cache_max_size,
+        ttl_seconds=app_settings.provided.article_slugs_cache_ttl_seconds,
+        negative_ttl_seconds=app_settings.provided.article_slugs_cache_negative_ttl_seconds,
+    )
+
+    tag_ids_cache = providers.Singleton(
+        TagIdsCache,
+        db=db,
+        enabled=app_settings.provided.tag_ids_cache_enabled,
+        max_size=app_settings.provided.tag_ids_cache_max_size,
+    )
+
+    tag_suggestions_index = providers.Singleton(
+        TagSuggestionsIndex,
+        db=db,
+        enabled=app_settings.provided.tag_suggestions_enabled,
+        max_size=app_settings.provided.tag_suggestions_max_size,
+    )
+
     # Repositories
 
     tags_repository = providers.Factory(
-        SQLiteTagsRepository,
-        now=now,
+        instrument,
+        providers.Factory(
+            SQLiteTagsRepository,
+            now=now,
+            tag_ids_cache=tag_ids_cache,
+            tags_cache=tags_cache,
+            tag_suggestions_index=tag_suggestions_index,
+        ),
+        metrics=metrics,
     )
 
     users_repository = providers.Factory(
-        SQLiteUsersRepository,
-        now=now,
+        instrument,
+        providers.Factory(
+            SQLiteUsersRepository,
+            now=now,
+        ),
+        metrics=metrics,
     )
 
     followers_repository = providers.Factory(
-        SQLiteFollowersRepository,
-        now=now,
+        instrument,
+        providers.Factory(
+            SQLiteFollowersRepository,
+            now=now,
+        ),
+        metrics=metrics,
     )
 
     articles_repository = providers.Factory(
-        SQLiteArticlesRepository,
-        now=now,
+        instrument,
+        providers.Factory(
+            SQLiteArticlesRepository,
+            now=now,
+            feed_followers_limit=app_settings.provided.feed_fanout_followers_limit,
+            slugs_cache=article_slugs_cache,
+        ),
+        metrics=metrics,
+    )
+
+    timeline_repository = providers.Factory(
+        instrument,
+        providers.Factory(SQLiteTimelineRepository),
+        metrics=metrics,
     )
 
     favorites_repository = providers.Factory(
-        SQLiteFavoritesRepository,
-        now=now,
+        instrument,
+        providers.Factory(
+            SQLiteFavoritesRepository,
+            now=now,
+        ),
+        metrics=metrics,
     )
 
     comments_repository = providers.Factory(
-        SQLiteCommentsRepository,
-        now=now,
+        instrument,
+        providers.Factory(
+            SQLiteCommentsRepository,
+            now=now,
+        ),
+        metrics=metrics,
+    )
+
+    favorites_buffer = providers.Singleton(
+        FavoritesBuffer,
+        uow_factory=uow_factory,
+        favorites_repository=favorites_repository,
+        articles_list_cache=articles_list_cache,
+        enabled=app_settings.provided.favorites_buffer_enabled,
+        flush_interval_seconds=app_settings.provided.favorites_buffer_flush_interval_seconds,
+        max_pending=app_settings.provided.favorites_buffer_max_pending,
+        max_size=app_settings.provided.favorites_buffer_max_size,
     )
 
     # Services
@@ -145,6 +297,7 @@ class Container(containers.DeclarativeContainer):
     tags_service = providers.Factory(
         TagsService,
         tags_repository=tags_repository,
+        tags_cache=tags_cache,
     )
 
     auth_token_service = providers.Factory(
@@ -158,6 +311,7 @@ class Container(containers.DeclarativeContainer):
         ProfilesService,
         users_repository=users_repository,
         followers_repository=followers_repository,
+        timeline_repository=timeline_repository,
     )
 
     articles_service = providers.Factory(
@@ -166,106 +320,222 @@ class Container(containers.DeclarativeContainer):
         tags_repository=tags_repository,
         profiles_service=profiles_service,
         favorites_repository=favorites_repository,
+        timeline_repository=timeline_repository,
         slug_service=slug_service,
+        articles_list_cache=articles_list_cache,
+        favorites_buffer=favorites_buffer,
     )
 
     comments_service = providers.Factory(
         CommentsService,
         comments_repository=comments_repository,
         articles_service=articles_service,
-        profiles_service=profiles_service,
+        articles_list_cache=articles_list_cache,
     )
 
     # Use cases
 
     list_tags_use_case = providers.Factory(
-        ListTagsUseCase,
-        uow_factory=uow_factory,
-        tags_service=tags_service,
+        instrument,
+        providers.Factory(
+            ListTagsUseCase,
+            uow_factory=uow_factory,
+            tags_service=tags_service,
+        ),
+        metrics=metrics,
+    )
+
+    list_popular_tags_use_case = providers.Factory(
+        instrument,
+        providers.Factory(
+            ListPopularTagsUseCase,
+            uow_factory=uow_factory,
+            tags_service=tags_service,
+        ),
+        metrics=metrics,
+    )
+
+    suggest_tags_use_case = providers.Factory(
+        instrument,
+        providers.Factory(
+            SuggestTagsUseCase,
+            uow_factory=uow_factory,
+            tags_service=tags_service,
+        ),
+        metrics=metrics,
     )
 
     get_article_by_slug_use_case = providers.Factory(
-        GetArticleBySlugUseCase,
-        uow_factory=uow_factory,
-        articles_service=articles_service,
+        instrument,
+        providers.Factory(
+            GetArticleBySlugUseCase,
+            uow_factory=uow_factory,
+            articles_service=articles_service,
+        ),
+        metrics=metrics,
+    )
+
+    get_article_version_use_case = providers.Factory(
+        instrument,
+        providers.Factory(
+            GetArticleVersionUseCase,
+            uow_factory=uow_factory,
+            articles_service=articles_service,
+        ),
+        metrics=metrics,
     )
 
     create_article_use_case = providers.Factory(
-        CreateArticleUseCase,
-        uow_factory=uow_factory,
-        articles_service=articles_service,
+        instrument,
+        providers.Factory(
+            CreateArticleUseCase,
+            uow_factory=uow_factory,
+            articles_service=articles_service,
+        ),
+        metrics=metrics,
+    )
+
+    create_articles_use_case = providers.Factory(
+        instrument,
+        providers.Factory(
+            CreateArticlesUseCase,
+            uow_factory=uow_factory,
+            articles_service=articles_service,
+        ),
+        metrics=metrics,
     )
 
     list_articles_use_case = providers.Factory(
-        ListArticlesUseCase,
-        uow_factory=uow_factory,
-        articles_repository=articles_repository,
+        instrument,
+        providers.Factory(
+            ListArticlesUseCase,
+            uow_factory=uow_factory,
+            articles_repository=articles_repository,
+            articles_service=articles_service,
+            articles_list_cache=articles_list_cache,
+        ),
+        metrics=metrics,
     )
 
     feed_articles_use_case = providers.Factory(
-        FeedArticlesUseCase,
-        uow_factory=uow_factory,
-        articles_repository=articles_repository,
+        instrument,
+        providers.Factory(
+            FeedArticlesUseCase,
+            uow_factory=uow_factory,
+            articles_repository=articles_repository,
+            articles_service=articles_service,
+        ),
+        metrics=metrics,
     )
 
     get_profile_by_name_use_case = providers.Factory(
-        GetProfileByNameUseCase,
-        uow_factory=uow_factory,
-        profiles_service=profiles_service,
+        instrument,
+        providers.Factory(
+            GetProfileByNameUseCase,
+            uow_factory=uow_factory,
+            profiles_service=profiles_service,
+        ),
+        metrics=metrics,
+    )
+
+    get_profile_version_use_case = providers.Factory(
+        instrument,
+        providers.Factory(
+            GetProfileVersionUseCase,
+            uow_factory=uow_factory,
+            profiles_service=profiles_service,
+        ),
+        metrics=metrics,
     )
 
     follow_profile_use_case = providers.Factory(
-        FollowProfileUseCase,
-        uow_factory=uow_factory,
-        profiles_service=profiles_service,
+        instrument,
+        providers.Factory(
+            FollowProfileUseCase,
+            uow_factory=uow_factory,
+            profiles_service=profiles_service,
+        ),
+        metrics=metrics,
     )
 
     unfollow_profile_use_case = providers.Factory(
-        UnfollowProfileUseCase,
-        uow_factory=uow_factory,
-        profiles_service=profiles_service,
+        instrument,
+        providers.Factory(
+            UnfollowProfileUseCase,
+            uow_factory=uow_factory,
+            profiles_service=profiles_service,
+        ),
+        metrics=metrics,
     )
 
     favorite_article_use_case = providers.Factory(
-        FavoriteArticleUseCase,
-        uow_factory=uow_factory,
-        articles_service=articles_service,
+        instrument,
+        providers.Factory(
+            FavoriteArticleUseCase,
+            uow_factory=uow_factory,
+            articles_service=articles_service,
+        ),
+        metrics=metrics,
     )
 
     unfavorite_article_use_case = providers.Factory(
-        UnfavoriteArticleUseCase,
-        uow_factory=uow_factory,
-        articles_service=articles_service,
+        instrument,
+        providers.Factory(
+            UnfavoriteArticleUseCase,
+            uow_factory=uow_factory,
+            articles_service=articles_service,
+        ),
+        metrics=metrics,
     )
 
     delete_article_by_slug_use_case = providers.Factory(
-        DeleteArticleBySlugUseCase,
-        uow_factory=uow_factory,
-        articles_service=articles_service,
+        instrument,
+        providers.Factory(
+            DeleteArticleBySlugUseCase,
+            uow_factory=uow_factory,
+            articles_service=articles_service,
+        ),
+        metrics=metrics,
     )
 
     update_article_use_case = providers.Factory(
-        UpdateArticleUseCase,
-        uow_factory=uow_factory,
-        articles_service=articles_service,
+        instrument,
+        providers.Factory(
+            UpdateArticleUseCase,
+            uow_factory=uow_factory,
+            articles_service=articles_service,
+        ),
+        metrics=metrics,
     )
 
     add_comment_to_article_use_case = providers.Factory(
-        AddCommentToArticleUseCase,
-        uow_factory=uow_factory,
-        comments_service=comments_service,
+        instrument,
+        providers.Factory(
+            AddCommentToArticleUseCase,
+            uow_factory=uow_factory,
+            comments_service=comments_service,
+        ),
+        metrics=metrics,
     )
 
     list_article_comments_use_case = providers.Factory(
-        ListArticleCommentsUseCase,
-        uow_factory=uow_factory,
-        comments_service=comments_service,
+        instrument,
+        providers.Factory(
+            ListArticleCommentsUseCase,
+            uow_factory=uow_factory,
+            comments_service=comments_service,
+        ),
+        metrics=metrics,
     )
 
     delete_article_comment_use_case = providers.Factory(
-        DeleteArticleCommentUseCase,
-        uow_factory=uow_factory,
-        comments_service=comments_service,
+        instrument,
+        providers.Factory(
+            DeleteArticleCommentUseCase,
+            uow_factory=uow_factory,
+            comments_service=comments_service,
+        ),
+        metrics=metrics,
     )
 
     events_subscriber = providers.Factory(
@@ -273,4 +543,5 @@ class Container(containers.DeclarativeContainer):
         message_broker=message_broker,
         uow_factory=uow_factory,
         now=now,
+        articles_list_cache=articles_list_cache,
     )
@@ -36,6 +36,13 @@ class UpdateArticleFields:
     slug: Optional[str] = field(default=None)
 
 
+@final
+@dataclass(frozen=True)
+class ArticleRef:
+    id: ArticleID
+    author_id: AuthorID
+
+
 @final
 @dataclass
 class ArticleAuthor:
@@ -59,11 +66,14 @@ class ArticleWithAuthor:
     author: ArticleAuthor
     favorited: bool
     favorites_count: int
+    comments_count: int
 
 
 @final
 @dataclass
 class BodylessArticleWithAuthor:
+    id: ArticleID
+    author_id: AuthorID
     slug: str
     title: str
     description: str
@@ -73,6 +83,7 @@ class BodylessArticleWithAuthor:
     author: ArticleAuthor
     favorited: bool
     favorites_count: int
+    comments_count: int
 
 
 @final
@@ -84,5 +95,6 @@ class Article:
     slug: str
     description: str
     body: str
+    favorites_count: int
     created_at: datetime.datetime
     updated_at: datetime.datetime
@@ -16,3 +16,5 @@ class Profile:
     bio: str
     image: Optional[str] = field(default=None)
     following: bool = field(default=False)
+    followers_count: int = field(default=0)
+    following_count: int = field(default=0)
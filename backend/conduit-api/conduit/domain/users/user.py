@@ -15,3 +15,5 @@ class User:
     username: str
     bio: str
     image: Optional[str]
+    followers_count: int
+    following_count: int
@@ -12,6 +12,9 @@ from pika.exceptions import (
 from sqlalchemy import insert, update
 from typing_extensions import override
 
+from conduit.application.articles.services.articles_list_cache import (
+    ArticlesListCache,
+)
 from conduit.infrastructure.messaging.messages.user_created import UserCreatedMessage
 from conduit.infrastructure.messaging.messages.user_updated import UserUpdatedMessage
 from conduit.infrastructure.persistence.models import UserModel
@@ -30,12 +33,14 @@ class RabbitMQEventsSubscriber(Thread):
         message_broker: RabbitMQBroker,
         uow_factory: UnitOfWorkFactory,
         now: CurrentTime,
+        articles_list_cache: ArticlesListCache,
     ) -> None:
         super().__init__(name=RABBITMQ_LISTENER_THREAD_NAME, daemon=True)
 
         self._message_broker = message_broker
         self._uow_factory = uow_factory
         self._now = now
+        self._articles_list_cache = articles_list_cache
 
         self._event_loop = asyncio.new_event_loop()
 
@@ -100,6 +105,8 @@ class RabbitMQEventsSubscriber(Thread):
                 )
             )
             await session.execute(query)
+            # Cached pages embed author profiles.
+            self._articles_list_cache.invalidate_after_commit()
 
     @override
     def run(self) -> None:
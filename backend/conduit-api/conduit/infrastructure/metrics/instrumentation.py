@@ -0,0 +1,71 @@
+import inspect
+import types
+from collections.abc import Awaitable
+from typing import Any, Callable, Optional, TypeVar, cast, final
+
+from conduit.application.articles.services.articles_list_cache import (
+    ArticlesListCache,
+)
+from conduit.application.tags.services.tags_cache import TagsCache
+from conduit.infrastructure.metrics.registry import MetricsRegistry
+
+_T = TypeVar("_T")
+
+
+@final
+class _Instrumented:
+    """Proxy recording the metrics of every coroutine method of its target."""
+
+    def __init__(self, target: object, metrics: MetricsRegistry) -> None:
+        self._target = target
+        self._metrics = metrics
+        # Calls are looked up on the type, so `__call__` is bound once up front.
+        self._timed_call: Optional[Callable[..., Awaitable[Any]]] = (
+            self.__getattr__("__call__") if callable(target) else None
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if not (inspect.ismethod(attribute) and inspect.iscoroutinefunction(attribute)):
+            return attribute
+
+        timed_method = types.MethodType(
+            self._metrics.timed_method(type(self._target), name),
+            self._target,
+        )
+        # Later lookups find the bound method without calling `__getattr__`.
+        setattr(self, name, timed_method)
+        return timed_method
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Awaitable[Any]:
+        if self._timed_call is None:
+            msg = f"'{type(self._target).__name__}' object is not callable"
+            raise TypeError(msg)
+        return self._timed_call(*args, **kwargs)
+
+
+def instrument(target: _T, metrics: MetricsRegistry) -> _T:
+    """Records the latency and errors of the coroutine methods of `target`.
+
+    Use cases are measured through `__call__`, repositories through each
+    of their methods, all of them labelled `<class name>.<method name>`.
+    """
+
+    if not metrics.enabled:
+        return target
+    return cast(_T, _Instrumented(target, metrics))
+
+
+def cache_gauges(
+    articles_list_cache: ArticlesListCache,
+    tags_cache: TagsCache,
+) -> dict[str, Callable[[], float]]:
+    """Returns the gauges reading the statistics of the in-process caches."""
+
+    return {
+        "articles_list_cache_hits": lambda: articles_list_cache.hits,
+        "articles_list_cache_misses": lambda: articles_list_cache.misses,
+        "tags_cache_hits": lambda: tags_cache.hits,
+        "tags_cache_misses": lambda: tags_cache.misses,
+        "tags_cache_rebuild_duration_ms": lambda: tags_cache.rebuild_duration_ms,
+    }
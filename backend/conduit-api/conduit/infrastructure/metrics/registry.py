@@ -0,0 +1,177 @@
+import bisect
+import functools
+import time
+from collections.abc import Awaitable, Mapping
+from typing import Any, Callable, Final, Optional, TypeVar, final
+
+from typing_extensions import ParamSpec
+
+NS_IN_ONE_MS: Final = 1_000_000
+
+# Upper bounds of the latency buckets, the last bucket has no bound.
+LATENCY_BUCKETS_MS: Final = (
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+)
+_LATENCY_BUCKETS_NS: Final = tuple(
+    int(bound_ms * NS_IN_ONE_MS) for bound_ms in LATENCY_BUCKETS_MS
+)
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+@final
+class OperationMetrics:
+    """Latency histogram and error count of one operation."""
+
+    def __init__(self) -> None:
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ns = 0
+
+    def observe(self, duration_ns: int) -> None:
+        self.bucket_counts[bisect.bisect_left(_LATENCY_BUCKETS_NS, duration_ns)] += 1
+        self.count += 1
+        self.total_ns += duration_ns
+
+    def quantile_ms(self, quantile: float) -> Optional[float]:
+        """Returns the upper bound of the bucket holding the quantile.
+
+        `None` if there are no observations, or the quantile is above the
+        last bound.
+        """
+
+        rank = quantile * self.count
+        observed = 0
+        for bound_ms, bucket_count in zip(LATENCY_BUCKETS_MS, self.bucket_counts):
+            observed += bucket_count
+            if observed and observed >= rank:
+                return bound_ms
+        return None
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": self.total_ns / NS_IN_ONE_MS,
+            "p50_ms": self.quantile_ms(0.5),
+            "p95_ms": self.quantile_ms(0.95),
+            "p99_ms": self.quantile_ms(0.99),
+        }
+
+
+@final
+class MetricsRegistry:
+    """Process-wide latencies and errors of operations, with live gauges
+    and counters.
+
+    Recording an observation costs a clock read and a binary search over
+    a few bucket bounds, so it can stay on in production.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        gauges: Optional[Mapping[str, Callable[[], float]]] = None,
+    ) -> None:
+        self._enabled = enabled
+        self._gauges = dict(gauges or {})
+        self._operations: dict[str, OperationMetrics] = {}
+        self._counters: dict[str, int] = {}
+        self._timed_methods: dict[str, Callable[..., Awaitable[Any]]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def operations(self) -> Mapping[str, OperationMetrics]:
+        return self._operations
+
+    @property
+    def counters(self) -> Mapping[str, int]:
+        return self._counters
+
+    def increment(self, name: str, value: int = 1) -> None:
+        self._counters[name] = self._counters.get(name, 0) + value
+
+    def gauges(self) -> dict[str, float]:
+        """Returns the current value of every gauge."""
+
+        return {name: gauge() for name, gauge in self._gauges.items()}
+
+    def operation(self, name: str) -> OperationMetrics:
+        metrics = self._operations.get(name)
+        if metrics is None:
+            metrics = self._operations[name] = OperationMetrics()
+        return metrics
+
+    def timed(
+        self,
+        name: str,
+        function: Callable[_P, Awaitable[_R]],
+    ) -> Callable[_P, Awaitable[_R]]:
+        """Wraps a coroutine function to record its latency and errors."""
+
+        metrics = self.operation(name)
+
+        @functools.wraps(function)
+        async def timed_function(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            start_time = time.perf_counter_ns()
+            try:
+                return await function(*args, **kwargs)
+            except Exception:
+                metrics.errors += 1
+                raise
+            finally:
+                metrics.observe(time.perf_counter_ns() - start_time)
+
+        return timed_function
+
+    def timed_method(
+        self,
+        owner: type,
+        name: str,
+    ) -> Callable[..., Awaitable[Any]]:
+        """Returns the unbound coroutine method `name` of `owner`, timed.
+
+        The wrapper is built once per class and method name, and shared by
+        every instance of the class.
+        """
+
+        operation_name = f"{owner.__name__}.{name}"
+        timed_method = self._timed_methods.get(operation_name)
+        if timed_method is None:
+            timed_method = self._timed_methods[operation_name] = self.timed(
+                operation_name,
+                getattr(owner, name),
+            )
+        return timed_method
+
+    def snapshot(self) -> dict[str, Any]:
+        """Returns every metric as plain data, to be dumped as JSON."""
+
+        return {
+            "operations": {
+                name: metrics.snapshot()
+                for name, metrics in sorted(self._operations.items())
+            },
+            "gauges": self.gauges(),
+            "counters": dict(sorted(self._counters.items())),
+        }
@@ -0,0 +1,61 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, final
+
+from conduit.application.common.versioned_cache import VersionedCache
+from conduit.domain.articles.articles import ArticleRef
+
+
+@final
+@dataclass(frozen=True)
+class CachedSlug:
+    """Cached resolution of a slug, `article` is `None` for unknown slugs."""
+
+    article: Optional[ArticleRef]
+
+
+@final
+class ArticleSlugsCache:
+    """Bounded LRU of article slugs resolved to their article and author ids.
+
+    Unknown slugs are cached for a shorter time, since an article can be
+    created with the slug by another process.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        max_size: int,
+        ttl_seconds: float,
+        negative_ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._slugs: VersionedCache[str, CachedSlug] = VersionedCache(
+            enabled=enabled,
+            ttl_seconds=ttl_seconds,
+            max_size=max_size,
+            clock=clock,
+        )
+
+    @property
+    def version(self) -> int:
+        """Version to pass to `put`, it has to be taken before the slug is read."""
+
+        return self._slugs.version
+
+    def get(self, slug: str) -> Optional[CachedSlug]:
+        return self._slugs.get(slug)
+
+    def put(self, slug: str, article: Optional[ArticleRef], version: int) -> None:
+        # Any slug may have been invalidated since the version was taken.
+        self._slugs.put(
+            slug,
+            CachedSlug(article=article),
+            version,
+            ttl_seconds=None if article else self._negative_ttl_seconds,
+        )
+
+    def invalidate(self, slug: str) -> None:
+        self._slugs.invalidate_key(slug)
@@ -0,0 +1,44 @@
+import zlib
+from typing import Any, Optional, Union
+
+from sqlalchemy import Dialect, String, TypeDecorator
+
+# Shorter texts gain too little from compression to pay for it.
+COMPRESSION_THRESHOLD_BYTES = 1024
+COMPRESSION_LEVEL = 6
+
+
+class CompressedText(TypeDecorator[str]):
+    """Text that is stored zlib-compressed once it is long enough.
+
+    Compressed values are stored as BLOBs and short ones as text, so the
+    storage class of a value tells whether it has to be decompressed, and
+    rows written before compression was introduced are read as they are.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def process_bind_param(
+        self,
+        value: Optional[str],
+        dialect: Dialect,
+    ) -> Union[str, bytes, None]:
+        del dialect
+        if value is None:
+            return None
+
+        encoded = value.encode()
+        if len(encoded) < COMPRESSION_THRESHOLD_BYTES:
+            return value
+        return zlib.compress(encoded, COMPRESSION_LEVEL)
+
+    def process_result_value(
+        self,
+        value: Any,
+        dialect: Dialect,
+    ) -> Optional[str]:
+        del dialect
+        if isinstance(value, bytes):
+            return zlib.decompress(value).decode()
+        return value
@@ -0,0 +1,177 @@
+import asyncio
+import logging
+import time
+from collections import Counter
+from collections.abc import Awaitable, Mapping
+from dataclasses import dataclass
+from typing import Final, final
+
+from sqlalchemy import case, delete, exists, select, text, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from conduit.infrastructure.metrics.registry import MetricsRegistry
+from conduit.infrastructure.persistence.models import (
+    ArticleModel,
+    ArticleTagModel,
+    Base,
+    TagModel,
+)
+from conduit.shared.infrastructure.persistence.database import Database
+
+DEFAULT_LOGGER: Final = logging.getLogger(__name__)
+
+NS_IN_ONE_MS: Final = 1_000_000
+
+# Rows referencing an article, left behind by articles deleted while foreign
+# keys were not enforced.
+ARTICLE_CHILD_TABLES: Final = ("articles_tags", "favorites", "comments", "timeline")
+
+
+async def _subtract_from_usage_counts(
+    session: AsyncSession,
+    deltas: Mapping[int, int],
+) -> None:
+    if not deltas:
+        return
+
+    query = (
+        update(TagModel)
+        .where(TagModel.id.in_(deltas))
+        .values(usage_count=TagModel.usage_count - case(deltas, value=TagModel.id))
+    )
+    await session.execute(query)
+
+
+@final
+@dataclass(frozen=True)
+class MaintenanceStep:
+    name: str
+    rows: int
+    duration_ms: float
+
+
+class DatabaseMaintainer:
+    """Keeps a long running database lean and its query plans up to date.
+
+    The duration of each step is recorded as the `DatabaseMaintainer.<step>`
+    operation, and its rows are counted by the
+    `database_maintenance_<step>_rows_total` counter.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        db: Database,
+        enabled: bool,
+        interval_seconds: float,
+        batch_size: int,
+        vacuum_pages: int,
+        metrics: MetricsRegistry,
+        logger: logging.Logger = DEFAULT_LOGGER,
+    ) -> None:
+        self._db = db
+        self._enabled = enabled
+        self._interval_seconds = interval_seconds
+        self._batch_size = batch_size
+        self._vacuum_pages = vacuum_pages
+        self._metrics = metrics
+        self._logger = logger
+
+    async def run(self) -> None:
+        """Maintains the database periodically until cancelled."""
+
+        if not self._enabled:
+            return
+
+        while True:
+            await asyncio.sleep(self._interval_seconds)
+            try:
+                await self.maintain_database()
+            except Exception:
+                self._logger.exception("Error maintaining database")
+
+    async def maintain_database(self) -> list[MaintenanceStep]:
+        steps = [
+            await self._timed(f"purge_{table_name}", self._purge_orphans(table_name))
+            for table_name in ARTICLE_CHILD_TABLES
+        ]
+        steps.append(await self._timed("optimize", self._optimize()))
+        steps.append(await self._timed("incremental_vacuum", self._vacuum()))
+
+        for step in steps:
+            self._logger.info(
+                "Database maintenance step %s affected %d rows in %dms",
+                step.name,
+                step.rows,
+                step.duration_ms,
+                extra={
+                    "step": step.name,
+                    "rows": step.rows,
+                    "duration_ms": step.duration_ms,
+                },
+            )
+        return steps
+
+    async def _timed(self, name: str, work: Awaitable[int]) -> MaintenanceStep:
+        start_time = time.perf_counter_ns()
+        rows = await work
+        duration_ns = time.perf_counter_ns() - start_time
+        if self._metrics.enabled:
+            self._metrics.operation(f"DatabaseMaintainer.{name}").observe(duration_ns)
+            self._metrics.increment(f"database_maintenance_{name}_rows_total", rows)
+        return MaintenanceStep(
+            name=name,
+            rows=rows,
+            duration_ms=duration_ns / NS_IN_ONE_MS,
+        )
+
+    async def _purge_orphans(self, table_name: str) -> int:
+        """Deletes orphaned rows in batches, each in its own transaction.
+
+        Short transactions let requests write in between the batches.
+        """
+
+        table = Base.metadata.tables[table_name]
+        primary_key = tuple_(*table.primary_key.columns)
+        orphans = (
+            select(*table.primary_key.columns)
+            .where(~exists().where(ArticleModel.id == table.c.article_id))
+            .limit(self._batch_size)
+        )
+        query = delete(table).where(primary_key.in_(orphans))
+
+        purged = 0
+        while True:
+            async with self._db.session() as session:
+                if table is ArticleTagModel.__table__:
+                    # The purged links still count towards the usage of their tags.
+                    tag_ids = list(
+                        await session.scalars(query.returning(table.c.tag_id)),
+                    )
+                    await _subtract_from_usage_counts(session, Counter(tag_ids))
+                    batch_rows = len(tag_ids)
+                else:
+                    batch_rows = (await session.execute(query)).rowcount
+            purged += batch_rows
+            if batch_rows < self._batch_size:
+                return purged
+
+    async def _optimize(self) -> int:
+        async with self._db.session() as session:
+            await session.execute(text("PRAGMA optimize"))
+        return 0
+
+    async def _vacuum(self) -> int:
+        """Returns the number of free pages given back to the file system."""
+
+        async with self._db.engine.connect() as conn:
+            free_pages = await conn.scalar(text("PRAGMA freelist_count")) or 0
+            # Each step of the pragma frees a single page, and only a script
+            # is stepped until it is done.
+            raw_connection = await conn.get_raw_connection()
+            if driver_connection := raw_connection.driver_connection:
+                await driver_connection.executescript(
+                    f"PRAGMA incremental_vacuum({self._vacuum_pages:d})",
+                )
+            remaining_pages = await conn.scalar(text("PRAGMA freelist_count")) or 0
+        return free_pages - remaining_pages
@@ -0,0 +1,109 @@
+from sqlalchemy import delete, insert, not_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.functions import count
+
+from conduit.infrastructure.persistence.models import (
+    ArticleModel,
+    ArticleTagModel,
+    CommentModel,
+    FavoriteModel,
+    FollowerModel,
+    TagModel,
+    TimelineModel,
+    UserModel,
+)
+from conduit.infrastructure.persistence.repositories.timeline import (
+    has_many_followers,
+)
+from conduit.shared.infrastructure.persistence.database import Database
+
+
+class DatabaseRepairer:
+    """Recomputes denormalized data from the tables it is derived from."""
+
+    def __init__(self, db: Database, feed_followers_limit: int) -> None:
+        self._db = db
+        self._feed_followers_limit = feed_followers_limit
+
+    async def repair_database(self) -> None:
+        async with self._db.session() as session:
+            await self._recompute_favorites_count(session)
+            await self._recompute_comments_count(session)
+            await self._recompute_tags_usage_count(session)
+            await self._recompute_follow_counts(session)
+            await self._rebuild_timeline(session)
+
+    async def _recompute_favorites_count(self, session: AsyncSession) -> None:
+        favorites_count = (
+            select(count())
+            .where(FavoriteModel.article_id == ArticleModel.id)
+            .scalar_subquery()
+        )
+        query = update(ArticleModel).values(favorites_count=favorites_count)
+        await session.execute(query)
+
+    async def _recompute_comments_count(self, session: AsyncSession) -> None:
+        comments_count = (
+            select(count())
+            .where(CommentModel.article_id == ArticleModel.id)
+            .scalar_subquery()
+        )
+        query = update(ArticleModel).values(comments_count=comments_count)
+        await session.execute(query)
+
+    async def _recompute_tags_usage_count(self, session: AsyncSession) -> None:
+        # Links left behind by deleted articles do not count.
+        usage_count = (
+            select(count())
+            .select_from(ArticleTagModel)
+            .join(ArticleModel, ArticleModel.id == ArticleTagModel.article_id)
+            .where(ArticleTagModel.tag_id == TagModel.id)
+            .scalar_subquery()
+        )
+        query = update(TagModel).values(usage_count=usage_count)
+        await session.execute(query)
+
+    async def _recompute_follow_counts(self, session: AsyncSession) -> None:
+        followers_count = (
+            select(count())
+            .where(FollowerModel.following_id == UserModel.id)
+            .scalar_subquery()
+        )
+        following_count = (
+            select(count())
+            .where(FollowerModel.follower_id == UserModel.id)
+            .scalar_subquery()
+        )
+        query = update(UserModel).values(
+            followers_count=followers_count,
+            following_count=following_count,
+        )
+        await session.execute(query)
+
+    async def _rebuild_timeline(self, session: AsyncSession) -> None:
+        await session.execute(delete(TimelineModel))
+        await session.execute(
+            update(ArticleModel).values(
+                fanned_out=not_(
+                    has_many_followers(
+                        ArticleModel.author_id,
+                        self._feed_followers_limit,
+                    ),
+                ),
+            ),
+        )
+
+        followed_articles = (
+            select(FollowerModel.follower_id, ArticleModel.id, ArticleModel.created_at)
+            .join(ArticleModel, ArticleModel.author_id == FollowerModel.following_id)
+            .where(ArticleModel.fanned_out)
+        )
+        query = insert(TimelineModel).from_select(
+            [
+                TimelineModel.follower_id,
+                TimelineModel.article_id,
+                TimelineModel.created_at,
+            ],
+            followed_articles,
+        )
+        await session.execute(query)
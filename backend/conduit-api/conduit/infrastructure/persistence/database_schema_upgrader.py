@@ -0,0 +1,62 @@
+from sqlalchemy import Connection, inspect, text
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.schema import CreateColumn
+
+from conduit.shared.infrastructure.persistence.database import Database
+
+
+class DatabaseSchemaUpgrader:
+    """Brings the schema of an existing database up to date with the models.
+
+    Missing tables and indexes are created, and missing columns are added,
+    so they need a server default unless they are nullable. Existing
+    columns are never changed nor dropped.
+    """
+
+    def __init__(self, db: Database, model_type: type[DeclarativeBase]) -> None:
+        self._db = db
+        self._model_type = model_type
+
+    async def upgrade_schema(self) -> bool:
+        """Returns whether tables or columns were added.
+
+        Added tables and columns hold derived data, which the repairer has
+        to recompute.
+        """
+
+        async with self._db.engine.begin() as conn:
+            return await conn.run_sync(self._upgrade_schema)
+
+    def _upgrade_schema(self, conn: Connection) -> bool:
+        metadata = self._model_type.metadata
+        inspector = inspect(conn)
+        existing_tables = set(inspector.get_table_names())
+        preparer = conn.dialect.identifier_preparer
+
+        upgraded = False
+        for table in metadata.sorted_tables:
+            if table.name not in existing_tables:
+                upgraded = True
+                continue
+
+            existing_columns = {
+                column["name"] for column in inspector.get_columns(table.name)
+            }
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_definition = CreateColumn(column).compile(dialect=conn.dialect)
+                conn.execute(
+                    text(
+                        f"ALTER TABLE {preparer.quote(table.name)} "
+                        f"ADD COLUMN {column_definition}",
+                    ),
+                )
+                upgraded = True
+
+        # Only creates the tables that are missing, with their indexes.
+        metadata.create_all(conn)
+        for table in metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+        return upgraded
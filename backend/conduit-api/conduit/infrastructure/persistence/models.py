@@ -1,10 +1,11 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from conduit.domain.users.user import User
+from conduit.infrastructure.persistence.compressed_text import CompressedText
 
 
 class Base(DeclarativeBase):
@@ -21,6 +22,9 @@ class UserModel(Base):
     image_url: Mapped[str] = mapped_column(nullable=True)
     created_at: Mapped[datetime]
     updated_at: Mapped[datetime] = mapped_column(nullable=True)
+    # Kept by the followers repository.
+    followers_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    following_count: Mapped[int] = mapped_column(default=0, server_default="0")
 
     def to_user(self) -> User:
         return User(
@@ -29,6 +33,8 @@ class UserModel(Base):
             username=self.username,
             bio=self.bio,
             image=self.image_url,
+            followers_count=self.followers_count,
+            following_count=self.following_count,
         )
 
 
@@ -39,6 +45,11 @@ class FollowerModel(Base):
     following_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
     created_at: Mapped[datetime]
 
+    # The primary key only serves lookups by follower.
+    __table_args__ = (
+        Index("ix_followers_following_id_follower_id", "following_id", "follower_id"),
+    )
+
 
 class TagModel(Base):
     __tablename__ = "tags"
@@ -46,6 +57,10 @@ class TagModel(Base):
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(nullable=False, unique=True)
     created_at: Mapped[datetime]
+    # Number of articles tagged with the tag, kept by the tags repository.
+    usage_count: Mapped[int] = mapped_column(default=0, server_default="0")
+
+    __table_args__ = (Index("ix_tags_usage_count_id", "usage_count", "id"),)
 
 
 class ArticleModel(Base):
@@ -56,10 +71,32 @@ class ArticleModel(Base):
     slug: Mapped[str] = mapped_column(nullable=False, unique=True)
     title: Mapped[str]
     description: Mapped[str]
-    body: Mapped[str]
+    # Only loaded by queries that render the body, see `undefer`.
+    body: Mapped[str] = mapped_column(
+        CompressedText,
+        deferred=True,
+        deferred_raiseload=True,
+    )
+    favorites_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    comments_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    # Whether the article was pushed to the timelines of the author's
+    # followers, decided once when it is published. The others are pulled.
+    fanned_out: Mapped[bool] = mapped_column(default=False, server_default="0")
     created_at: Mapped[datetime]
     updated_at: Mapped[datetime]
 
+    __table_args__ = (
+        Index("ix_articles_created_at_id", "created_at", "id"),
+        Index("ix_articles_author_id_created_at_id", "author_id", "created_at", "id"),
+        Index(
+            "ix_articles_pulled_author_id_created_at_id",
+            "author_id",
+            "created_at",
+            "id",
+            sqlite_where=text("fanned_out = 0"),
+        ),
+    )
+
 
 class ArticleTagModel(Base):
     __tablename__ = "articles_tags"
@@ -74,6 +111,10 @@ class ArticleTagModel(Base):
     )
     created_at: Mapped[datetime]
 
+    __table_args__ = (
+        Index("ix_articles_tags_tag_id_article_id", "tag_id", "article_id"),
+    )
+
 
 class FavoriteModel(Base):
     __tablename__ = "favorites"
@@ -88,6 +129,8 @@ class FavoriteModel(Base):
     )
     created_at: Mapped[datetime]
 
+    __table_args__ = (Index("ix_favorites_article_id", "article_id"),)
+
 
 class CommentModel(Base):
     __tablename__ = "comments"
@@ -104,3 +147,31 @@ class CommentModel(Base):
     body: Mapped[str] = mapped_column(nullable=False)
     created_at: Mapped[datetime]
     updated_at: Mapped[datetime]
+
+    __table_args__ = (
+        Index("ix_comments_article_id_created_at_id", "article_id", "created_at", "id"),
+    )
+
+
+class TimelineModel(Base):
+    __tablename__ = "timeline"
+
+    follower_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id"),
+        primary_key=True,
+    )
+    article_id: Mapped[int] = mapped_column(
+        ForeignKey("articles.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    created_at: Mapped[datetime]
+
+    __table_args__ = (
+        Index(
+            "ix_timeline_follower_id_created_at",
+            "follower_id",
+            "created_at",
+            "article_id",
+        ),
+        Index("ix_timeline_article_id", "article_id"),
+    )
@@ -1,23 +1,50 @@
-from typing import Any, Optional
-
-from sqlalchemy import delete, exists, func, insert, select, true, update
-from sqlalchemy.orm import aliased
+import functools
+import json
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Optional, Union
+
+from sqlalchemy import (
+    ColumnElement,
+    CompoundSelect,
+    Exists,
+    ScalarSelect,
+    Select,
+    and_,
+    delete,
+    exists,
+    func,
+    insert,
+    not_,
+    or_,
+    select,
+    true,
+    union_all,
+    update,
+)
 from sqlalchemy.sql.functions import count
 
+from conduit.application.common.paging import Cursor
 from conduit.application.common.repositories.articles import (
+    ArticlesPage,
     ArticlesRepository,
+    ArticleVersion,
     ListFilters,
+    VersionedArticle,
 )
 from conduit.domain.articles.articles import (
     Article,
     ArticleAuthor,
     ArticleID,
+    ArticleRef,
+    ArticleWithAuthor,
     AuthorID,
     BodylessArticleWithAuthor,
     NewArticleDetailsWithSlug,
     UpdateArticleFields,
 )
 from conduit.domain.users.user import UserID
+from conduit.infrastructure.persistence.article_slugs_cache import ArticleSlugsCache
 from conduit.infrastructure.persistence.models import (
     ArticleModel,
     ArticleTagModel,
@@ -26,17 +53,21 @@ from conduit.infrastructure.persistence.models import (
     TagModel,
     UserModel,
 )
+from conduit.infrastructure.persistence.repositories.timeline import (
+    has_many_followers,
+    select_timeline_articles,
+)
 from conduit.shared.infrastructure.current_time import CurrentTime
 from conduit.shared.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
 
-ArticleAliased = aliased(ArticleModel)
-
 
-def _model_to_entity(article_model: ArticleModel) -> Article:
+def _model_to_entity(article_model: ArticleModel, body: str) -> Article:
+    # The body is deferred, callers pass it when they already have it.
     return Article(
         id=article_model.id,
         author_id=article_model.author_id,
-        body=article_model.body,
+        body=body,
+        favorites_count=article_model.favorites_count,
         title=article_model.title,
         description=article_model.description,
         slug=article_model.slug,
@@ -45,16 +76,41 @@ def _model_to_entity(article_model: ArticleModel) -> Article:
     )
 
 
-def _to_bodyless_article(row: Any) -> BodylessArticleWithAuthor:
+def _to_bodyless_article(row: Any, tags: list[str]) -> BodylessArticleWithAuthor:
     return BodylessArticleWithAuthor(
+        id=row.id,
+        author_id=row.author_id,
+        slug=row.slug,
+        title=row.title,
+        description=row.description,
+        tags=tags,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        favorited=False,
+        favorites_count=row.favorites_count,
+        comments_count=row.comments_count,
+        author=ArticleAuthor(
+            username=row.username,
+            bio=row.bio,
+            image=row.image_url,
+            following=False,
+        ),
+    )
+
+
+def _to_article_with_author(row: Any) -> ArticleWithAuthor:
+    return ArticleWithAuthor(
+        id=row.id,
         slug=row.slug,
         title=row.title,
         description=row.description,
-        tags=row.tags.split(", ") if row.tags else [],
+        body=row.body,
+        tags=json.loads(row.tags),
         created_at=row.created_at,
         updated_at=row.updated_at,
         favorited=row.favorited,
         favorites_count=row.favorites_count,
+        comments_count=row.comments_count,
         author=ArticleAuthor(
             username=row.username,
             bio=row.bio,
@@ -64,16 +120,277 @@ def _to_bodyless_article(row: Any) -> BodylessArticleWithAuthor:
     )
 
 
+def _to_article_version(row: Any) -> ArticleVersion:
+    return ArticleVersion(
+        id=row.id,
+        updated_at=row.updated_at,
+        favorites_count=row.favorites_count,
+        comments_count=row.comments_count,
+        author_updated_at=row.author_updated_at,
+        favorited=row.favorited,
+        following=row.following,
+    )
+
+
+def _is_before_cursor(
+    created_at: ColumnElement[Any],
+    article_id: ColumnElement[Any],
+    cursor: Cursor,
+) -> ColumnElement[bool]:
+    return or_(
+        created_at < cursor.created_at,
+        and_(created_at == cursor.created_at, article_id < cursor.id),
+    )
+
+
+def _user_id_by_username(username: str) -> ScalarSelect[int]:
+    return select(UserModel.id).where(UserModel.username == username).scalar_subquery()
+
+
+def _filter_articles(filters: ListFilters) -> Select[tuple[int, datetime]]:
+    query = select(ArticleModel.id, ArticleModel.created_at)
+
+    if filters.tag is not None:
+        query = query.where(
+            exists()
+            .where(
+                ArticleTagModel.article_id == ArticleModel.id,
+                ArticleTagModel.tag_id == TagModel.id,
+                TagModel.name == filters.tag,
+            )
+            .correlate(ArticleModel),
+        )
+    if filters.author is not None:
+        query = query.where(
+            ArticleModel.author_id == _user_id_by_username(filters.author),
+        )
+    if filters.favorited is not None:
+        query = query.where(
+            exists()
+            .where(
+                FavoriteModel.article_id == ArticleModel.id,
+                FavoriteModel.user_id == _user_id_by_username(filters.favorited),
+            )
+            .correlate(ArticleModel),
+        )
+
+    return query
+
+
+def _is_author_followed_by(viewer_id: Optional[UserID]) -> Exists:
+    return exists().where(
+        FollowerModel.follower_id == viewer_id,
+        FollowerModel.following_id == ArticleModel.author_id,
+    )
+
+
+def _is_favorited_by(viewer_id: Optional[UserID]) -> Exists:
+    return exists().where(
+        FavoriteModel.user_id == viewer_id,
+        FavoriteModel.article_id == ArticleModel.id,
+    )
+
+
+def _select_article_with_author(
+    slug: str,
+    viewer_id: Optional[UserID],
+) -> Select[Any]:
+    """Selects an article with its author, tags and the viewer's flags."""
+
+    # Tags are aggregated from an ordered subquery to keep the order of their ids.
+    article_tags = (
+        select(TagModel.name)
+        .join(ArticleTagModel, ArticleTagModel.tag_id == TagModel.id)
+        .where(ArticleTagModel.article_id == ArticleModel.id)
+        .order_by(ArticleTagModel.tag_id.desc())
+        .correlate(ArticleModel)
+        .subquery("article_tags")
+    )
+
+    return (
+        select(
+            ArticleModel.id,
+            ArticleModel.slug,
+            ArticleModel.title,
+            ArticleModel.description,
+            ArticleModel.body,
+            ArticleModel.favorites_count,
+            ArticleModel.comments_count,
+            ArticleModel.created_at,
+            ArticleModel.updated_at,
+            UserModel.username,
+            UserModel.bio,
+            UserModel.image_url,
+            _is_author_followed_by(viewer_id).label("following"),
+            _is_favorited_by(viewer_id).label("favorited"),
+            select(func.json_group_array(article_tags.c.name))
+            .scalar_subquery()
+            .label("tags"),
+        )
+        .join(UserModel, UserModel.id == ArticleModel.author_id)
+        .where(ArticleModel.slug == slug)
+    )
+
+
+def _select_page_ids_with_total(
+    filtered_articles: Union[Select[tuple[int, datetime]], CompoundSelect],
+    limit: int,
+    offset: int,
+    cursor: Optional[Cursor],
+) -> Select[tuple[int, Optional[int]]]:
+    """Selects IDs of one page of filtered articles together with the total count.
+
+    Both the page and the total are computed from the same filtered articles, so
+    they can never disagree. The total is outer joined with the page to be returned
+    even when the page is empty.
+    """
+
+    # Inline the CTE into both of its uses, so the page is read in index order
+    # instead of sorting a materialized copy of every filtered article.
+    filtered = filtered_articles.cte("filtered_articles").prefix_with(
+        "NOT MATERIALIZED",
+    )
+
+    page: Union[Select[Any], CompoundSelect]
+    if isinstance(filtered_articles, CompoundSelect):
+        page = _select_merged_page(filtered_articles, cursor)
+    else:
+        page = select(filtered.c.id).order_by(
+            filtered.c.created_at.desc(),
+            filtered.c.id.desc(),
+        )
+        if cursor is not None:
+            page = page.where(
+                _is_before_cursor(filtered.c.created_at, filtered.c.id, cursor),
+            )
+    # Keyset pagination makes the offset redundant.
+    if cursor is None:
+        page = page.offset(offset)
+    page_ids = page.limit(limit).subquery("page_ids")
+
+    total = select(count().label("articles_count")).select_from(filtered).subquery()
+
+    # Sorting the joined rows would add a temporary B-tree, the few ids of the
+    # page are sorted once they are hydrated instead.
+    return select(total.c.articles_count, page_ids.c.id).select_from(
+        total.outerjoin(page_ids, true()),
+    )
+
+
+def _select_merged_page(
+    filtered_articles: CompoundSelect,
+    cursor: Optional[Cursor],
+) -> CompoundSelect:
+    """Orders the union of filtered articles without sorting all of it.
+
+    Ordering the compound itself, instead of a CTE over it, has SQLite merge
+    the ordered outputs of its parts, so a part read in index order stops
+    once the page is full. The cursor is applied to every part for the same
+    reason.
+    """
+
+    parts: list[Select[Any]] = [
+        part.where(
+            _is_before_cursor(
+                part.selected_columns.created_at,
+                part.selected_columns.id,
+                cursor,
+            ),
+        )
+        if cursor is not None
+        else part
+        for part in filtered_articles.selects
+        if isinstance(part, Select)
+    ]
+    merged = union_all(*parts)
+    return merged.order_by(
+        merged.selected_columns.created_at.desc(),
+        merged.selected_columns.id.desc(),
+    )
+
+
 class SQLiteArticlesRepository(ArticlesRepository):
-    def __init__(self, now: CurrentTime):
+    def __init__(
+        self,
+        now: CurrentTime,
+        feed_followers_limit: int,
+        slugs_cache: ArticleSlugsCache,
+    ):
         self._now = now
+        self._feed_followers_limit = feed_followers_limit
+        self._slugs_cache = slugs_cache
+
+    async def get_ref_by_slug(self, slug: str) -> Optional[ArticleRef]:
+        if cached_slug := self._slugs_cache.get(slug):
+            return cached_slug.article
+
+        session = SqlAlchemyUnitOfWork.get_current_session()
+        cache_version = self._slugs_cache.version
+
+        query = select(ArticleModel.id, ArticleModel.author_id).where(
+            ArticleModel.slug == slug,
+        )
+        result = await session.execute(query)
+        row = result.one_or_none()
+        article = ArticleRef(id=row.id, author_id=row.author_id) if row else None
+
+        self._slugs_cache.put(slug, article, cache_version)
+        return article
+
+    async def get_version_by_slug(
+        self,
+        slug: str,
+        viewer_id: Optional[UserID],
+    ) -> Optional[ArticleVersion]:
+        session = SqlAlchemyUnitOfWork.get_current_session()
+
+        query = (
+            select(
+                ArticleModel.id,
+                ArticleModel.updated_at,
+                ArticleModel.favorites_count,
+                ArticleModel.comments_count,
+                UserModel.updated_at.label("author_updated_at"),
+                _is_favorited_by(viewer_id).label("favorited"),
+                _is_author_followed_by(viewer_id).label("following"),
+            )
+            .join(UserModel, UserModel.id == ArticleModel.author_id)
+            .where(ArticleModel.slug == slug)
+        )
+        result = await session.execute(query)
+        if row := result.one_or_none():
+            return _to_article_version(row)
+        return None
 
-    async def get_by_slug_or_none(self, slug: str) -> Optional[Article]:
+    async def get_with_author_by_slug(
+        self,
+        slug: str,
+        viewer_id: Optional[UserID],
+    ) -> Optional[ArticleWithAuthor]:
         session = SqlAlchemyUnitOfWork.get_current_session()
 
-        query = select(ArticleModel).where(ArticleModel.slug == slug)
-        if article := await session.scalar(query):
-            return _model_to_entity(article)
+        query = _select_article_with_author(slug, viewer_id)
+        result = await session.execute(query)
+        if row := result.one_or_none():
+            return _to_article_with_author(row)
+        return None
+
+    async def get_versioned_by_slug(
+        self,
+        slug: str,
+        viewer_id: Optional[UserID],
+    ) -> Optional[VersionedArticle]:
+        session = SqlAlchemyUnitOfWork.get_current_session()
+
+        query = _select_article_with_author(slug, viewer_id).add_columns(
+            UserModel.updated_at.label("author_updated_at"),
+        )
+        result = await session.execute(query)
+        if row := result.one_or_none():
+            return VersionedArticle(
+                article=_to_article_with_author(row),
+                version=_to_article_version(row),
+            )
         return None
 
     async def add(
@@ -92,241 +409,102 @@ class SQLiteArticlesRepository(ArticlesRepository):
                 title=article_details.title,
                 description=article_details.description,
                 body=article_details.body,
+                fanned_out=self._is_fanned_out(author_id),
                 created_at=current_time,
                 updated_at=current_time,
             )
             .returning(ArticleModel)
         )
         result = await session.execute(query)
-        return _model_to_entity(result.scalar_one())
+        # The slug may be cached as unknown.
+        self._invalidate_slug(article_details.slug)
+        return _model_to_entity(result.scalar_one(), article_details.body)
 
-    async def list_by_followings(
+    async def add_many(
         self,
-        user_id: UserID,
-        limit: int,
-        offset: int,
-    ) -> list[BodylessArticleWithAuthor]:
+        author_id: AuthorID,
+        articles_details: list[NewArticleDetailsWithSlug],
+    ) -> list[Article]:
         session = SqlAlchemyUnitOfWork.get_current_session()
+        current_time = self._now()
+        fanned_out = self._is_fanned_out(author_id)
 
         query = (
-            select(
-                ArticleModel.id.label("id"),
-                ArticleModel.author_id.label("author_id"),
-                ArticleModel.slug.label("slug"),
-                ArticleModel.title.label("title"),
-                ArticleModel.description.label("description"),
-                ArticleModel.created_at.label("created_at"),
-                ArticleModel.updated_at.label("updated_at"),
-                UserModel.id.label("user_id"),
-                UserModel.username.label("username"),
-                UserModel.bio.label("bio"),
-                UserModel.image_url.label("image_url"),
-                true().label("following"),
-                # Subquery for favorites count.
-                select(func.count(FavoriteModel.article_id))
-                .where(FavoriteModel.article_id == ArticleModel.id)
-                .scalar_subquery()
-                .label("favorites_count"),
-                # Subquery to check if favorited by user with id `user_id`.
-                exists()
-                .where(
-                    (FavoriteModel.user_id == user_id)
-                    & (FavoriteModel.article_id == ArticleModel.id),
-                )
-                .label("favorited"),
-                # Concatenate tags.
-                func.group_concat(TagModel.name, ", ").label("tags"),
-            )
-            .join(
-                UserModel,
-                ArticleModel.author_id == UserModel.id,
-            )
-            .join(ArticleTagModel, ArticleTagModel.article_id == ArticleModel.id)
-            .join(TagModel, TagModel.id == ArticleTagModel.tag_id)
-            .filter(
-                UserModel.id.in_(
-                    select(FollowerModel.following_id)
-                    .where(FollowerModel.follower_id == user_id)
-                    .scalar_subquery(),
-                ),
-            )
-            .group_by(
-                ArticleModel.id,
-                ArticleModel.author_id,
-                ArticleModel.slug,
-                ArticleModel.title,
-                ArticleModel.description,
-                ArticleModel.created_at,
-                ArticleModel.updated_at,
-                UserModel.id,
-                UserModel.username,
-                UserModel.bio,
-                UserModel.image_url,
+            insert(ArticleModel)
+            .values(
+                [
+                    {
+                        "author_id": author_id,
+                        "slug": article_details.slug,
+                        "title": article_details.title,
+                        "description": article_details.description,
+                        "body": article_details.body,
+                        "fanned_out": fanned_out,
+                        "created_at": current_time,
+                        "updated_at": current_time,
+                    }
+                    for article_details in articles_details
+                ],
             )
+            .returning(ArticleModel)
         )
+        result = await session.scalars(query)
+        # SQLite returns rows of a multi-row insert in no particular order.
+        models_by_slug = {article_model.slug: article_model for article_model in result}
+        articles = [
+            _model_to_entity(
+                models_by_slug[article_details.slug],
+                article_details.body,
+            )
+            for article_details in articles_details
+        ]
+        for article in articles:
+            self._invalidate_slug(article.slug)
+        return articles
 
-        query = query.limit(limit).offset(offset)
-        articles = await session.execute(query)
-
-        return [_to_bodyless_article(row) for row in articles]
-
-    async def count_by_followings(self, user_id: UserID) -> int:
-        session = SqlAlchemyUnitOfWork.get_current_session()
-
-        query = select(count(ArticleModel.id)).join(
-            FollowerModel,
-            (FollowerModel.follower_id == user_id)
-            & (FollowerModel.following_id == ArticleModel.author_id),
+    async def list_by_followings(
+        self,
+        user_id: UserID,
+        limit: int,
+        offset: int,
+        cursor: Optional[Cursor],
+    ) -> ArticlesPage:
+        return await self._list_page(
+            select_timeline_articles(user_id),
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
         )
 
-        result = await session.execute(query)
-        return result.scalar_one()
-
     async def list_by_filters(
         self,
-        user_id: Optional[UserID],
         limit: int,
         offset: int,
         filters: ListFilters,
-    ) -> list[BodylessArticleWithAuthor]:
-        session = SqlAlchemyUnitOfWork.get_current_session()
-
-        tag = filters.tag
-        author = filters.author
-        favorited = filters.favorited
-        query = (
-            select(
-                ArticleModel.id.label("id"),
-                ArticleModel.author_id.label("author_id"),
-                ArticleModel.slug.label("slug"),
-                ArticleModel.title.label("title"),
-                ArticleModel.description.label("description"),
-                ArticleModel.created_at.label("created_at"),
-                ArticleModel.updated_at.label("updated_at"),
-                UserModel.id.label("user_id"),
-                UserModel.username.label("username"),
-                UserModel.bio.label("bio"),
-                UserModel.image_url.label("image_url"),
-                exists()
-                .where(
-                    (FollowerModel.follower_id == user_id)
-                    & (FollowerModel.following_id == ArticleModel.author_id),
-                )
-                .label("following"),
-                # Subquery for favorites count.
-                select(func.count())
-                .select_from(FavoriteModel)
-                .join(ArticleModel, ArticleModel.id == FavoriteModel.article_id)
-                .where(FavoriteModel.article_id == ArticleModel.id)
-                .scalar_subquery()
-                .label("favorites_count"),
-                # Subquery to check if favorited by user with id `user_id`.
-                select(FavoriteModel.article_id)
-                .where(
-                    (FavoriteModel.user_id == user_id)
-                    & (FavoriteModel.article_id == ArticleModel.id),
-                )
-                .exists()
-                .correlate(FavoriteModel, ArticleModel)
-                .label("favorited"),
-                # Concatenate tags.
-                func.group_concat(TagModel.name, ", ").label("tags"),
-            )
-            .outerjoin(
-                UserModel,
-                ArticleModel.author_id == UserModel.id,
-            )
-            .outerjoin(ArticleTagModel, ArticleTagModel.article_id == ArticleModel.id)
-            .outerjoin(FavoriteModel, FavoriteModel.article_id == ArticleModel.id)
-            .outerjoin(TagModel, TagModel.id == ArticleTagModel.tag_id)
-            .group_by(
-                ArticleModel.id,
-                ArticleModel.author_id,
-                ArticleModel.slug,
-                ArticleModel.title,
-                ArticleModel.description,
-                ArticleModel.created_at,
-                ArticleModel.updated_at,
-                UserModel.id,
-                UserModel.username,
-                UserModel.bio,
-                UserModel.image_url,
-            )
-            .order_by(ArticleModel.created_at.desc())
+        cursor: Optional[Cursor],
+    ) -> ArticlesPage:
+        return await self._list_page(
+            _filter_articles(filters),
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
         )
 
-        if tag is not None:
-            query = query.where(
-                select(TagModel.id)
-                .select_from(TagModel)
-                .join(ArticleTagModel, ArticleTagModel.tag_id == TagModel.id)
-                .join(ArticleAliased, ArticleAliased.id == ArticleTagModel.article_id)
-                .where(ArticleAliased.id == ArticleModel.id, TagModel.name == tag)
-                .exists(),
-            )
-        if author is not None:
-            query = query.where(UserModel.username == author)
-        if favorited is not None:
-            query = query.where(
-                FavoriteModel.user_id
-                == select(UserModel.id)
-                .where(UserModel.username == favorited)
-                .scalar_subquery(),
-            )
-
-        query = query.limit(limit).offset(offset)
-        articles = await session.execute(query)
-
-        return [_to_bodyless_article(row) for row in articles]
-
-    async def count_by_filters(
-        self,
-        tag: Optional[str],
-        author: Optional[str],
-        favorited: Optional[str],
-    ) -> int:
-        session = SqlAlchemyUnitOfWork.get_current_session()
-
-        query = select(count(ArticleModel.id))
-
-        if tag is not None:
-            query = query.join(
-                ArticleTagModel,
-                ArticleTagModel.article_id == ArticleModel.id,
-            ).where(
-                ArticleTagModel.tag_id
-                == select(TagModel.id).where(TagModel.name == tag).scalar_subquery(),
-            )
-
-        if author is not None:
-            query = query.join(UserModel, UserModel.id == ArticleModel.author_id).where(
-                UserModel.username == author,
-            )
-
-        if favorited is not None:
-            query = query.join(
-                FavoriteModel,
-                FavoriteModel.article_id == ArticleModel.id,
-            ).where(
-                FavoriteModel.user_id
-                == select(UserModel.id)
-                .where(UserModel.username == favorited)
-                .scalar_subquery(),
-            )
-
-        result = await session.execute(query)
-        return result.scalar_one()
-
     async def delete_by_id(self, article_id: ArticleID) -> None:
         session = SqlAlchemyUnitOfWork.get_current_session()
-        query = delete(ArticleModel).where(ArticleModel.id == article_id)
-        await session.execute(query)
+        query = (
+            delete(ArticleModel)
+            .where(ArticleModel.id == article_id)
+            .returning(ArticleModel.slug)
+        )
+        if slug := await session.scalar(query):
+            self._invalidate_slug(slug)
 
     async def update_by_slug(
         self,
         slug: str,
         update_fields: UpdateArticleFields,
-    ) -> Article:
+    ) -> str:
         session = SqlAlchemyUnitOfWork.get_current_session()
         current_time = self._now()
 
@@ -336,7 +514,7 @@ class SQLiteArticlesRepository(ArticlesRepository):
             .values(
                 updated_at=current_time,
             )
-            .returning(ArticleModel)
+            .returning(ArticleModel.slug)
         )
 
         if update_fields.title is not None:
@@ -350,4 +528,109 @@ class SQLiteArticlesRepository(ArticlesRepository):
             query = query.values(body=update_fields.body)
 
         result = await session.execute(query)
-        return _model_to_entity(result.scalar_one())
+        new_slug = result.scalar_one()
+        self._invalidate_slug(slug)
+        if new_slug != slug:
+            # The new slug may be cached as unknown.
+            self._invalidate_slug(new_slug)
+        return new_slug
+
+    def _is_fanned_out(self, author_id: AuthorID) -> ColumnElement[bool]:
+        """Decides whether new articles of the author are pushed to timelines.
+
+        Authors with too many followers have their articles pulled instead.
+        """
+
+        return not_(has_many_followers(author_id, self._feed_followers_limit))
+
+    async def _list_page(
+        self,
+        filtered_articles: Union[Select[tuple[int, datetime]], CompoundSelect],
+        limit: int,
+        offset: int,
+        cursor: Optional[Cursor],
+    ) -> ArticlesPage:
+        """Lists articles in two phases to keep the work bounded by the page size.
+
+        The first statement applies only the filters and the ordering to pick
+        the page of IDs. The page is then hydrated with one `IN` query per
+        relation. The viewer's flags are left for the caller to set.
+        """
+
+        session = SqlAlchemyUnitOfWork.get_current_session()
+
+        query = _select_page_ids_with_total(
+            filtered_articles,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+        result = await session.execute(query)
+        rows = result.all()
+
+        # The total is outer joined with the page, so an empty page still has a row.
+        article_ids = [row.id for row in rows if row.id is not None]
+        return ArticlesPage(
+            articles=await self._hydrate(article_ids),
+            articles_count=rows[0].articles_count,
+            read_count=len(article_ids),
+        )
+
+    async def _hydrate(
+        self,
+        article_ids: list[ArticleID],
+    ) -> list[BodylessArticleWithAuthor]:
+        if not article_ids:
+            return []
+
+        session = SqlAlchemyUnitOfWork.get_current_session()
+
+        articles_query = (
+            select(
+                ArticleModel.id,
+                ArticleModel.author_id,
+                ArticleModel.slug,
+                ArticleModel.title,
+                ArticleModel.description,
+                ArticleModel.favorites_count,
+                ArticleModel.comments_count,
+                ArticleModel.created_at,
+                ArticleModel.updated_at,
+                UserModel.username,
+                UserModel.bio,
+                UserModel.image_url,
+            )
+            .join(UserModel, UserModel.id == ArticleModel.author_id)
+            .where(ArticleModel.id.in_(article_ids))
+        )
+        articles = {row.id: row for row in await session.execute(articles_query)}
+
+        tags_query = (
+            select(ArticleTagModel.article_id, TagModel.name)
+            .join(TagModel, TagModel.id == ArticleTagModel.tag_id)
+            .where(ArticleTagModel.article_id.in_(article_ids))
+            .order_by(ArticleTagModel.article_id.desc(), ArticleTagModel.tag_id.desc())
+        )
+        tags: defaultdict[ArticleID, list[str]] = defaultdict(list)
+        for article_id, tag in await session.execute(tags_query):
+            tags[article_id].append(tag)
+
+        # An article deleted since its page was read is skipped. The join with
+        # the total does not keep the order of the page, it is sorted again.
+        return sorted(
+            (
+                _to_bodyless_article(articles[article_id], tags[article_id])
+                for article_id in article_ids
+                if article_id in articles
+            ),
+            key=lambda article: (article.created_at, article.id),
+            reverse=True,
+        )
+
+    def _invalidate_slug(self, slug: str) -> None:
+        self._slugs_cache.invalidate(slug)
+        # Until the change is committed, a concurrent read can cache the slug
+        # again, so it is invalidated once more after the commit.
+        SqlAlchemyUnitOfWork.get_current_unit_of_work().add_commit_hook(
+            functools.partial(self._slugs_cache.invalidate, slug),
+        )
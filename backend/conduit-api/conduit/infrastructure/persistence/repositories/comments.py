@@ -1,11 +1,23 @@
-from typing import final
+from typing import Any, Optional, final
 
-from sqlalchemy import delete, insert, select
+from sqlalchemy import Row, and_, delete, exists, insert, or_, select, update
 
+from conduit.application.common.paging import Cursor
 from conduit.application.common.repositories.comments import CommentsRepository
 from conduit.domain.articles.articles import ArticleID
-from conduit.domain.comments.comments import Comment, NewComment
-from conduit.infrastructure.persistence.models import CommentModel
+from conduit.domain.comments.comments import (
+    Comment,
+    CommentAuthor,
+    CommentWithAuthor,
+    NewComment,
+)
+from conduit.domain.users.user import UserID
+from conduit.infrastructure.persistence.models import (
+    ArticleModel,
+    CommentModel,
+    FollowerModel,
+    UserModel,
+)
 from conduit.shared.infrastructure.current_time import CurrentTime
 from conduit.shared.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
 
@@ -21,6 +33,21 @@ def _to_domain_comment(comment: CommentModel) -> Comment:
     )
 
 
+def _to_comment_with_author(row: Row[Any]) -> CommentWithAuthor:
+    return CommentWithAuthor(
+        id=row.id,
+        body=row.body,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        author=CommentAuthor(
+            username=row.username,
+            bio=row.bio,
+            image=row.image_url,
+            following=row.following,
+        ),
+    )
+
+
 @final
 class SQLiteCommentsRepository(CommentsRepository):
     def __init__(self, now: CurrentTime) -> None:
@@ -44,14 +71,52 @@ class SQLiteCommentsRepository(CommentsRepository):
 
         result = await session.execute(query)
         created_comment = result.scalar_one()
+
+        # Keep the denormalized counter in the same transaction as the comment.
+        await self._add_to_comments_count(new_comment.article_id, 1)
         return _to_domain_comment(created_comment)
 
-    async def list_by_article_id(self, article_id: ArticleID) -> list[Comment]:
+    async def list_with_authors_by_article_id(
+        self,
+        article_id: ArticleID,
+        limit: int,
+        cursor: Optional[Cursor],
+        viewer_id: Optional[UserID],
+    ) -> list[CommentWithAuthor]:
         session = SqlAlchemyUnitOfWork.get_current_session()
-        query = select(CommentModel).where(CommentModel.article_id == article_id)
+        is_author_followed = exists().where(
+            FollowerModel.follower_id == viewer_id,
+            FollowerModel.following_id == CommentModel.author_id,
+        )
+        query = (
+            select(
+                CommentModel.id,
+                CommentModel.body,
+                CommentModel.created_at,
+                CommentModel.updated_at,
+                UserModel.username,
+                UserModel.bio,
+                UserModel.image_url,
+                is_author_followed.label("following"),
+            )
+            .join(UserModel, UserModel.id == CommentModel.author_id)
+            .where(CommentModel.article_id == article_id)
+            .order_by(CommentModel.created_at.desc(), CommentModel.id.desc())
+            .limit(limit)
+        )
+        if cursor is not None:
+            query = query.where(
+                or_(
+                    CommentModel.created_at < cursor.created_at,
+                    and_(
+                        CommentModel.created_at == cursor.created_at,
+                        CommentModel.id < cursor.id,
+                    ),
+                ),
+            )
 
-        comments = await session.scalars(query)
-        return [_to_domain_comment(comment) for comment in comments]
+        result = await session.execute(query)
+        return [_to_comment_with_author(row) for row in result]
 
     async def get(self, comment_id: ArticleID) -> Comment:
         session = SqlAlchemyUnitOfWork.get_current_session()
@@ -62,5 +127,20 @@ class SQLiteCommentsRepository(CommentsRepository):
 
     async def delete(self, comment_id: ArticleID) -> None:
         session = SqlAlchemyUnitOfWork.get_current_session()
-        query = delete(CommentModel).where(CommentModel.id == comment_id)
+        query = (
+            delete(CommentModel)
+            .where(CommentModel.id == comment_id)
+            .returning(CommentModel.article_id)
+        )
+        article_id = await session.scalar(query)
+        if article_id is not None:
+            await self._add_to_comments_count(article_id, -1)
+
+    async def _add_to_comments_count(self, article_id: ArticleID, delta: int) -> None:
+        session = SqlAlchemyUnitOfWork.get_current_session()
+        query = (
+            update(ArticleModel)
+            .where(ArticleModel.id == article_id)
+            .values(comments_count=ArticleModel.comments_count + delta)
+        )
         await session.execute(query)
@@ -1,10 +1,16 @@
-from sqlalchemy import delete, exists, insert, select
-from sqlalchemy.sql.functions import count
+from collections import Counter
+from typing import Optional
 
-from conduit.application.common.repositories.favorites import FavoritesRepository
+from sqlalchemy import case, delete, select, tuple_, update
+from sqlalchemy.dialects.sqlite import insert
+
+from conduit.application.common.repositories.favorites import (
+    FavoriteChange,
+    FavoritesRepository,
+)
 from conduit.domain.articles.articles import ArticleID
 from conduit.domain.users.user import UserID
-from conduit.infrastructure.persistence.models import FavoriteModel
+from conduit.infrastructure.persistence.models import ArticleModel, FavoriteModel
 from conduit.shared.infrastructure.current_time import CurrentTime
 from conduit.shared.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
 
@@ -13,47 +19,132 @@ class SQLiteFavoritesRepository(FavoritesRepository):
     def __init__(self, now: CurrentTime) -> None:
         self._now = now
 
-    async def add(self, article_id: UserID, user_id: ArticleID) -> None:
+    async def add(self, article_id: ArticleID, user_id: UserID) -> Optional[int]:
         session = SqlAlchemyUnitOfWork.get_current_session()
         current_time = self._now()
 
-        query = insert(FavoriteModel).values(
-            article_id=article_id,
-            user_id=user_id,
-            created_at=current_time,
+        query = (
+            insert(FavoriteModel)
+            .values(
+                article_id=article_id,
+                user_id=user_id,
+                created_at=current_time,
+            )
+            .on_conflict_do_nothing()
+            .returning(FavoriteModel.article_id)
         )
+        added_favorite = await session.scalar(query)
+        if added_favorite is None:
+            return None
 
-        await session.execute(query)
-
-    async def delete(self, article_id: ArticleID, user_id: ArticleID) -> None:
-        session = SqlAlchemyUnitOfWork.get_current_session()
-
-        query = delete(FavoriteModel).where(
-            FavoriteModel.article_id == article_id,
-            FavoriteModel.user_id == user_id,
+        # Keep the denormalized counter in the same transaction as the favorite.
+        counter_query = (
+            update(ArticleModel)
+            .where(ArticleModel.id == article_id)
+            .values(favorites_count=ArticleModel.favorites_count + 1)
+            .returning(ArticleModel.favorites_count)
         )
+        return await session.scalar(counter_query)
 
-        await session.execute(query)
-
-    async def exists(self, article_id: ArticleID, user_id: ArticleID) -> bool:
+    async def delete(self, article_id: ArticleID, user_id: UserID) -> Optional[int]:
         session = SqlAlchemyUnitOfWork.get_current_session()
 
         query = (
-            exists()
+            delete(FavoriteModel)
             .where(
                 FavoriteModel.article_id == article_id,
                 FavoriteModel.user_id == user_id,
             )
-            .select()
+            .returning(FavoriteModel.article_id)
         )
+        deleted_favorite = await session.scalar(query)
+        if deleted_favorite is None:
+            return None
 
-        result = await session.execute(query)
-        return result.scalar_one()
+        counter_query = (
+            update(ArticleModel)
+            .where(ArticleModel.id == article_id)
+            .values(favorites_count=ArticleModel.favorites_count - 1)
+            .returning(ArticleModel.favorites_count)
+        )
+        return await session.scalar(counter_query)
 
-    async def count(self, article_id: ArticleID) -> int:
+    async def apply_changes(self, changes: list[FavoriteChange]) -> None:
         session = SqlAlchemyUnitOfWork.get_current_session()
+        current_time = self._now()
+
+        existing_article_ids = set(
+            await session.scalars(
+                select(ArticleModel.id).where(
+                    ArticleModel.id.in_({change.article_id for change in changes}),
+                ),
+            ),
+        )
+        changes = [
+            change for change in changes if change.article_id in existing_article_ids
+        ]
+        added = [change for change in changes if change.favorited]
+        deleted = [change for change in changes if not change.favorited]
 
-        query = select(count()).where(FavoriteModel.article_id == article_id)
+        favorites_count_deltas: Counter[ArticleID] = Counter()
+        if added:
+            query = (
+                insert(FavoriteModel)
+                .values(
+                    [
+                        {
+                            "article_id": change.article_id,
+                            "user_id": change.user_id,
+                            "created_at": current_time,
+                        }
+                        for change in added
+                    ],
+                )
+                .on_conflict_do_nothing()
+                .returning(FavoriteModel.article_id)
+            )
+            favorites_count_deltas.update(await session.scalars(query))
+        if deleted:
+            query = (
+                delete(FavoriteModel)
+                .where(
+                    tuple_(FavoriteModel.user_id, FavoriteModel.article_id).in_(
+                        [(change.user_id, change.article_id) for change in deleted],
+                    ),
+                )
+                .returning(FavoriteModel.article_id)
+            )
+            favorites_count_deltas.subtract(await session.scalars(query))
+
+        changed_counts = {
+            article_id: delta
+            for article_id, delta in favorites_count_deltas.items()
+            if delta != 0
+        }
+        if not changed_counts:
+            return
+
+        counter_query = (
+            update(ArticleModel)
+            .where(ArticleModel.id.in_(changed_counts))
+            .values(
+                favorites_count=ArticleModel.favorites_count
+                + case(changed_counts, value=ArticleModel.id),
+            )
+        )
+        await session.execute(counter_query)
+
+    async def list_favorited(
+        self,
+        user_id: UserID,
+        article_ids: list[ArticleID],
+    ) -> list[ArticleID]:
+        session = SqlAlchemyUnitOfWork.get_current_session()
+
+        query = select(FavoriteModel.article_id).where(
+            FavoriteModel.user_id == user_id,
+            FavoriteModel.article_id.in_(article_ids),
+        )
 
-        result = await session.execute(query)
-        return result.scalar_one()
+        result = await session.scalars(query)
+        return list(result)
@@ -1,8 +1,8 @@
-from sqlalchemy import delete, exists, insert, select
+from sqlalchemy import case, delete, exists, insert, select, update
 
 from conduit.application.common.repositories.followers import FollowersRepository
 from conduit.domain.users.user import UserID
-from conduit.infrastructure.persistence.models import FollowerModel
+from conduit.infrastructure.persistence.models import FollowerModel, UserModel
 from conduit.shared.infrastructure.current_time import CurrentTime
 from conduit.shared.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
 
@@ -37,13 +37,42 @@ class SQLiteFollowersRepository(FollowersRepository):
         )
 
         await session.execute(query)
+        await self._add_to_counts(follower_id, following_id, 1)
 
     async def delete(self, follower_id: UserID, following_id: UserID) -> None:
         session = SqlAlchemyUnitOfWork.get_current_session()
 
-        query = delete(FollowerModel).where(
-            FollowerModel.follower_id == follower_id,
-            FollowerModel.following_id == following_id,
+        query = (
+            delete(FollowerModel)
+            .where(
+                FollowerModel.follower_id == follower_id,
+                FollowerModel.following_id == following_id,
+            )
+            .returning(FollowerModel.follower_id)
+        )
+
+        if await session.scalar(query) is not None:
+            await self._add_to_counts(follower_id, following_id, -1)
+
+    async def _add_to_counts(
+        self,
+        follower_id: UserID,
+        following_id: UserID,
+        delta: int,
+    ) -> None:
+        """Updates the counters of both users with a single statement."""
+
+        session = SqlAlchemyUnitOfWork.get_current_session()
+
+        query = (
+            update(UserModel)
+            .where(UserModel.id.in_((follower_id, following_id)))
+            .values(
+                followers_count=UserModel.followers_count
+                + case({following_id: delta}, value=UserModel.id, else_=0),
+                following_count=UserModel.following_count
+                + case({follower_id: delta}, value=UserModel.id, else_=0),
+            )
         )
 
         await session.execute(query)
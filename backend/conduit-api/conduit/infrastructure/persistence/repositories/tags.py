@@ -1,12 +1,20 @@
+import functools
+from collections import Counter
+from collections.abc import Mapping
 from typing import final
 
-from sqlalchemy import select
+from sqlalchemy import case, delete, func, select, update
 from sqlalchemy.dialects.sqlite import insert
 
 from conduit.application.common.repositories.tags import TagsRepository
+from conduit.application.tags.services.tags_cache import TagsCache
 from conduit.domain.articles.articles import ArticleID
 from conduit.domain.tags.tag import Tag
 from conduit.infrastructure.persistence.models import ArticleTagModel, TagModel
+from conduit.infrastructure.persistence.tag_ids_cache import TagIdsCache
+from conduit.infrastructure.persistence.tag_suggestions_index import (
+    TagSuggestionsIndex,
+)
 from conduit.shared.infrastructure.current_time import CurrentTime
 from conduit.shared.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
 
@@ -20,8 +28,17 @@ def _tag_model_to_tag(model: TagModel) -> Tag:
 
 @final
 class SQLiteTagsRepository(TagsRepository):
-    def __init__(self, now: CurrentTime) -> None:
+    def __init__(
+        self,
+        now: CurrentTime,
+        tag_ids_cache: TagIdsCache,
+        tags_cache: TagsCache,
+        tag_suggestions_index: TagSuggestionsIndex,
+    ) -> None:
         self._now = now
+        self._tag_ids_cache = tag_ids_cache
+        self._tags_cache = tags_cache
+        self._tag_suggestions_index = tag_suggestions_index
 
     async def get_all_tags(self) -> list[Tag]:
         session = SqlAlchemyUnitOfWork.get_current_session()
@@ -29,10 +46,80 @@ class SQLiteTagsRepository(TagsRepository):
         tags = await session.scalars(query)
         return [_tag_model_to_tag(tag_model) for tag_model in tags]
 
+    async def list_popular(self, limit: int) -> list[Tag]:
+        session = SqlAlchemyUnitOfWork.get_current_session()
+        query = (
+            select(TagModel)
+            .where(TagModel.usage_count > 0)
+            .order_by(TagModel.usage_count.desc(), TagModel.id.desc())
+            .limit(limit)
+        )
+        tags = await session.scalars(query)
+        return [_tag_model_to_tag(tag_model) for tag_model in tags]
+
+    async def suggest(self, prefix: str, limit: int) -> list[Tag]:
+        if self._tag_suggestions_index.enabled:
+            return self._tag_suggestions_index.suggest(prefix, limit)
+
+        # Unlike the index, only folds the case of ASCII letters.
+        session = SqlAlchemyUnitOfWork.get_current_session()
+        query = (
+            select(TagModel)
+            .where(TagModel.name.istartswith(prefix, autoescape=True))
+            .order_by(TagModel.usage_count.desc(), TagModel.name)
+            .limit(limit)
+        )
+        tags = await session.scalars(query)
+        return [_tag_model_to_tag(tag_model) for tag_model in tags]
+
+    async def get_version(self) -> int:
+        session = SqlAlchemyUnitOfWork.get_current_session()
+        # Ids of new tags only grow, the maximum is read from the primary key.
+        query = select(func.coalesce(func.max(TagModel.id), 0))
+        result = await session.execute(query)
+        return result.scalar_one()
+
     async def add_many(self, article_id: int, tags: list[str]) -> list[Tag]:
         if len(tags) == 0:
             return []
 
+        tags_to_return = await self._upsert(tags)
+        await self._link([(article_id, tag.id) for tag in tags_to_return])
+        return tags_to_return
+
+    async def add_to_articles(
+        self,
+        tags_by_article_id: dict[ArticleID, list[str]],
+    ) -> None:
+        """Links each article to its tags, upserting the union of all tags once."""
+
+        tag_names = {tag for tags in tags_by_article_id.values() for tag in tags}
+        if not tag_names:
+            return
+
+        tag_ids = {tag.name: tag.id for tag in await self._upsert(list(tag_names))}
+        await self._link(
+            [
+                (article_id, tag_ids[tag])
+                for article_id, tags in tags_by_article_id.items()
+                for tag in tags
+            ],
+        )
+
+    async def _upsert(self, tags: list[str]) -> list[Tag]:
+        """Resolves tag names to tags, inserting only the ones not cached."""
+
+        known_tags: list[Tag] = []
+        new_tags: list[str] = []
+        for tag in tags:
+            tag_id = self._tag_ids_cache.get(tag)
+            if tag_id is None:
+                new_tags.append(tag)
+            else:
+                known_tags.append(Tag(id=tag_id, name=tag))
+        if not new_tags:
+            return known_tags
+
         session = SqlAlchemyUnitOfWork.get_current_session()
         current_time = self._now()
         insert_query = (
@@ -43,34 +130,80 @@ class SQLiteTagsRepository(TagsRepository):
                         "name": tag,
                         "created_at": current_time,
                     }
-                    for tag in tags
+                    for tag in new_tags
                 ],
             )
             .on_conflict_do_nothing()
+            .returning(TagModel.id)
         )
-        await session.execute(insert_query)
+        inserted_ids = (await session.scalars(insert_query)).all()
+        if inserted_ids:
+            self._tags_cache.invalidate_after_commit()
 
-        select_query = select(TagModel).where(TagModel.name.in_(tags))
+        select_query = select(TagModel).where(TagModel.name.in_(new_tags))
         selected_tags = await session.scalars(select_query)
-        tags_to_return = [_tag_model_to_tag(tag_model) for tag_model in selected_tags]
+        uncached_tags = [_tag_model_to_tag(tag_model) for tag_model in selected_tags]
+        # Tags inserted by a transaction that is rolled back must not be cached.
+        unit_of_work = SqlAlchemyUnitOfWork.get_current_unit_of_work()
+        unit_of_work.add_commit_hook(
+            functools.partial(self._tag_ids_cache.put_many, uncached_tags),
+        )
+        unit_of_work.add_commit_hook(
+            functools.partial(self._tag_suggestions_index.put_many, uncached_tags),
+        )
 
+        return known_tags + uncached_tags
+
+    async def _link(self, article_tag_ids: list[tuple[ArticleID, int]]) -> None:
+        session = SqlAlchemyUnitOfWork.get_current_session()
+        current_time = self._now()
         link_query = (
             insert(ArticleTagModel)
             .values(
                 [
                     {
                         "article_id": article_id,
-                        "tag_id": tag.id,
+                        "tag_id": tag_id,
                         "created_at": current_time,
                     }
-                    for tag in tags_to_return
+                    for article_id, tag_id in article_tag_ids
                 ],
             )
             .on_conflict_do_nothing()
+            .returning(ArticleTagModel.tag_id)
         )
-        await session.execute(link_query)
+        linked_tag_ids = await session.scalars(link_query)
+        await self._add_to_usage_counts(Counter(linked_tag_ids))
 
-        return tags_to_return
+    async def delete_by_article_id(self, article_id: ArticleID) -> None:
+        session = SqlAlchemyUnitOfWork.get_current_session()
+        query = (
+            delete(ArticleTagModel)
+            .where(ArticleTagModel.article_id == article_id)
+            .returning(ArticleTagModel.tag_id)
+        )
+        unlinked_tag_ids = await session.scalars(query)
+        await self._add_to_usage_counts(
+            {tag_id: -1 for tag_id in unlinked_tag_ids},
+        )
+
+    async def _add_to_usage_counts(self, deltas: Mapping[int, int]) -> None:
+        if not deltas:
+            return
+
+        session = SqlAlchemyUnitOfWork.get_current_session()
+        query = (
+            update(TagModel)
+            .where(TagModel.id.in_(deltas))
+            .values(usage_count=TagModel.usage_count + case(deltas, value=TagModel.id))
+        )
+        await session.execute(query)
+        SqlAlchemyUnitOfWork.get_current_unit_of_work().add_commit_hook(
+            functools.partial(
+                self._tag_suggestions_index.add_to_usage_counts,
+                dict(deltas),
+            ),
+        )
 
     async def list_by_article_id(self, article_id: ArticleID) -> list[Tag]:
         session = SqlAlchemyUnitOfWork.get_current_session()
@@ -81,7 +214,9 @@ class SQLiteTagsRepository(TagsRepository):
                 (ArticleTagModel.article_id == article_id)
                 & (ArticleTagModel.tag_id == TagModel.id),
             )
-            .order_by(TagModel.created_at.desc())
+            # Tag ids grow with their creation time and, unlike it, are read
+            # in order from the primary key of `articles_tags`.
+            .order_by(ArticleTagModel.tag_id.desc())
         )
 
         tags = await session.scalars(query)
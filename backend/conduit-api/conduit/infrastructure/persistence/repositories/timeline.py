@@ -0,0 +1,149 @@
+from typing import Union, final
+
+from sqlalchemy import (
+    CompoundSelect,
+    Exists,
+    delete,
+    exists,
+    literal,
+    not_,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import InstrumentedAttribute, aliased
+
+from conduit.application.common.repositories.timeline import TimelineRepository
+from conduit.domain.articles.articles import Article, ArticleID
+from conduit.domain.users.user import UserID
+from conduit.infrastructure.persistence.models import (
+    ArticleModel,
+    FollowerModel,
+    TimelineModel,
+)
+from conduit.shared.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
+
+
+def has_many_followers(
+    user_id: Union[UserID, InstrumentedAttribute[int]],
+    followers_limit: int,
+) -> Exists:
+    """Checks whether a user has more followers than the limit.
+
+    Scans at most `followers_limit + 1` index entries instead of counting
+    all followers.
+    """
+
+    # Aliased so that it can be correlated with an outer query on followers.
+    followers = aliased(FollowerModel)
+    return (
+        select(followers.follower_id)
+        .where(followers.following_id == user_id)
+        .limit(1)
+        .offset(followers_limit)
+        .exists()
+    )
+
+
+def select_timeline_articles(follower_id: UserID) -> CompoundSelect:
+    """Selects `(id, created_at)` of all articles in the personal feed.
+
+    Fanned out articles are read from the materialized timeline, the others
+    are pulled from the articles of the followed authors. Each article is
+    read from one side only, whatever the author's followers count became
+    after it was published.
+    """
+
+    fanned_out_articles = select(
+        TimelineModel.article_id.label("id"),
+        TimelineModel.created_at.label("created_at"),
+    ).where(TimelineModel.follower_id == follower_id)
+
+    pulled_articles = select(
+        ArticleModel.id,
+        ArticleModel.created_at,
+    ).where(
+        ArticleModel.author_id.in_(
+            select(FollowerModel.following_id).where(
+                FollowerModel.follower_id == follower_id,
+            ),
+        ),
+        # Renders as the condition of the partial index on pulled articles.
+        not_(ArticleModel.fanned_out),
+    )
+
+    return union_all(fanned_out_articles, pulled_articles)
+
+
+@final
+class SQLiteTimelineRepository(TimelineRepository):
+    async def fan_out(self, article: Article) -> None:
+        session = SqlAlchemyUnitOfWork.get_current_session()
+
+        followers = select(
+            FollowerModel.follower_id,
+            literal(article.id),
+            literal(article.created_at, type_=TimelineModel.created_at.type),
+        ).where(
+            FollowerModel.following_id == article.author_id,
+            exists().where(ArticleModel.id == article.id, ArticleModel.fanned_out),
+        )
+        query = (
+            insert(TimelineModel)
+            .from_select(
+                [
+                    TimelineModel.follower_id,
+                    TimelineModel.article_id,
+                    TimelineModel.created_at,
+                ],
+                followers,
+            )
+            .on_conflict_do_nothing()
+        )
+
+        await session.execute(query)
+
+    async def backfill(self, follower_id: UserID, following_id: UserID) -> None:
+        session = SqlAlchemyUnitOfWork.get_current_session()
+
+        articles = select(
+            literal(follower_id),
+            ArticleModel.id,
+            ArticleModel.created_at,
+        ).where(
+            ArticleModel.author_id == following_id,
+            ArticleModel.fanned_out,
+        )
+        query = (
+            insert(TimelineModel)
+            .from_select(
+                [
+                    TimelineModel.follower_id,
+                    TimelineModel.article_id,
+                    TimelineModel.created_at,
+                ],
+                articles,
+            )
+            .on_conflict_do_nothing()
+        )
+
+        await session.execute(query)
+
+    async def prune(self, follower_id: UserID, following_id: UserID) -> None:
+        session = SqlAlchemyUnitOfWork.get_current_session()
+
+        query = delete(TimelineModel).where(
+            TimelineModel.follower_id == follower_id,
+            TimelineModel.article_id.in_(
+                select(ArticleModel.id).where(ArticleModel.author_id == following_id),
+            ),
+        )
+
+        await session.execute(query)
+
+    async def delete_by_article_id(self, article_id: ArticleID) -> None:
+        session = SqlAlchemyUnitOfWork.get_current_session()
+
+        query = delete(TimelineModel).where(TimelineModel.article_id == article_id)
+
+        await session.execute(query)
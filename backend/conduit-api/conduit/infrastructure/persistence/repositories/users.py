@@ -1,18 +1,30 @@
 from typing import Optional, final
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Exists, exists, select
 
-from conduit.application.common.repositories.users import UsersRepository
+from conduit.application.common.repositories.users import (
+    ProfileVersion,
+    UsersRepository,
+    VersionedProfile,
+)
+from conduit.domain.profiles.profile import Profile
 from conduit.domain.users.user import (
     User,
     UserID,
 )
-from conduit.infrastructure.persistence.models import UserModel
+from conduit.infrastructure.persistence.models import FollowerModel, UserModel
 from conduit.shared.infrastructure.current_time import CurrentTime
 from conduit.shared.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
 
 
+def _is_followed_by(viewer_id: Optional[UserID]) -> Exists:
+    return exists().where(
+        FollowerModel.follower_id == viewer_id,
+        FollowerModel.following_id == UserModel.id,
+    )
+
+
 @final
 class SQLiteUsersRepository(UsersRepository):
     def __init__(
@@ -45,9 +57,58 @@ class SQLiteUsersRepository(UsersRepository):
             return user_model.to_user()
         return None
 
-    async def list_by_user_ids(self, user_ids: list[int]) -> list[User]:
+    async def get_profile_version_by_username(
+        self,
+        username: str,
+        viewer_id: Optional[UserID],
+    ) -> Optional[ProfileVersion]:
+        session = SqlAlchemyUnitOfWork.get_current_session()
+
+        query = select(
+            UserModel.updated_at,
+            _is_followed_by(viewer_id).label("following"),
+            UserModel.followers_count,
+            UserModel.following_count,
+        ).where(UserModel.username == username)
+        result = await session.execute(query)
+        if row := result.one_or_none():
+            return ProfileVersion(
+                updated_at=row.updated_at,
+                following=row.following,
+                followers_count=row.followers_count,
+                following_count=row.following_count,
+            )
+        return None
+
+    async def get_versioned_profile_by_username(
+        self,
+        username: str,
+        viewer_id: Optional[UserID],
+    ) -> Optional[VersionedProfile]:
         session = SqlAlchemyUnitOfWork.get_current_session()
 
-        query = select(UserModel).where(UserModel.id.in_(user_ids))
-        users = await session.scalars(query)
-        return [user.to_user() for user in users]
+        query = select(
+            UserModel,
+            _is_followed_by(viewer_id).label("following"),
+        ).where(UserModel.username == username)
+        result = await session.execute(query)
+        if row := result.one_or_none():
+            user_model = row.UserModel
+            return VersionedProfile(
+                profile=Profile(
+                    id=user_model.id,
+                    username=user_model.username,
+                    bio=user_model.bio,
+                    image=user_model.image_url,
+                    following=row.following,
+                    followers_count=user_model.followers_count,
+                    following_count=user_model.following_count,
+                ),
+                version=ProfileVersion(
+                    updated_at=user_model.updated_at,
+                    following=row.following,
+                    followers_count=user_model.followers_count,
+                    following_count=user_model.following_count,
+                ),
+            )
+        return None
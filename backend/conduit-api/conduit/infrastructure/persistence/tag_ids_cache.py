@@ -0,0 +1,46 @@
+from collections.abc import Iterable
+from typing import Optional, final
+
+from sqlalchemy import select
+
+from conduit.domain.tags.tag import Tag
+from conduit.infrastructure.persistence.models import TagModel
+from conduit.shared.infrastructure.persistence.database import Database
+
+
+@final
+class TagIdsCache:
+    """Process-wide map of tag names to their ids.
+
+    Tags are never renamed or deleted, so a cached id stays valid and the
+    map is only ever added to, until it holds `max_size` names.
+    """
+
+    def __init__(self, *, db: Database, enabled: bool, max_size: int) -> None:
+        self._db = db
+        self._enabled = enabled
+        self._max_size = max_size
+        self._ids: dict[str, int] = {}
+
+    def get(self, name: str) -> Optional[int]:
+        return self._ids.get(name)
+
+    def put_many(self, tags: Iterable[Tag]) -> None:
+        if not self._enabled:
+            return
+
+        for tag in tags:
+            if len(self._ids) >= self._max_size:
+                return
+            self._ids[tag.name] = tag.id
+
+    async def warm_up(self) -> None:
+        """Loads the existing tags, up to `max_size` of them."""
+
+        if not self._enabled:
+            return
+
+        query = select(TagModel.id, TagModel.name).limit(self._max_size)
+        async with self._db.create_session() as session:
+            result = await session.execute(query)
+            self.put_many(Tag(id=tag_id, name=name) for tag_id, name in result)
@@ -0,0 +1,180 @@
+import bisect
+import heapq
+import logging
+import sys
+import unicodedata
+from collections.abc import Iterable, Mapping
+from typing import Final, Optional, final
+
+from sqlalchemy import select
+
+from conduit.domain.tags.tag import Tag
+from conduit.infrastructure.persistence.models import TagModel
+from conduit.shared.infrastructure.persistence.database import Database
+
+DEFAULT_LOGGER: Final = logging.getLogger(__name__)
+
+# Most used tags kept ranked for each prefix matching more tags than that.
+RANKED_TAGS_PER_PREFIX: Final = 50
+
+
+def _normalize_tag_name(name: str) -> str:
+    """Folds the case and the compatibility forms, like full-width letters, of a name."""
+
+    return unicodedata.normalize("NFKC", name).casefold()
+
+
+def _prefix_end(prefix: str) -> Optional[str]:
+    """Returns the smallest string after every string starting with `prefix`.
+
+    `None` if there is none, when the prefix is made of the last code point.
+    """
+
+    stripped = prefix.rstrip(chr(sys.maxunicode))
+    if not stripped:
+        return None
+    return stripped[:-1] + chr(ord(stripped[-1]) + 1)
+
+
+@final
+class TagSuggestionsIndex:
+    """Process-wide sorted array of normalized tag names with their usage.
+
+    Prefixes are found with a binary search, then the matching tags are
+    ranked by usage without touching the database. Prefixes matching many
+    tags, like single letters, keep their ranking until one of their tags
+    changes.
+    Loaded at startup and kept up to date by the tags repository once its
+    writes are committed, until it holds `max_size` tags.
+    """
+
+    def __init__(
+        self,
+        *,
+        db: Database,
+        enabled: bool,
+        max_size: int,
+        logger: logging.Logger = DEFAULT_LOGGER,
+    ) -> None:
+        self._db = db
+        self._enabled = enabled
+        self._max_size = max_size
+        self._logger = logger
+        self._keys: list[str] = []
+        self._tags: list[Tag] = []
+        self._usage_counts: dict[int, int] = {}
+        self._keys_by_tag_id: dict[int, str] = {}
+        self._ranked_tags: dict[str, list[Tag]] = {}
+        self._full = False
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def suggest(self, prefix: str, limit: int) -> list[Tag]:
+        """Returns tags starting with the prefix, the most used first."""
+
+        key = _normalize_tag_name(prefix)
+        if not key:
+            return []
+
+        start = bisect.bisect_left(self._keys, key)
+        key_end = _prefix_end(key)
+        end = (
+            len(self._keys)
+            if key_end is None
+            else bisect.bisect_left(self._keys, key_end, lo=start)
+        )
+        if end - start <= RANKED_TAGS_PER_PREFIX or limit > RANKED_TAGS_PER_PREFIX:
+            return self._rank(start, end, limit)
+
+        ranked_tags = self._ranked_tags.get(key)
+        if ranked_tags is None:
+            ranked_tags = self._ranked_tags[key] = self._rank(
+                start,
+                end,
+                RANKED_TAGS_PER_PREFIX,
+            )
+        return ranked_tags[:limit]
+
+    def put_many(self, tags: Iterable[Tag], usage_count: int = 0) -> None:
+        if not self._enabled:
+            return
+
+        for tag in tags:
+            if tag.id in self._usage_counts:
+                continue
+            if len(self._tags) >= self._max_size:
+                if not self._full:
+                    self._full = True
+                    self._logger.warning(
+                        "Tag suggestions index is full with %d tags, "
+                        "new tags are not suggested",
+                        len(self._tags),
+                    )
+                return
+
+            key = _normalize_tag_name(tag.name)
+            position = bisect.bisect_right(self._keys, key)
+            self._keys.insert(position, key)
+            self._tags.insert(position, tag)
+            self._usage_counts[tag.id] = usage_count
+            self._keys_by_tag_id[tag.id] = key
+            self._forget_rankings_of(key)
+
+    def add_to_usage_counts(self, deltas: Mapping[int, int]) -> None:
+        for tag_id, delta in deltas.items():
+            if tag_id in self._usage_counts:
+                self._usage_counts[tag_id] += delta
+                self._forget_rankings_of(self._keys_by_tag_id[tag_id])
+
+    async def warm_up(self) -> None:
+        """Loads the most used tags, up to `max_size` of them."""
+
+        if not self._enabled:
+            return
+
+        query = (
+            select(TagModel.id, TagModel.name, TagModel.usage_count)
+            .order_by(TagModel.usage_count.desc(), TagModel.id.desc())
+            .limit(self._max_size)
+        )
+        async with self._db.create_session() as session:
+            result = await session.execute(query)
+            new_rows = [row for row in result if row.id not in self._usage_counts]
+        rows = new_rows[: self._max_size - len(self._tags)]
+
+        # Sorting once is far cheaper than inserting every tag at its place.
+        entries = sorted(
+            [
+                *zip(self._keys, self._tags),
+                *(
+                    (_normalize_tag_name(row.name), Tag(id=row.id, name=row.name))
+                    for row in rows
+                ),
+            ],
+            key=lambda entry: entry[0],
+        )
+        self._keys = [key for key, _ in entries]
+        self._tags = [tag for _, tag in entries]
+        self._usage_counts.update((row.id, row.usage_count) for row in rows)
+        self._keys_by_tag_id = {tag.id: key for key, tag in entries}
+        self._ranked_tags.clear()
+
+    def _forget_rankings_of(self, key: str) -> None:
+        """Drops the rankings of the prefixes of `key`, the only ones it is in."""
+
+        for end in range(1, len(key) + 1):
+            self._ranked_tags.pop(key[:end], None)
+
+    def _rank(self, start: int, end: int, limit: int) -> list[Tag]:
+        # Equally used tags are suggested in alphabetical order.
+        positions = heapq.nlargest(
+            limit,
+            range(start, end),
+            key=lambda position: (
+                self._usage_counts[self._tags[position].id],
+                -position,
+            ),
+        )
+        return [self._tags[position] for position in positions]
@@ -0,0 +1,20 @@
+import asyncio
+
+from conduit.containers import Container
+
+
+async def repair_database(container: Container) -> None:
+    """Upgrades the schema of an existing database and backfills its counters."""
+
+    database = container.db()
+    db_schema_upgrader = container.db_schema_upgrader()
+    db_repairer = container.db_repairer()
+    try:
+        await db_schema_upgrader.upgrade_schema()
+        await db_repairer.repair_database()
+    finally:
+        await database.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(repair_database(Container()))
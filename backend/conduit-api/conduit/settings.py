@@ -8,6 +8,12 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Settings(BaseSettings):
     debug: bool = False
     database_url: str = ""
+    # SQLite only enforces foreign keys, and so `ON DELETE CASCADE`, when
+    # asked to on every connection.
+    database_foreign_keys_enabled: bool = True
+    # Lets the maintenance give free pages back to the file system, only
+    # takes effect on databases created after it is set.
+    database_incremental_vacuum_enabled: bool = True
 
     jwt_secret_key: str = Field(default="", min_length=16)
     jwt_algorithm: str = Field(default="HS256", min_length=1)
@@ -15,6 +21,59 @@ class Settings(BaseSettings):
 
     rabbitmq_url: str = ""
 
+    # Authors with more followers are not fanned out to the timeline table.
+    # Their articles are pulled into the feed at read time instead.
+    feed_fanout_followers_limit: int = Field(default=10_000, ge=0)
+
+    # Pages of `GET /articles` are shared by all viewers, their flags are set
+    # per request.
+    articles_list_cache_enabled: bool = True
+    articles_list_cache_ttl_seconds: float = Field(default=30, gt=0)
+    articles_list_cache_max_size: int = Field(default=1024, gt=0)
+
+    # The list of all tags of `GET /tags`, rebuilt once new tags are added.
+    tags_cache_enabled: bool = True
+    tags_cache_ttl_seconds: float = Field(default=60, gt=0)
+
+    # Slugs resolved to article and author ids, for endpoints that only need
+    # to find or check the ownership of an article.
+    article_slugs_cache_enabled: bool = True
+    article_slugs_cache_max_size: int = Field(default=10_000, gt=0)
+    article_slugs_cache_ttl_seconds: float = Field(default=300, gt=0)
+    article_slugs_cache_negative_ttl_seconds: float = Field(default=5, gt=0)
+
+    # Tag names resolved to ids, loaded at startup so that known tags are
+    # linked to new articles without touching the tags table.
+    tag_ids_cache_enabled: bool = True
+    tag_ids_cache_max_size: int = Field(default=100_000, gt=0)
+
+    # Tag names suggested by prefix from memory, loaded at startup. Suggested
+    # from the database when disabled.
+    tag_suggestions_enabled: bool = True
+    tag_suggestions_max_size: int = Field(default=100_000, gt=0)
+
+    # Favorites are buffered in memory and written in batches, the requests
+    # of at most one flush interval are lost if the process dies.
+    favorites_buffer_enabled: bool = False
+    favorites_buffer_flush_interval_seconds: float = Field(default=0.5, gt=0)
+    favorites_buffer_max_pending: int = Field(default=1000, gt=0)
+    favorites_buffer_max_size: int = Field(default=10_000, gt=0)
+
+    # Periodically purges rows orphaned by deleted articles, refreshes the
+    # query planner statistics and gives free pages back to the file system.
+    database_maintenance_enabled: bool = True
+    database_maintenance_interval_seconds: float = Field(default=3600, gt=0)
+    database_maintenance_batch_size: int = Field(default=1000, gt=0)
+    database_maintenance_vacuum_pages: int = Field(default=1000, gt=0)
+
+    # Latencies and errors of every use case and repository method, served
+    # on `GET /metrics` and written as JSON to the dump path on shutdown.
+    metrics_enabled: bool = True
+    # The endpoint requires no authentication, only enable it where it is not
+    # reachable from outside.
+    metrics_endpoint_enabled: bool = False
+    metrics_dump_path: str = ""
+
     model_config = SettingsConfigDict(
         env_file=(".env", ".env.prod"),
     )
@@ -32,6 +91,15 @@ class Settings(BaseSettings):
             "echo": self.debug,
         }
 
+    @property
+    def sqlite_pragmas(self) -> list[str]:
+        pragmas: list[str] = []
+        if self.database_foreign_keys_enabled:
+            pragmas.append("foreign_keys = ON")
+        if self.database_incremental_vacuum_enabled:
+            pragmas.append("auto_vacuum = INCREMENTAL")
+        return pragmas
+
 
 @functools.cache
 def get_settings() -> Settings:
@@ -0,0 +1,158 @@
+from collections.abc import AsyncGenerator
+
+import pytest
+from httpx import AsyncClient, Response, codes
+from sqlalchemy import delete
+
+from conduit.api.endpoints.articles.contract import MAX_ARTICLES_PER_BATCH
+from conduit.infrastructure.persistence.database_seeder import Database
+from conduit.infrastructure.persistence.models import ArticleTagModel
+from tests.integration.conftest import AddToDb, TagModelFactory
+
+BATCH_URL = "/articles/batch"
+
+
+def _new_article(title: str, tags: list[str]) -> dict[str, object]:
+    return {
+        "title": title,
+        "description": "Article description",
+        "body": "Article body",
+        "tagList": tags,
+    }
+
+
+@pytest.fixture
+async def existing_tags(
+    tag_model_factory: TagModelFactory,
+    add_to_db: AddToDb,
+    test_db: Database,
+) -> AsyncGenerator[None, None]:
+    """Adds the tags up front, so that they and their links are removed."""
+
+    tags = [
+        tag_model_factory(name="python"),
+        tag_model_factory(name="sqlite"),
+    ]
+    await add_to_db(*tags)
+    yield
+    async with test_db.create_session() as session:
+        await session.execute(
+            delete(ArticleTagModel).where(
+                ArticleTagModel.tag_id.in_([tag.id for tag in tags]),
+            ),
+        )
+        await session.commit()
+
+
+@pytest.fixture
+async def batch_response(
+    existing_tags: None,
+    registered_user_client: AsyncClient,
+) -> AsyncGenerator[Response, None]:
+    del existing_tags
+    response = await registered_user_client.post(
+        BATCH_URL,
+        json={
+            "articles": [
+                _new_article("First article", ["python", "sqlite"]),
+                _new_article("Second article", ["python"]),
+                _new_article("Third article", []),
+            ],
+        },
+    )
+    yield response
+    for article in response.json()["articles"]:
+        await registered_user_client.delete(f"/articles/{article['slug']}")
+
+
+@pytest.mark.anyio
+async def test_returns_201_created(batch_response: Response) -> None:
+    assert batch_response.status_code == codes.CREATED
+
+
+@pytest.mark.anyio
+async def test_returns_articles_in_request_order(batch_response: Response) -> None:
+    articles = batch_response.json()["articles"]
+
+    assert [article["title"] for article in articles] == [
+        "First article",
+        "Second article",
+        "Third article",
+    ]
+    assert [sorted(article["tagList"]) for article in articles] == [
+        ["python", "sqlite"],
+        ["python"],
+        [],
+    ]
+    assert batch_response.json()["articlesCount"] == len(articles)
+
+
+@pytest.mark.anyio
+async def test_created_articles_are_linked_to_tags(
+    batch_response: Response,
+    registered_user_client: AsyncClient,
+) -> None:
+    del batch_response
+
+    response = await registered_user_client.get("/articles", params={"tag": "python"})
+
+    assert sorted(article["title"] for article in response.json()["articles"]) == [
+        "First article",
+        "Second article",
+    ]
+
+
+@pytest.mark.anyio
+async def test_created_article_can_be_read_by_slug(
+    batch_response: Response,
+    registered_user_client: AsyncClient,
+) -> None:
+    slug = batch_response.json()["articles"][0]["slug"]
+
+    response = await registered_user_client.get(f"/articles/{slug}")
+
+    assert sorted(response.json()["article"]["tagList"]) == ["python", "sqlite"]
+
+
+@pytest.mark.anyio
+async def test_rejects_too_many_articles(
+    registered_user_client: AsyncClient,
+) -> None:
+    response = await registered_user_client.post(
+        BATCH_URL,
+        json={
+            "articles": [
+                _new_article(f"Article {i}", [])
+                for i in range(MAX_ARTICLES_PER_BATCH + 1)
+            ],
+        },
+    )
+
+    assert response.status_code == codes.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.anyio
+async def test_rejects_empty_batch(registered_user_client: AsyncClient) -> None:
+    response = await registered_user_client.post(BATCH_URL, json={"articles": []})
+
+    assert response.status_code == codes.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.anyio
+async def test_rejects_whole_batch_with_an_invalid_article(
+    registered_user_client: AsyncClient,
+) -> None:
+    invalid_article = _new_article("Invalid article", [])
+    del invalid_article["body"]
+
+    response = await registered_user_client.post(
+        BATCH_URL,
+        json={"articles": [_new_article("Valid article", []), invalid_article]},
+    )
+
+    assert response.status_code == codes.UNPROCESSABLE_ENTITY
+    list_response = await registered_user_client.get(
+        "/articles",
+        params={"author": "admin"},
+    )
+    assert list_response.json()["articles"] == []
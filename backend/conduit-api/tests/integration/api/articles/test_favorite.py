@@ -0,0 +1,152 @@
+import uuid
+from collections.abc import AsyncGenerator
+
+import pytest
+from httpx import AsyncClient, Response, codes
+
+from conduit.infrastructure.persistence.models import UserModel
+from tests.integration.conftest import (
+    AddToDb,
+    ArticleModelFactory,
+    UserModelFactory,
+)
+
+
+@pytest.fixture(autouse=True)
+async def setup_article(
+    user_model_factory: UserModelFactory,
+    article_model_factory: ArticleModelFactory,
+    add_to_db: AddToDb,
+) -> None:
+    author = user_model_factory(user_id=uuid.uuid4(), username="article_author")
+    await add_to_db(author)
+    await add_to_db(
+        article_model_factory(author_id=author.id, slug="favorite-article"),
+    )
+
+
+class TestWhenFavoriteArticle:
+    @pytest.fixture
+    async def favorite_response(
+        self,
+        registered_user_client: AsyncClient,
+    ) -> AsyncGenerator[Response, None]:
+        url = "/articles/favorite-article/favorite"
+        yield await registered_user_client.post(url)
+        await registered_user_client.delete(url)
+
+    @pytest.mark.anyio
+    async def test_returns_200_ok(self, favorite_response: Response) -> None:
+        assert favorite_response.status_code == codes.OK
+
+    @pytest.mark.anyio
+    async def test_returns_favorited_article(self, favorite_response: Response) -> None:
+        article = favorite_response.json()["article"]
+        assert article["favorited"] is True
+        assert article["favoritesCount"] == 1
+
+    @pytest.mark.anyio
+    async def test_article_has_stored_favorites_count(
+        self,
+        favorite_response: Response,
+        registered_user_client: AsyncClient,
+    ) -> None:
+        del favorite_response
+
+        response = await registered_user_client.get("/articles/favorite-article")
+
+        article = response.json()["article"]
+        assert article["favorited"] is True
+        assert article["favoritesCount"] == 1
+
+    @pytest.mark.anyio
+    async def test_articles_list_has_stored_favorites_count(
+        self,
+        favorite_response: Response,
+        registered_user_client: AsyncClient,
+        registered_user: UserModel,
+    ) -> None:
+        del favorite_response
+
+        response = await registered_user_client.get(
+            "/articles",
+            params={"favorited": registered_user.username},
+        )
+
+        [article] = response.json()["articles"]
+        assert article["favoritesCount"] == 1
+
+
+class TestWhenUnfavoriteArticle:
+    @pytest.fixture
+    async def unfavorite_response(
+        self,
+        registered_user_client: AsyncClient,
+    ) -> Response:
+        url = "/articles/favorite-article/favorite"
+        await registered_user_client.post(url)
+        return await registered_user_client.delete(url)
+
+    @pytest.mark.anyio
+    async def test_returns_unfavorited_article(
+        self,
+        unfavorite_response: Response,
+    ) -> None:
+        article = unfavorite_response.json()["article"]
+        assert article["favorited"] is False
+        assert article["favoritesCount"] == 0
+
+    @pytest.mark.anyio
+    async def test_article_has_stored_favorites_count(
+        self,
+        unfavorite_response: Response,
+        registered_user_client: AsyncClient,
+    ) -> None:
+        del unfavorite_response
+
+        response = await registered_user_client.get("/articles/favorite-article")
+
+        assert response.json()["article"]["favoritesCount"] == 0
+
+
+class TestWhenFavoriteArticleTwice:
+    @pytest.fixture
+    async def favorite_response(
+        self,
+        registered_user_client: AsyncClient,
+    ) -> AsyncGenerator[Response, None]:
+        url = "/articles/favorite-article/favorite"
+        await registered_user_client.post(url)
+        yield await registered_user_client.post(url)
+        await registered_user_client.delete(url)
+
+    @pytest.mark.anyio
+    async def test_returns_200_ok(self, favorite_response: Response) -> None:
+        assert favorite_response.status_code == codes.OK
+
+    @pytest.mark.anyio
+    async def test_counts_favorite_once(self, favorite_response: Response) -> None:
+        article = favorite_response.json()["article"]
+        assert article["favorited"] is True
+        assert article["favoritesCount"] == 1
+
+
+class TestWhenUnfavoriteNotFavoritedArticle:
+    @pytest.fixture
+    async def unfavorite_response(
+        self,
+        registered_user_client: AsyncClient,
+    ) -> Response:
+        return await registered_user_client.delete(
+            "/articles/favorite-article/favorite",
+        )
+
+    @pytest.mark.anyio
+    async def test_returns_200_ok(self, unfavorite_response: Response) -> None:
+        assert unfavorite_response.status_code == codes.OK
+
+    @pytest.mark.anyio
+    async def test_keeps_favorites_count(self, unfavorite_response: Response) -> None:
+        article = unfavorite_response.json()["article"]
+        assert article["favorited"] is False
+        assert article["favoritesCount"] == 0
@@ -0,0 +1,183 @@
+import uuid
+from collections.abc import AsyncGenerator
+
+import pytest
+from dependency_injector import providers
+from httpx import AsyncClient
+from sqlalchemy import delete, select
+from sqlalchemy.sql.functions import count
+
+from conduit.application.articles.services.favorites_buffer import FavoritesBuffer
+from conduit.containers import Container
+from conduit.infrastructure.persistence.database_seeder import Database
+from conduit.infrastructure.persistence.models import (
+    ArticleModel,
+    FavoriteModel,
+    UserModel,
+)
+from tests.integration.conftest import (
+    AddToDb,
+    ArticleModelFactory,
+    UserModelFactory,
+)
+
+ARTICLE_URL = "/articles/buffered-article"
+DELETED_ARTICLE_ID = 1_000_000
+MAX_SIZE = 100
+
+
+@pytest.fixture
+def max_size() -> int:
+    return MAX_SIZE
+
+
+@pytest.fixture
+async def favorites_buffer(
+    max_size: int,
+    test_container: Container,
+    test_db: Database,
+) -> AsyncGenerator[FavoritesBuffer, None]:
+    favorites_buffer = FavoritesBuffer(
+        uow_factory=test_container.uow_factory(),
+        favorites_repository=test_container.favorites_repository(),
+        articles_list_cache=test_container.articles_list_cache(),
+        enabled=True,
+        flush_interval_seconds=60,
+        max_pending=MAX_SIZE,
+        max_size=max_size,
+    )
+    with test_container.favorites_buffer.override(  # type: ignore
+        providers.Object(favorites_buffer),
+    ):
+        yield favorites_buffer
+
+    async with test_db.session() as session:
+        await session.execute(delete(FavoriteModel))
+
+
+@pytest.fixture(autouse=True)
+async def article(
+    user_model_factory: UserModelFactory,
+    article_model_factory: ArticleModelFactory,
+    add_to_db: AddToDb,
+) -> ArticleModel:
+    author = user_model_factory(user_id=uuid.uuid4(), username="article_author")
+    await add_to_db(author)
+    article = article_model_factory(author_id=author.id, slug="buffered-article")
+    await add_to_db(article)
+    return article
+
+
+async def _stored_favorites(test_db: Database) -> tuple[int, int]:
+    async with test_db.session() as session:
+        favorites = await session.scalar(select(count()).select_from(FavoriteModel))
+        favorites_count = await session.scalar(
+            select(ArticleModel.favorites_count).where(
+                ArticleModel.slug == "buffered-article",
+            ),
+        )
+    return favorites or 0, favorites_count or 0
+
+
+@pytest.mark.anyio
+async def test_favorite_is_visible_before_it_is_stored(
+    registered_user_client: AsyncClient,
+    favorites_buffer: FavoritesBuffer,
+    test_db: Database,
+) -> None:
+    del favorites_buffer
+
+    favorite_response = await registered_user_client.post(f"{ARTICLE_URL}/favorite")
+    get_response = await registered_user_client.get(ARTICLE_URL)
+
+    for response in (favorite_response, get_response):
+        article = response.json()["article"]
+        assert article["favorited"] is True
+        assert article["favoritesCount"] == 1
+    assert await _stored_favorites(test_db) == (0, 0)
+
+
+@pytest.mark.anyio
+async def test_flush_stores_favorite_and_count(
+    registered_user_client: AsyncClient,
+    favorites_buffer: FavoritesBuffer,
+    test_db: Database,
+) -> None:
+    await registered_user_client.post(f"{ARTICLE_URL}/favorite")
+
+    await favorites_buffer.flush()
+
+    assert await _stored_favorites(test_db) == (1, 1)
+    response = await registered_user_client.get(ARTICLE_URL)
+    assert response.json()["article"]["favoritesCount"] == 1
+
+
+@pytest.mark.anyio
+async def test_flush_stores_unfavorite_and_count(
+    registered_user_client: AsyncClient,
+    favorites_buffer: FavoritesBuffer,
+    test_db: Database,
+) -> None:
+    await registered_user_client.post(f"{ARTICLE_URL}/favorite")
+    await favorites_buffer.flush()
+
+    response = await registered_user_client.delete(f"{ARTICLE_URL}/favorite")
+    await favorites_buffer.flush()
+
+    assert response.json()["article"]["favoritesCount"] == 0
+    assert await _stored_favorites(test_db) == (0, 0)
+
+
+@pytest.mark.anyio
+async def test_favorite_and_unfavorite_cancel_out(
+    registered_user_client: AsyncClient,
+    favorites_buffer: FavoritesBuffer,
+    test_db: Database,
+) -> None:
+    await registered_user_client.post(f"{ARTICLE_URL}/favorite")
+    response = await registered_user_client.delete(f"{ARTICLE_URL}/favorite")
+
+    assert response.json()["article"]["favorited"] is False
+    assert response.json()["article"]["favoritesCount"] == 0
+    await favorites_buffer.flush()
+    assert await _stored_favorites(test_db) == (0, 0)
+
+
+@pytest.mark.anyio
+async def test_flush_skips_favorites_of_deleted_articles(
+    registered_user: UserModel,
+    favorites_buffer: FavoritesBuffer,
+    test_db: Database,
+) -> None:
+    favorites_buffer.put(
+        article_id=DELETED_ARTICLE_ID,
+        user_id=registered_user.id,
+        stored=False,
+        favorited=True,
+    )
+
+    await favorites_buffer.flush()
+
+    assert await _stored_favorites(test_db) == (0, 0)
+    assert favorites_buffer.favorited(DELETED_ARTICLE_ID, registered_user.id) is None
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("max_size", [1])
+async def test_full_buffer_stores_new_favorites_right_away(
+    registered_user: UserModel,
+    registered_user_client: AsyncClient,
+    favorites_buffer: FavoritesBuffer,
+    test_db: Database,
+) -> None:
+    assert favorites_buffer.put(
+        article_id=DELETED_ARTICLE_ID,
+        user_id=registered_user.id,
+        stored=False,
+        favorited=True,
+    )
+
+    response = await registered_user_client.post(f"{ARTICLE_URL}/favorite")
+
+    assert response.json()["article"]["favoritesCount"] == 1
+    assert await _stored_favorites(test_db) == (1, 1)
@@ -0,0 +1,225 @@
+import uuid
+from collections.abc import AsyncGenerator, Callable
+
+import pytest
+from httpx import AsyncClient, Response
+from sqlalchemy import select
+from sqlalchemy.sql.functions import count
+
+from conduit.infrastructure.persistence.database_seeder import Database
+from conduit.infrastructure.persistence.models import (
+    TimelineModel,
+    UserModel,
+)
+from conduit.settings import Settings
+from tests.integration.conftest import (
+    AddToDb,
+    ApiClientFactory,
+    ArticleModelFactory,
+    TokenFactory,
+    UserModelFactory,
+)
+
+FOLLOW_URL = "/profiles/feed_author/follow"
+FOLLOWERS_LIMIT = 10
+
+
+def _feed_slugs(feed_response: Response) -> list[str]:
+    return [article["slug"] for article in feed_response.json()["articles"]]
+
+
+async def _count_timeline_rows(test_db: Database, follower: UserModel) -> int:
+    async with test_db.session() as session:
+        query = select(count()).where(TimelineModel.follower_id == follower.id)
+        return await session.scalar(query) or 0
+
+
+@pytest.fixture
+async def author(
+    user_model_factory: UserModelFactory,
+    article_model_factory: ArticleModelFactory,
+    add_to_db: AddToDb,
+) -> UserModel:
+    author = user_model_factory(user_id=uuid.uuid4(), username="feed_author")
+    await add_to_db(author)
+    await add_to_db(article_model_factory(author_id=author.id, slug="old-article"))
+    return author
+
+
+@pytest.fixture
+async def author_client(
+    author: UserModel,
+    test_client_factory: ApiClientFactory,
+    generate_token: TokenFactory,
+) -> AsyncGenerator[AsyncClient, None]:
+    async with test_client_factory() as client:
+        client.headers["Authorization"] = f"Token {generate_token(author)}"
+        yield client
+
+
+@pytest.fixture
+async def follow_author(
+    author: UserModel,
+    registered_user_client: AsyncClient,
+) -> AsyncGenerator[None, None]:
+    del author
+
+    await registered_user_client.post(FOLLOW_URL)
+    yield
+    await registered_user_client.delete(FOLLOW_URL)
+
+
+@pytest.fixture
+async def new_article_slug(
+    author_client: AsyncClient,
+) -> AsyncGenerator[str, None]:
+    response = await author_client.post(
+        "/articles",
+        json={
+            "article": {
+                "title": "New article",
+                "description": "Article description",
+                "body": "Article body",
+            },
+        },
+    )
+    slug = response.json()["article"]["slug"]
+    yield slug
+    await author_client.delete(f"/articles/{slug}")
+
+
+@pytest.mark.usefixtures("follow_author")
+class TestWhenFollowingAuthor:
+    @pytest.mark.anyio
+    async def test_feed_has_articles_written_before_follow(
+        self,
+        registered_user_client: AsyncClient,
+    ) -> None:
+        feed_response = await registered_user_client.get("/articles/feed")
+
+        assert _feed_slugs(feed_response) == ["old-article"]
+        assert feed_response.json()["articlesCount"] == 1
+
+    @pytest.mark.anyio
+    async def test_feed_has_articles_written_after_follow(
+        self,
+        new_article_slug: str,
+        registered_user_client: AsyncClient,
+    ) -> None:
+        feed_response = await registered_user_client.get("/articles/feed")
+
+        assert _feed_slugs(feed_response) == [new_article_slug, "old-article"]
+
+    @pytest.mark.anyio
+    async def test_feed_has_no_deleted_articles(
+        self,
+        new_article_slug: str,
+        author_client: AsyncClient,
+        registered_user_client: AsyncClient,
+    ) -> None:
+        await author_client.delete(f"/articles/{new_article_slug}")
+
+        feed_response = await registered_user_client.get("/articles/feed")
+
+        assert _feed_slugs(feed_response) == ["old-article"]
+
+    @pytest.mark.anyio
+    async def test_feed_is_empty_after_unfollow(
+        self,
+        registered_user_client: AsyncClient,
+        registered_user: UserModel,
+        test_db: Database,
+    ) -> None:
+        await registered_user_client.delete(FOLLOW_URL)
+
+        feed_response = await registered_user_client.get("/articles/feed")
+
+        assert _feed_slugs(feed_response) == []
+        assert await _count_timeline_rows(test_db, registered_user) == 0
+
+
+class TestWhenFollowingAuthorWithManyFollowers:
+    @pytest.fixture(autouse=True)
+    def followers_limit(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        test_settings: Settings,
+    ) -> None:
+        monkeypatch.setattr(test_settings, "feed_fanout_followers_limit", 0)
+
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("follow_author")
+    async def test_feed_pulls_articles_without_fan_out(
+        self,
+        new_article_slug: str,
+        registered_user_client: AsyncClient,
+        registered_user: UserModel,
+        test_db: Database,
+    ) -> None:
+        feed_response = await registered_user_client.get("/articles/feed")
+
+        assert _feed_slugs(feed_response) == [new_article_slug, "old-article"]
+        assert await _count_timeline_rows(test_db, registered_user) == 0
+
+
+class TestWhenAuthorCrossesFollowersLimit:
+    @pytest.fixture
+    def set_followers_limit(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        test_settings: Settings,
+    ) -> Callable[[int], None]:
+        def set_limit(followers_limit: int) -> None:
+            monkeypatch.setattr(
+                test_settings,
+                "feed_fanout_followers_limit",
+                followers_limit,
+            )
+
+        return set_limit
+
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("follow_author")
+    async def test_feed_keeps_pulled_articles_once_author_is_under_limit(
+        self,
+        author_client: AsyncClient,
+        registered_user_client: AsyncClient,
+        set_followers_limit: Callable[[int], None],
+    ) -> None:
+        set_followers_limit(0)
+        response = await author_client.post(
+            "/articles",
+            json={
+                "article": {
+                    "title": "Pulled article",
+                    "description": "Article description",
+                    "body": "Article body",
+                },
+            },
+        )
+        pulled_article_slug = response.json()["article"]["slug"]
+        set_followers_limit(FOLLOWERS_LIMIT)
+
+        feed_response = await registered_user_client.get("/articles/feed")
+        await author_client.delete(f"/articles/{pulled_article_slug}")
+
+        assert _feed_slugs(feed_response) == [pulled_article_slug, "old-article"]
+
+    @pytest.mark.anyio
+    async def test_new_follower_gets_articles_fanned_out_before_limit(
+        self,
+        new_article_slug: str,
+        registered_user_client: AsyncClient,
+        registered_user: UserModel,
+        set_followers_limit: Callable[[int], None],
+        test_db: Database,
+    ) -> None:
+        set_followers_limit(0)
+
+        await registered_user_client.post(FOLLOW_URL)
+        feed_response = await registered_user_client.get("/articles/feed")
+        timeline_rows = await _count_timeline_rows(test_db, registered_user)
+        await registered_user_client.delete(FOLLOW_URL)
+
+        assert _feed_slugs(feed_response) == [new_article_slug, "old-article"]
+        assert timeline_rows == 1
@@ -1,11 +1,23 @@
 import datetime
+import uuid
 from typing import Any
 
 import pytest
 from httpx import AsyncClient, Response, codes
 
-from conduit.infrastructure.persistence.models import ArticleModel, UserModel
-from tests.integration.conftest import UserModelFactory
+from conduit.infrastructure.persistence.models import (
+    ArticleModel,
+    ArticleTagModel,
+    FavoriteModel,
+    FollowerModel,
+    UserModel,
+)
+from tests.integration.conftest import (
+    AddToDb,
+    ArticleModelFactory,
+    TagModelFactory,
+    UserModelFactory,
+)
 
 
 class TestWhenThereIsNoArticleWithGivenTag:
@@ -88,6 +100,7 @@ class TestWhenArticleExists:
                 "updatedAt": "2022-12-01T00:00:00Z",
                 "favorited": False,
                 "favoritesCount": 0,
+                "commentsCount": 0,
                 "author": {
                     "username": article_author.username,
                     "bio": article_author.bio,
@@ -96,3 +109,60 @@ class TestWhenArticleExists:
                 },
             },
         }
+
+
+class TestWhenViewerFollowsAuthorAndFavoritesArticle:
+    @pytest.fixture(autouse=True)
+    async def setup_article(
+        self,
+        registered_user: UserModel,
+        user_model_factory: UserModelFactory,
+        article_model_factory: ArticleModelFactory,
+        tag_model_factory: TagModelFactory,
+        add_to_db: AddToDb,
+    ) -> None:
+        created_at = datetime.datetime(2021, 11, 26, tzinfo=datetime.timezone.utc)
+        author = user_model_factory(user_id=uuid.uuid4(), username="article_author")
+        await add_to_db(author)
+        article = article_model_factory(
+            author_id=author.id,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        tags = [
+            tag_model_factory(name="python", created_at=created_at),
+            tag_model_factory(name="sqlite", created_at=created_at),
+        ]
+        await add_to_db(article, *tags)
+        await add_to_db(
+            *(
+                ArticleTagModel(
+                    article_id=article.id,
+                    tag_id=tag.id,
+                    created_at=created_at,
+                )
+                for tag in tags
+            ),
+            FavoriteModel(
+                user_id=registered_user.id,
+                article_id=article.id,
+                created_at=created_at,
+            ),
+            FollowerModel(
+                follower_id=registered_user.id,
+                following_id=author.id,
+                created_at=created_at,
+            ),
+        )
+
+    @pytest.mark.anyio
+    async def test_returns_tags_and_viewer_flags(
+        self,
+        registered_user_client: AsyncClient,
+    ) -> None:
+        response = await registered_user_client.get("/articles/article-slug")
+
+        article = response.json()["article"]
+        assert article["tagList"] == ["sqlite", "python"]
+        assert article["favorited"] is True
+        assert article["author"]["following"] is True
@@ -0,0 +1,320 @@
+import datetime
+import uuid
+from collections.abc import Callable, Generator
+
+import pytest
+from dependency_injector import providers
+from httpx import AsyncClient, Response, codes
+from typing_extensions import TypeAlias
+
+from conduit.application.articles.services.articles_list_cache import (
+    ArticlesListCache,
+)
+from conduit.containers import Container
+from conduit.infrastructure.persistence.models import (
+    ArticleModel,
+    ArticleTagModel,
+    FavoriteModel,
+    FollowerModel,
+    UserModel,
+)
+from tests.integration.conftest import (
+    AddToDb,
+    ArticleModelFactory,
+    TagModelFactory,
+    UserModelFactory,
+)
+
+TOTAL_ARTICLES = 3
+TAGGED_ARTICLES = 2
+
+
+ArticleOnDay: TypeAlias = Callable[[UserModel, str, int], ArticleModel]
+
+
+@pytest.fixture
+def article_on_day(article_model_factory: ArticleModelFactory) -> ArticleOnDay:
+    def factory(author: UserModel, slug: str, day: int) -> ArticleModel:
+        created_at = datetime.datetime(
+            year=2023,
+            month=3,
+            day=day,
+            tzinfo=datetime.timezone.utc,
+        )
+        return article_model_factory(
+            author_id=author.id,
+            slug=slug,
+            title=slug,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+
+    return factory
+
+
+class TestCursorPagination:
+    @pytest.fixture(autouse=True)
+    async def setup_articles(
+        self,
+        user_model_factory: UserModelFactory,
+        article_on_day: ArticleOnDay,
+        add_to_db: AddToDb,
+    ) -> None:
+        author = user_model_factory(username="article_author")
+        await add_to_db(author)
+        await add_to_db(
+            article_on_day(author, "oldest-article", 1),
+            article_on_day(author, "middle-article", 2),
+            article_on_day(author, "newest-article", 3),
+        )
+
+    @pytest.fixture
+    async def first_page(self, any_client: AsyncClient) -> Response:
+        return await any_client.get("/articles", params={"limit": 2})
+
+    @pytest.fixture
+    async def second_page(
+        self,
+        any_client: AsyncClient,
+        first_page: Response,
+    ) -> Response:
+        cursor = first_page.json()["nextCursor"]
+        return await any_client.get("/articles", params={"limit": 2, "cursor": cursor})
+
+    @pytest.mark.anyio
+    async def test_first_page_has_newest_articles(self, first_page: Response) -> None:
+        slugs = [article["slug"] for article in first_page.json()["articles"]]
+        assert slugs == ["newest-article", "middle-article"]
+
+    @pytest.mark.anyio
+    async def test_first_page_has_next_cursor(self, first_page: Response) -> None:
+        assert first_page.json()["nextCursor"] is not None
+
+    @pytest.mark.anyio
+    async def test_second_page_continues_after_cursor(
+        self,
+        second_page: Response,
+    ) -> None:
+        slugs = [article["slug"] for article in second_page.json()["articles"]]
+        assert slugs == ["oldest-article"]
+
+    @pytest.mark.anyio
+    async def test_last_page_has_no_next_cursor(self, second_page: Response) -> None:
+        assert second_page.json()["nextCursor"] is None
+
+    @pytest.mark.anyio
+    async def test_full_last_page_has_no_next_cursor(
+        self,
+        any_client: AsyncClient,
+    ) -> None:
+        response = await any_client.get("/articles", params={"limit": TOTAL_ARTICLES})
+
+        assert len(response.json()["articles"]) == TOTAL_ARTICLES
+        assert response.json()["nextCursor"] is None
+
+    @pytest.mark.anyio
+    async def test_articles_count_ignores_cursor(self, second_page: Response) -> None:
+        assert second_page.json()["articlesCount"] == TOTAL_ARTICLES
+
+
+@pytest.mark.anyio
+async def test_invalid_cursor_returns_validation_error(
+    any_client: AsyncClient,
+) -> None:
+    response = await any_client.get("/articles", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == codes.UNPROCESSABLE_ENTITY
+    assert response.json() == {"errors": {"cursor": ["Value error, Invalid cursor"]}}
+
+
+class TestPageAndCount:
+    @pytest.fixture(autouse=True)
+    async def setup_articles(
+        self,
+        user_model_factory: UserModelFactory,
+        article_on_day: ArticleOnDay,
+        tag_model_factory: TagModelFactory,
+        add_to_db: AddToDb,
+    ) -> None:
+        author = user_model_factory(username="article_author")
+        await add_to_db(author)
+        articles = [
+            article_on_day(author, "tagged-article", 1),
+            article_on_day(author, "another-tagged-article", 2),
+            article_on_day(author, "untagged-article", 3),
+        ]
+        await add_to_db(*articles)
+        tag = tag_model_factory(name="python", created_at=articles[0].created_at)
+        await add_to_db(tag)
+        await add_to_db(
+            *(
+                ArticleTagModel(
+                    article_id=article.id,
+                    tag_id=tag.id,
+                    created_at=article.created_at,
+                )
+                for article in articles[:2]
+            ),
+        )
+
+    @pytest.mark.anyio
+    async def test_filtered_page_has_filtered_count(
+        self,
+        any_client: AsyncClient,
+    ) -> None:
+        response = await any_client.get(
+            "/articles",
+            params={"tag": "python", "limit": 1},
+        )
+
+        articles_info = response.json()
+        assert [a["slug"] for a in articles_info["articles"]] == [
+            "another-tagged-article",
+        ]
+        assert articles_info["articlesCount"] == TAGGED_ARTICLES
+
+    @pytest.mark.anyio
+    async def test_page_after_the_last_one_keeps_count(
+        self,
+        any_client: AsyncClient,
+    ) -> None:
+        response = await any_client.get("/articles", params={"offset": 10})
+
+        assert response.json()["articles"] == []
+        assert response.json()["articlesCount"] == TOTAL_ARTICLES
+
+
+class TestPageHydration:
+    @pytest.fixture(autouse=True)
+    async def setup_articles(
+        self,
+        registered_user: UserModel,
+        user_model_factory: UserModelFactory,
+        article_on_day: ArticleOnDay,
+        tag_model_factory: TagModelFactory,
+        add_to_db: AddToDb,
+    ) -> None:
+        author = user_model_factory(user_id=uuid.uuid4(), username="article_author")
+        await add_to_db(author)
+        newest_article = article_on_day(author, "newest-article", 2)
+        await add_to_db(article_on_day(author, "oldest-article", 1), newest_article)
+        created_at = newest_article.created_at
+        tags = [
+            tag_model_factory(name="python", created_at=created_at),
+            tag_model_factory(name="web, api", created_at=created_at),
+        ]
+        await add_to_db(*tags)
+        await add_to_db(
+            *(
+                ArticleTagModel(
+                    article_id=newest_article.id,
+                    tag_id=tag.id,
+                    created_at=created_at,
+                )
+                for tag in tags
+            ),
+            FavoriteModel(
+                user_id=registered_user.id,
+                article_id=newest_article.id,
+                created_at=created_at,
+            ),
+            FollowerModel(
+                follower_id=registered_user.id,
+                following_id=author.id,
+                created_at=created_at,
+            ),
+        )
+
+    @pytest.mark.anyio
+    async def test_tags_are_listed_per_article(
+        self,
+        registered_user_client: AsyncClient,
+    ) -> None:
+        response = await registered_user_client.get("/articles")
+
+        tags = [article["tagList"] for article in response.json()["articles"]]
+        assert tags == [["web, api", "python"], []]
+
+    @pytest.mark.anyio
+    async def test_viewer_flags_are_listed_per_article(
+        self,
+        registered_user_client: AsyncClient,
+    ) -> None:
+        response = await registered_user_client.get("/articles")
+
+        flags = [
+            (article["favorited"], article["author"]["following"])
+            for article in response.json()["articles"]
+        ]
+        assert flags == [(True, True), (False, True)]
+
+
+class TestListCache:
+    @pytest.fixture(autouse=True)
+    def articles_list_cache(
+        self,
+        test_container: Container,
+    ) -> Generator[ArticlesListCache, None, None]:
+        articles_list_cache = ArticlesListCache(
+            enabled=True,
+            ttl_seconds=60,
+            max_size=16,
+        )
+        with test_container.articles_list_cache.override(  # type: ignore
+            providers.Object(articles_list_cache),
+        ):
+            yield articles_list_cache
+
+    @pytest.fixture(autouse=True)
+    async def setup_articles(
+        self,
+        user_model_factory: UserModelFactory,
+        article_on_day: ArticleOnDay,
+        add_to_db: AddToDb,
+    ) -> None:
+        author = user_model_factory(user_id=uuid.uuid4(), username="article_author")
+        await add_to_db(author)
+        await add_to_db(article_on_day(author, "cached-article", 1))
+
+    @pytest.mark.anyio
+    async def test_repeated_list_is_served_from_cache(
+        self,
+        anonymous_test_client: AsyncClient,
+        articles_list_cache: ArticlesListCache,
+    ) -> None:
+        await anonymous_test_client.get("/articles")
+        await anonymous_test_client.get("/articles")
+
+        assert (articles_list_cache.hits, articles_list_cache.misses) == (1, 1)
+
+    @pytest.mark.anyio
+    async def test_cached_page_has_flags_of_viewer(
+        self,
+        anonymous_test_client: AsyncClient,
+        registered_user_client: AsyncClient,
+    ) -> None:
+        await anonymous_test_client.get("/articles")
+        await registered_user_client.post("/articles/cached-article/favorite")
+
+        response = await registered_user_client.get("/articles")
+
+        await registered_user_client.delete("/articles/cached-article/favorite")
+        [article] = response.json()["articles"]
+        assert article["favorited"] is True
+        assert article["favoritesCount"] == 1
+
+    @pytest.mark.anyio
+    async def test_favorite_invalidates_cached_pages(
+        self,
+        anonymous_test_client: AsyncClient,
+        registered_user_client: AsyncClient,
+    ) -> None:
+        await anonymous_test_client.get("/articles")
+        await registered_user_client.post("/articles/cached-article/favorite")
+
+        response = await anonymous_test_client.get("/articles")
+
+        await registered_user_client.delete("/articles/cached-article/favorite")
+        [article] = response.json()["articles"]
+        assert article["favorited"] is False
+        assert article["favoritesCount"] == 1
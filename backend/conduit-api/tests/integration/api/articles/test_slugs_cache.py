@@ -0,0 +1,73 @@
+from collections.abc import Generator
+
+import pytest
+from dependency_injector import providers
+from httpx import AsyncClient, codes
+
+from conduit.containers import Container
+from conduit.infrastructure.persistence.article_slugs_cache import ArticleSlugsCache
+
+
+@pytest.fixture(autouse=True)
+def article_slugs_cache(
+    test_container: Container,
+) -> Generator[ArticleSlugsCache, None, None]:
+    article_slugs_cache = ArticleSlugsCache(
+        enabled=True,
+        max_size=16,
+        ttl_seconds=60,
+        negative_ttl_seconds=60,
+    )
+    with test_container.article_slugs_cache.override(  # type: ignore
+        providers.Object(article_slugs_cache),
+    ):
+        yield article_slugs_cache
+
+
+@pytest.fixture
+async def article_slug(registered_user_client: AsyncClient) -> str:
+    response = await registered_user_client.post(
+        "/articles",
+        json={
+            "article": {
+                "title": "Cached article",
+                "description": "Article description",
+                "body": "Article body",
+            },
+        },
+    )
+    return response.json()["article"]["slug"]
+
+
+@pytest.mark.anyio
+async def test_renamed_article_is_not_found_by_old_slug(
+    registered_user_client: AsyncClient,
+    article_slug: str,
+) -> None:
+    renamed = await registered_user_client.put(
+        f"/articles/{article_slug}",
+        json={"title": "Renamed article"},
+    )
+
+    response = await registered_user_client.put(
+        f"/articles/{article_slug}",
+        json={"title": "Renamed again"},
+    )
+
+    await registered_user_client.delete(
+        f"/articles/{renamed.json()['article']['slug']}",
+    )
+    assert response.status_code == codes.NOT_FOUND
+
+
+@pytest.mark.anyio
+async def test_deleted_article_is_not_found_by_slug(
+    registered_user_client: AsyncClient,
+    article_slug: str,
+) -> None:
+    await registered_user_client.get(f"/articles/{article_slug}/comments")
+    await registered_user_client.delete(f"/articles/{article_slug}")
+
+    response = await registered_user_client.get(f"/articles/{article_slug}/comments")
+
+    assert response.status_code == codes.NOT_FOUND
@@ -0,0 +1,51 @@
+import datetime
+import uuid
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+
+from conduit.infrastructure.persistence.database_seeder import Database
+from conduit.infrastructure.persistence.models import ArticleModel
+from tests.integration.conftest import (
+    AddToDb,
+    ArticleModelFactory,
+    UserModelFactory,
+)
+
+CREATED_AT = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+@pytest.fixture
+async def article(
+    user_model_factory: UserModelFactory,
+    article_model_factory: ArticleModelFactory,
+    add_to_db: AddToDb,
+) -> ArticleModel:
+    author = user_model_factory(user_id=uuid.uuid4(), username="article_author")
+    await add_to_db(author)
+    article = article_model_factory(
+        author_id=author.id,
+        slug="commented-article",
+        created_at=CREATED_AT,
+        updated_at=CREATED_AT,
+    )
+    await add_to_db(article)
+    return article
+
+
+@pytest.fixture
+def executed_statements(test_db: Database) -> Generator[list[str], None, None]:
+    """Collects the SQL statements executed while the test runs."""
+
+    statements: list[str] = []
+
+    def capture(*args: Any) -> None:
+        _, _, statement, *_ = args
+        statements.append(statement)
+
+    engine = test_db.engine.sync_engine
+    event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture)
@@ -0,0 +1,91 @@
+from collections.abc import AsyncGenerator
+
+import pytest
+from httpx import AsyncClient, Response, codes
+
+from conduit.infrastructure.persistence.models import ArticleModel
+
+COMMENTS_URL = "/articles/commented-article/comments"
+# The current user, the article by its slug, the new comment and the count.
+ADD_COMMENT_STATEMENTS = 4
+
+
+@pytest.fixture
+async def add_comment_response(
+    article: ArticleModel,
+    registered_user_client: AsyncClient,
+) -> AsyncGenerator[Response, None]:
+    del article
+    response = await registered_user_client.post(
+        COMMENTS_URL,
+        json={"comment": {"body": "New comment"}},
+    )
+    yield response
+    await registered_user_client.delete(
+        f"{COMMENTS_URL}/{response.json()['comment']['id']}",
+    )
+
+
+@pytest.mark.anyio
+async def test_returns_201_created(add_comment_response: Response) -> None:
+    assert add_comment_response.status_code == codes.CREATED
+
+
+@pytest.mark.anyio
+async def test_comment_is_listed(
+    add_comment_response: Response,
+    registered_user_client: AsyncClient,
+) -> None:
+    del add_comment_response
+
+    response = await registered_user_client.get(COMMENTS_URL)
+
+    assert [comment["body"] for comment in response.json()["comments"]] == [
+        "New comment",
+    ]
+
+
+@pytest.mark.anyio
+async def test_resolves_article_with_a_single_query(
+    article: ArticleModel,
+    registered_user_client: AsyncClient,
+    executed_statements: list[str],
+) -> None:
+    del article
+
+    response = await registered_user_client.post(
+        COMMENTS_URL,
+        json={"comment": {"body": "New comment"}},
+    )
+    statements_count = len(executed_statements)
+    await registered_user_client.delete(
+        f"{COMMENTS_URL}/{response.json()['comment']['id']}",
+    )
+
+    assert statements_count == ADD_COMMENT_STATEMENTS
+
+
+@pytest.mark.anyio
+async def test_returns_404_for_unknown_article(
+    registered_user_client: AsyncClient,
+) -> None:
+    response = await registered_user_client.post(
+        "/articles/unknown-article/comments",
+        json={"comment": {"body": "New comment"}},
+    )
+
+    assert response.status_code == codes.NOT_FOUND
+
+
+@pytest.mark.anyio
+async def test_article_counts_its_comments(
+    add_comment_response: Response,
+    registered_user_client: AsyncClient,
+) -> None:
+    del add_comment_response
+
+    article_response = await registered_user_client.get("/articles/commented-article")
+    list_response = await registered_user_client.get("/articles")
+
+    assert article_response.json()["article"]["commentsCount"] == 1
+    assert list_response.json()["articles"][0]["commentsCount"] == 1
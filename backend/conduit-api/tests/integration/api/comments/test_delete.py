@@ -0,0 +1,73 @@
+import pytest
+from httpx import AsyncClient, codes
+
+from conduit.infrastructure.persistence.models import ArticleModel, CommentModel
+from tests.integration.api.comments.conftest import CREATED_AT
+from tests.integration.conftest import AddToDb
+
+COMMENTS_URL = "/articles/commented-article/comments"
+# The current user, the article by its slug, the comment, its deletion and
+# the count.
+DELETE_COMMENT_STATEMENTS = 5
+
+
+@pytest.fixture
+async def comment_id(
+    article: ArticleModel,
+    registered_user_client: AsyncClient,
+) -> int:
+    del article
+    response = await registered_user_client.post(
+        COMMENTS_URL,
+        json={"comment": {"body": "Comment to delete"}},
+    )
+    return response.json()["comment"]["id"]
+
+
+@pytest.mark.anyio
+async def test_deletes_comment(
+    comment_id: int,
+    registered_user_client: AsyncClient,
+    executed_statements: list[str],
+) -> None:
+    executed_statements.clear()
+
+    response = await registered_user_client.delete(f"{COMMENTS_URL}/{comment_id}")
+
+    assert len(executed_statements) == DELETE_COMMENT_STATEMENTS
+    assert response.status_code == codes.OK
+    comments = await registered_user_client.get(COMMENTS_URL)
+    assert comments.json()["comments"] == []
+    article = await registered_user_client.get("/articles/commented-article")
+    assert article.json()["article"]["commentsCount"] == 0
+
+
+@pytest.mark.anyio
+async def test_cannot_delete_comment_of_another_user(
+    article: ArticleModel,
+    registered_user_client: AsyncClient,
+    add_to_db: AddToDb,
+) -> None:
+    comment = CommentModel(
+        article_id=article.id,
+        author_id=article.author_id,
+        body="Comment of the author",
+        created_at=CREATED_AT,
+        updated_at=CREATED_AT,
+    )
+    await add_to_db(comment)
+
+    response = await registered_user_client.delete(f"{COMMENTS_URL}/{comment.id}")
+
+    assert response.status_code == codes.BAD_REQUEST
+
+
+@pytest.mark.anyio
+async def test_returns_404_for_unknown_article(
+    registered_user_client: AsyncClient,
+) -> None:
+    response = await registered_user_client.delete(
+        "/articles/unknown-article/comments/1",
+    )
+
+    assert response.status_code == codes.NOT_FOUND
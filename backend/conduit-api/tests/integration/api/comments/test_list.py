@@ -0,0 +1,113 @@
+import datetime
+from typing import Union
+
+import pytest
+from httpx import AsyncClient, codes
+
+from conduit.infrastructure.persistence.models import (
+    ArticleModel,
+    CommentModel,
+    FollowerModel,
+    UserModel,
+)
+from tests.integration.api.comments.conftest import CREATED_AT
+from tests.integration.conftest import AddToDb
+
+COMMENTS_URL = "/articles/commented-article/comments"
+COMMENTS_COUNT = 3
+# The current user, the article by its slug and the joined comments.
+LIST_COMMENTS_STATEMENTS = 3
+
+
+@pytest.fixture(autouse=True)
+async def setup_comments(article: ArticleModel, add_to_db: AddToDb) -> None:
+    await add_to_db(
+        *(
+            CommentModel(
+                article_id=article.id,
+                author_id=article.author_id,
+                body=f"Comment {i}",
+                created_at=CREATED_AT + datetime.timedelta(minutes=i),
+                updated_at=CREATED_AT + datetime.timedelta(minutes=i),
+            )
+            for i in range(COMMENTS_COUNT)
+        ),
+    )
+
+
+def _bodies(response_json: dict[str, list[dict[str, str]]]) -> list[str]:
+    return [comment["body"] for comment in response_json["comments"]]
+
+
+@pytest.mark.anyio
+async def test_lists_newest_comments_first(any_client: AsyncClient) -> None:
+    response = await any_client.get(COMMENTS_URL)
+
+    assert response.status_code == codes.OK
+    assert _bodies(response.json()) == ["Comment 2", "Comment 1", "Comment 0"]
+    assert response.json()["nextCursor"] is None
+
+
+@pytest.mark.anyio
+async def test_pages_follow_the_cursor(any_client: AsyncClient) -> None:
+    first_page = await any_client.get(COMMENTS_URL, params={"limit": 2})
+    next_cursor = first_page.json()["nextCursor"]
+
+    second_page = await any_client.get(
+        COMMENTS_URL,
+        params={"limit": 2, "cursor": next_cursor},
+    )
+
+    assert _bodies(first_page.json()) == ["Comment 2", "Comment 1"]
+    assert _bodies(second_page.json()) == ["Comment 0"]
+    assert second_page.json()["nextCursor"] is None
+
+
+@pytest.mark.anyio
+async def test_full_last_page_has_no_next_cursor(any_client: AsyncClient) -> None:
+    response = await any_client.get(COMMENTS_URL, params={"limit": COMMENTS_COUNT})
+
+    assert len(response.json()["comments"]) == COMMENTS_COUNT
+    assert response.json()["nextCursor"] is None
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "params",
+    [{"limit": 0}, {"limit": 101}, {"cursor": "not-a-cursor"}],
+)
+async def test_rejects_invalid_paging(
+    any_client: AsyncClient,
+    params: dict[str, Union[int, str]],
+) -> None:
+    response = await any_client.get(COMMENTS_URL, params=params)
+
+    assert response.status_code == codes.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.anyio
+async def test_lists_authors_with_viewer_following_flag(
+    article: ArticleModel,
+    registered_user: UserModel,
+    registered_user_client: AsyncClient,
+    add_to_db: AddToDb,
+    executed_statements: list[str],
+) -> None:
+    await add_to_db(
+        FollowerModel(
+            follower_id=registered_user.id,
+            following_id=article.author_id,
+            created_at=CREATED_AT,
+        ),
+    )
+    executed_statements.clear()
+
+    response = await registered_user_client.get(COMMENTS_URL, params={"limit": 1})
+
+    assert len(executed_statements) == LIST_COMMENTS_STATEMENTS
+    assert response.json()["comments"][0]["author"] == {
+        "username": "article_author",
+        "bio": "Admin user.",
+        "image": None,
+        "following": True,
+    }
@@ -96,6 +96,25 @@ class TestWhenFollowExistingProfile:
     async def test_has_followed_true(self, follow_response: Response) -> None:
         assert follow_response.json()["profile"]["following"] is True
 
+    @pytest.mark.anyio
+    async def test_counts_the_new_follower(self, follow_response: Response) -> None:
+        assert follow_response.json()["profile"]["followersCount"] == 1
+
+    @pytest.mark.anyio
+    async def test_counts_the_followed_profile(
+        self,
+        follow_response: Response,
+        registered_user_client: AsyncClient,
+        registered_user: UserModel,
+    ) -> None:
+        del follow_response
+
+        response = await registered_user_client.get(
+            f"/profiles/{registered_user.username}",
+        )
+
+        assert response.json()["profile"]["followingCount"] == 1
+
     class TestAndItWasAlreadyFollowed:
         @pytest.fixture
         async def follow_response(
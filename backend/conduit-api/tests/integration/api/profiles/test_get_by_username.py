@@ -81,6 +81,8 @@ class TestWhenVisitingExistingProfile:
                     "bio": test_user.bio,
                     "image": test_user.image_url,
                     "following": False,
+                    "followersCount": 0,
+                    "followingCount": 0,
                 },
             }
 
@@ -115,3 +115,15 @@ class TestWhenUnfollowExistingProfile:
             unfollow_response: Response,
         ) -> None:
             assert unfollow_response.json()["profile"]["following"] is False
+
+        @pytest.mark.anyio
+        async def test_uncounts_the_follower(
+            self,
+            unfollow_response: Response,
+            registered_user_client: AsyncClient,
+            test_username: str,
+        ) -> None:
+            response = await registered_user_client.get(f"/profiles/{test_username}")
+
+            assert unfollow_response.json()["profile"]["followersCount"] == 0
+            assert response.json()["profile"]["followersCount"] == 0
@@ -0,0 +1,50 @@
+import pytest
+from httpx import AsyncClient, codes
+
+from tests.integration.conftest import AddToDb, TagModelFactory
+
+
+@pytest.fixture(autouse=True)
+async def tags(
+    tag_model_factory: TagModelFactory,
+    add_to_db: AddToDb,
+) -> None:
+    await add_to_db(
+        tag_model_factory(name="rare", usage_count=1),
+        tag_model_factory(name="popular", usage_count=7),
+        tag_model_factory(name="unused", usage_count=0),
+        tag_model_factory(name="common", usage_count=3),
+    )
+
+
+@pytest.mark.anyio
+async def test_lists_tags_of_most_articles_first(any_client: AsyncClient) -> None:
+    response = await any_client.get("/tags", params={"popular": 2})
+
+    assert response.status_code == codes.OK
+    assert response.json() == {"tags": ["popular", "common"]}
+
+
+@pytest.mark.anyio
+async def test_does_not_list_unused_tags(any_client: AsyncClient) -> None:
+    response = await any_client.get("/tags", params={"popular": 10})
+
+    assert response.json() == {"tags": ["popular", "common", "rare"]}
+
+
+@pytest.mark.anyio
+async def test_lists_all_tags_without_popular(any_client: AsyncClient) -> None:
+    response = await any_client.get("/tags")
+
+    assert response.json() == {"tags": ["rare", "popular", "unused", "common"]}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("popular", [0, 101])
+async def test_rejects_popular_out_of_range(
+    any_client: AsyncClient,
+    popular: int,
+) -> None:
+    response = await any_client.get("/tags", params={"popular": popular})
+
+    assert response.status_code == codes.UNPROCESSABLE_ENTITY
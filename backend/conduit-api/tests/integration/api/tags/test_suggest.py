@@ -0,0 +1,70 @@
+from collections.abc import Generator
+
+import pytest
+from dependency_injector import providers
+from httpx import AsyncClient, codes
+
+from conduit.containers import Container
+from conduit.infrastructure.persistence.database_seeder import Database
+from conduit.infrastructure.persistence.tag_suggestions_index import (
+    TagSuggestionsIndex,
+)
+from tests.integration.conftest import AddToDb, TagModelFactory
+
+
+@pytest.fixture(params=[True, False], ids=["index", "database"])
+def tag_suggestions_index(
+    request: pytest.FixtureRequest,
+    test_container: Container,
+    test_db: Database,
+) -> Generator[TagSuggestionsIndex, None, None]:
+    tag_suggestions_index = TagSuggestionsIndex(
+        db=test_db,
+        enabled=request.param,
+        max_size=16,
+    )
+    with test_container.tag_suggestions_index.override(  # type: ignore
+        providers.Object(tag_suggestions_index),
+    ):
+        yield tag_suggestions_index
+
+
+@pytest.fixture(autouse=True)
+async def tags(
+    tag_model_factory: TagModelFactory,
+    add_to_db: AddToDb,
+    tag_suggestions_index: TagSuggestionsIndex,
+) -> None:
+    await add_to_db(
+        tag_model_factory(name="python", usage_count=1),
+        tag_model_factory(name="PyPy", usage_count=3),
+        tag_model_factory(name="rust", usage_count=7),
+    )
+    await tag_suggestions_index.warm_up()
+
+
+@pytest.mark.anyio
+async def test_suggests_tags_by_prefix_most_used_first(
+    any_client: AsyncClient,
+) -> None:
+    response = await any_client.get("/tags/suggest", params={"prefix": "py"})
+
+    assert response.status_code == codes.OK
+    assert response.json() == {"tags": ["PyPy", "python"]}
+
+
+@pytest.mark.anyio
+async def test_limits_suggestions(any_client: AsyncClient) -> None:
+    response = await any_client.get(
+        "/tags/suggest",
+        params={"prefix": "P", "limit": 1},
+    )
+
+    assert response.json() == {"tags": ["PyPy"]}
+
+
+@pytest.mark.anyio
+async def test_requires_prefix(any_client: AsyncClient) -> None:
+    response = await any_client.get("/tags/suggest")
+
+    assert response.status_code == codes.UNPROCESSABLE_ENTITY
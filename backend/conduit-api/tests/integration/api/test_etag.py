@@ -0,0 +1,167 @@
+import uuid
+from collections.abc import AsyncGenerator
+
+import pytest
+from httpx import AsyncClient, codes
+
+from conduit.containers import Container
+from conduit.infrastructure.persistence.models import UserModel
+from tests.integration.conftest import (
+    AddToDb,
+    ApiClientFactory,
+    ArticleModelFactory,
+    TagModelFactory,
+    TokenFactory,
+    UserModelFactory,
+)
+
+ARTICLE_URL = "/articles/etag-article"
+PROFILE_URL = "/profiles/etag_author"
+
+
+@pytest.fixture(autouse=True)
+async def author(
+    user_model_factory: UserModelFactory,
+    article_model_factory: ArticleModelFactory,
+    add_to_db: AddToDb,
+) -> UserModel:
+    author = user_model_factory(user_id=uuid.uuid4(), username="etag_author")
+    await add_to_db(author)
+    await add_to_db(article_model_factory(author_id=author.id, slug="etag-article"))
+    return author
+
+
+async def _etag(client: AsyncClient, url: str) -> str:
+    response = await client.get(url)
+    return response.headers["ETag"]
+
+
+@pytest.fixture
+async def favorited_article(
+    registered_user_client: AsyncClient,
+) -> AsyncGenerator[None, None]:
+    await registered_user_client.post(f"{ARTICLE_URL}/favorite")
+    yield
+    await registered_user_client.delete(f"{ARTICLE_URL}/favorite")
+
+
+@pytest.fixture
+async def followed_author(
+    registered_user_client: AsyncClient,
+) -> AsyncGenerator[None, None]:
+    await registered_user_client.post(f"{PROFILE_URL}/follow")
+    yield
+    await registered_user_client.delete(f"{PROFILE_URL}/follow")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("url", [ARTICLE_URL, PROFILE_URL, "/tags"])
+async def test_returns_304_for_current_etag(
+    any_client: AsyncClient,
+    url: str,
+) -> None:
+    etag = await _etag(any_client, url)
+
+    response = await any_client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == codes.NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("url", [ARTICLE_URL, PROFILE_URL, "/tags"])
+async def test_returns_200_for_stale_etag(any_client: AsyncClient, url: str) -> None:
+    response = await any_client.get(url, headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == codes.OK
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("url", "version_operation"),
+    [
+        (ARTICLE_URL, "GetArticleVersionUseCase.__call__"),
+        (PROFILE_URL, "GetProfileVersionUseCase.__call__"),
+    ],
+)
+async def test_unconditional_get_reads_version_with_body(
+    any_client: AsyncClient,
+    test_container: Container,
+    url: str,
+    version_operation: str,
+) -> None:
+    version_reads = test_container.metrics().operation(version_operation)
+    version_reads_count = version_reads.count
+
+    etag = await _etag(any_client, url)
+    response = await any_client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == codes.NOT_MODIFIED
+    assert version_reads.count == version_reads_count + 1
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("url", [ARTICLE_URL, PROFILE_URL])
+async def test_etag_depends_on_viewer(
+    anonymous_test_client: AsyncClient,
+    registered_user_client: AsyncClient,
+    url: str,
+) -> None:
+    assert await _etag(anonymous_test_client, url) != await _etag(
+        registered_user_client,
+        url,
+    )
+
+
+@pytest.mark.anyio
+async def test_favorite_changes_article_etag(
+    registered_user_client: AsyncClient,
+    favorited_article: None,
+) -> None:
+    del favorited_article
+    etag = await _etag(registered_user_client, ARTICLE_URL)
+    await registered_user_client.delete(f"{ARTICLE_URL}/favorite")
+
+    assert await _etag(registered_user_client, ARTICLE_URL) != etag
+
+
+@pytest.mark.anyio
+async def test_update_changes_article_etag(
+    anonymous_test_client: AsyncClient,
+    test_client_factory: ApiClientFactory,
+    generate_token: TokenFactory,
+    author: UserModel,
+) -> None:
+    etag = await _etag(anonymous_test_client, ARTICLE_URL)
+
+    async with test_client_factory() as author_client:
+        author_client.headers["Authorization"] = f"Token {generate_token(author)}"
+        await author_client.put(ARTICLE_URL, json={"body": "New body"})
+
+    assert await _etag(anonymous_test_client, ARTICLE_URL) != etag
+
+
+@pytest.mark.anyio
+async def test_follow_changes_profile_etag(
+    registered_user_client: AsyncClient,
+    followed_author: None,
+) -> None:
+    del followed_author
+    etag = await _etag(registered_user_client, PROFILE_URL)
+    await registered_user_client.delete(f"{PROFILE_URL}/follow")
+
+    assert await _etag(registered_user_client, PROFILE_URL) != etag
+
+
+@pytest.mark.anyio
+async def test_new_tag_changes_tags_etag(
+    anonymous_test_client: AsyncClient,
+    tag_model_factory: TagModelFactory,
+    add_to_db: AddToDb,
+) -> None:
+    etag = await _etag(anonymous_test_client, "/tags")
+
+    await add_to_db(tag_model_factory(name="etag"))
+
+    assert await _etag(anonymous_test_client, "/tags") != etag
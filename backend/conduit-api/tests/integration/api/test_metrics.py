@@ -0,0 +1,65 @@
+import pytest
+from dependency_injector import providers
+from httpx import AsyncClient, codes
+
+from conduit.containers import Container
+from conduit.settings import Settings
+
+
+@pytest.mark.anyio
+async def test_exposes_latencies_of_use_cases_and_repositories(
+    any_client: AsyncClient,
+) -> None:
+    await any_client.get("/tags")
+
+    response = await any_client.get("/metrics")
+
+    assert response.status_code == codes.OK
+    assert response.headers["Content-Type"].startswith("text/plain")
+    assert (
+        'conduit_operation_duration_seconds_count{operation="ListTagsUseCase.__call__"}'
+        in response.text
+    )
+    assert (
+        'conduit_operation_errors_total{operation="SQLiteTagsRepository.get_all_tags"} 0'
+        in response.text
+    )
+
+
+@pytest.mark.anyio
+async def test_exposes_cache_statistics(any_client: AsyncClient) -> None:
+    response = await any_client.get("/metrics")
+
+    assert "conduit_tags_cache_hits " in response.text
+    assert "conduit_articles_list_cache_misses " in response.text
+
+
+@pytest.mark.anyio
+async def test_exposes_database_maintenance_steps(
+    any_client: AsyncClient,
+    test_container: Container,
+) -> None:
+    await test_container.db_maintainer().maintain_database()
+
+    response = await any_client.get("/metrics")
+
+    assert (
+        'conduit_operation_duration_seconds_count{operation="DatabaseMaintainer.optimize"}'
+        in response.text
+    )
+    assert "conduit_database_maintenance_purge_favorites_rows_total " in response.text
+
+
+@pytest.mark.anyio
+async def test_hides_metrics_unless_enabled(
+    any_client: AsyncClient,
+    test_container: Container,
+    test_settings: Settings,
+) -> None:
+    settings = test_settings.model_copy(update={"metrics_endpoint_enabled": False})
+    with test_container.app_settings.override(  # type: ignore
+        providers.Object(settings),
+    ):
+        response = await any_client.get("/metrics")
+
+    assert response.status_code == codes.NOT_FOUND
@@ -11,12 +11,19 @@ from typing_extensions import AsyncContextManager, TypeAlias
 from conduit.app import create_app
 from conduit.containers import Container
 from conduit.infrastructure.persistence.database_seeder import Database
-from conduit.infrastructure.persistence.models import Base, UserModel
+from conduit.infrastructure.persistence.models import (
+    ArticleModel,
+    Base,
+    TagModel,
+    UserModel,
+)
 from conduit.infrastructure.persistence.models import Base as ModelBase
 from conduit.settings import Settings
 
 ApiClientFactory: TypeAlias = Callable[[], AsyncClient]
 UserModelFactory: TypeAlias = Callable[..., UserModel]
+ArticleModelFactory: TypeAlias = Callable[..., ArticleModel]
+TagModelFactory: TypeAlias = Callable[..., TagModel]
 TokenFactory: TypeAlias = Callable[[UserModel], str]
 
 
@@ -49,6 +56,12 @@ def test_settings(
             "debug": True,
             "jwt_secret_key": "secret_key_example_for_test_purposes",
             "jwt_token_expiration_minutes": 60 * 24,
+            # Tests write to the database directly, bypassing cache invalidation.
+            "articles_list_cache_enabled": False,
+            "article_slugs_cache_enabled": False,
+            "tag_ids_cache_enabled": False,
+            "tags_cache_enabled": False,
+            "metrics_endpoint_enabled": True,
         },
     )
 
@@ -107,8 +120,11 @@ async def add_to_db(
 
     async with test_db.create_session() as session:
         yield _add_to_db
-        for entity in entities:
+        # Models declare no relationships, so nothing orders the deletes but
+        # the flushes. Rows are deleted before the rows they reference.
+        for entity in reversed(entities):
             await session.delete(entity)
+            await session.flush()
         await session.commit()
 
 
@@ -129,6 +145,37 @@ async def user_model_factory() -> UserModelFactory:
     return factory
 
 
+@pytest.fixture
+async def article_model_factory() -> ArticleModelFactory:
+    def factory(**kwargs: Any) -> ArticleModel:
+        default_kwagrs: dict[str, Any] = {
+            "slug": "article-slug",
+            "title": "Article Title",
+            "description": "Article description",
+            "body": "Article body",
+            "created_at": datetime(year=2023, month=1, day=1, tzinfo=timezone.utc),
+            "updated_at": datetime(year=2023, month=1, day=1, tzinfo=timezone.utc),
+        }
+        article_model_args = {**default_kwagrs, **kwargs}
+        return ArticleModel(**article_model_args)
+
+    return factory
+
+
+@pytest.fixture
+async def tag_model_factory() -> TagModelFactory:
+    def factory(**kwargs: Any) -> TagModel:
+        default_kwagrs: dict[str, Any] = {
+            "name": "tag",
+            "created_at": datetime(year=2023, month=1, day=1, tzinfo=timezone.utc),
+            "usage_count": 0,
+        }
+        tag_model_args = {**default_kwagrs, **kwargs}
+        return TagModel(**tag_model_args)
+
+    return factory
+
+
 @pytest.fixture
 async def registered_user(
     user_model_factory: UserModelFactory,
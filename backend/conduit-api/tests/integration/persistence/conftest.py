@@ -0,0 +1,30 @@
+import contextlib
+from collections.abc import AsyncIterator
+from typing import Callable
+
+import pytest
+from typing_extensions import AsyncContextManager, TypeAlias
+
+from conduit.containers import Container
+
+RolledBackUnitOfWork: TypeAlias = Callable[[], AsyncContextManager[None]]
+
+
+class _RollbackError(Exception):
+    pass
+
+
+@pytest.fixture
+def rolled_back_unit_of_work(
+    test_container: Container,
+) -> RolledBackUnitOfWork:
+    """Runs repository writes in a unit of work that is never committed."""
+
+    @contextlib.asynccontextmanager
+    async def unit_of_work() -> AsyncIterator[None]:
+        with contextlib.suppress(_RollbackError):
+            async with test_container.uow_factory()():
+                yield
+                raise _RollbackError
+
+    return unit_of_work
@@ -0,0 +1,90 @@
+import uuid
+from collections.abc import Awaitable
+from typing import Callable
+
+import pytest
+from sqlalchemy import text
+from typing_extensions import TypeAlias
+
+from conduit.containers import Container
+from conduit.infrastructure.persistence.compressed_text import (
+    COMPRESSION_THRESHOLD_BYTES,
+)
+from conduit.infrastructure.persistence.database_seeder import Database
+from conduit.infrastructure.persistence.models import ArticleModel
+from tests.integration.conftest import (
+    AddToDb,
+    ArticleModelFactory,
+    UserModelFactory,
+)
+
+LONG_BODY = "Long article body. " * COMPRESSION_THRESHOLD_BYTES
+SHORT_BODY = "Short article body."
+
+AddArticle: TypeAlias = Callable[[str], Awaitable[ArticleModel]]
+
+
+@pytest.fixture
+async def add_article(
+    user_model_factory: UserModelFactory,
+    article_model_factory: ArticleModelFactory,
+    add_to_db: AddToDb,
+) -> AddArticle:
+    author = user_model_factory(user_id=uuid.uuid4(), username="body_author")
+    await add_to_db(author)
+
+    async def _add_article(body: str) -> ArticleModel:
+        article = article_model_factory(
+            author_id=author.id,
+            slug=f"article-{uuid.uuid4()}",
+            body=body,
+        )
+        await add_to_db(article)
+        return article
+
+    return _add_article
+
+
+async def _stored_body_type(db: Database, article_id: int) -> str:
+    async with db.engine.connect() as conn:
+        result = await conn.execute(
+            text("SELECT typeof(body) FROM articles WHERE id = :id"),
+            {"id": article_id},
+        )
+        return result.scalar_one()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("body", "stored_type"),
+    [(LONG_BODY, "blob"), (SHORT_BODY, "text")],
+)
+async def test_stores_only_long_bodies_compressed(
+    add_article: AddArticle,
+    test_db: Database,
+    body: str,
+    stored_type: str,
+) -> None:
+    article = await add_article(body)
+
+    assert await _stored_body_type(test_db, article.id) == stored_type
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("body", [LONG_BODY, SHORT_BODY])
+async def test_reads_body_back(
+    add_article: AddArticle,
+    test_container: Container,
+    body: str,
+) -> None:
+    article = await add_article(body)
+    articles_repository = test_container.articles_repository()
+
+    async with test_container.uow_factory()():
+        article_with_author = await articles_repository.get_with_author_by_slug(
+            article.slug,
+            viewer_id=None,
+        )
+
+    assert article_with_author is not None
+    assert article_with_author.body == body
@@ -0,0 +1,241 @@
+import datetime
+import uuid
+
+import pytest
+from sqlalchemy import delete, insert, select
+from sqlalchemy.sql.functions import count
+
+from conduit.infrastructure.metrics.registry import MetricsRegistry
+from conduit.infrastructure.persistence.database_maintainer import DatabaseMaintainer
+from conduit.infrastructure.persistence.database_seeder import Database
+from conduit.infrastructure.persistence.models import (
+    ArticleModel,
+    ArticleTagModel,
+    CommentModel,
+    FavoriteModel,
+    TagModel,
+    UserModel,
+)
+from tests.integration.conftest import (
+    AddToDb,
+    ArticleModelFactory,
+    TagModelFactory,
+    UserModelFactory,
+)
+
+CREATED_AT = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+DELETED_ARTICLE_ID = 1_000_000
+BATCH_SIZE = 2
+ORPHANED_FAVORITES = 3
+
+
+@pytest.fixture
+async def user(user_model_factory: UserModelFactory, add_to_db: AddToDb) -> UserModel:
+    user = user_model_factory(user_id=uuid.uuid4(), username="maintained_user")
+    await add_to_db(user)
+    return user
+
+
+@pytest.fixture
+async def article(
+    user: UserModel,
+    article_model_factory: ArticleModelFactory,
+    add_to_db: AddToDb,
+) -> ArticleModel:
+    article = article_model_factory(author_id=user.id, slug="maintained-article")
+    await add_to_db(article)
+    await add_to_db(
+        FavoriteModel(user_id=user.id, article_id=article.id, created_at=CREATED_AT),
+    )
+    return article
+
+
+@pytest.fixture
+async def orphans(user: UserModel, test_db: Database) -> None:
+    """Rows of an article deleted while foreign keys were not enforced."""
+
+    async with test_db.engine.connect() as conn:
+        await conn.exec_driver_sql("PRAGMA foreign_keys = OFF")
+        await conn.execute(
+            insert(FavoriteModel),
+            [
+                {
+                    "user_id": user.id,
+                    "article_id": DELETED_ARTICLE_ID + i,
+                    "created_at": CREATED_AT,
+                }
+                for i in range(ORPHANED_FAVORITES)
+            ],
+        )
+        await conn.execute(
+            insert(CommentModel).values(
+                article_id=DELETED_ARTICLE_ID,
+                author_id=user.id,
+                body="Comment body",
+                created_at=CREATED_AT,
+                updated_at=CREATED_AT,
+            ),
+        )
+        await conn.commit()
+        await conn.exec_driver_sql("PRAGMA foreign_keys = ON")
+
+
+@pytest.fixture
+async def orphaned_tag(
+    tag_model_factory: TagModelFactory,
+    add_to_db: AddToDb,
+    test_db: Database,
+) -> TagModel:
+    """Tag used only by an article deleted while foreign keys were not enforced."""
+
+    tag = tag_model_factory(name="orphaned", usage_count=1)
+    await add_to_db(tag)
+    async with test_db.engine.connect() as conn:
+        await conn.exec_driver_sql("PRAGMA foreign_keys = OFF")
+        await conn.execute(
+            insert(ArticleTagModel).values(
+                article_id=DELETED_ARTICLE_ID,
+                tag_id=tag.id,
+                created_at=CREATED_AT,
+            ),
+        )
+        await conn.commit()
+        await conn.exec_driver_sql("PRAGMA foreign_keys = ON")
+    return tag
+
+
+@pytest.fixture
+def metrics() -> MetricsRegistry:
+    return MetricsRegistry(enabled=True)
+
+
+@pytest.fixture
+def db_maintainer(test_db: Database, metrics: MetricsRegistry) -> DatabaseMaintainer:
+    return DatabaseMaintainer(
+        db=test_db,
+        enabled=True,
+        interval_seconds=60,
+        batch_size=BATCH_SIZE,
+        vacuum_pages=100,
+        metrics=metrics,
+    )
+
+
+@pytest.mark.anyio
+async def test_purges_orphans_in_batches(
+    article: ArticleModel,
+    orphans: None,
+    db_maintainer: DatabaseMaintainer,
+    test_db: Database,
+) -> None:
+    del orphans
+
+    steps = await db_maintainer.maintain_database()
+
+    rows = {step.name: step.rows for step in steps}
+    assert rows["purge_favorites"] == ORPHANED_FAVORITES
+    assert rows["purge_comments"] == 1
+    async with test_db.session() as session:
+        favorites = await session.scalars(select(FavoriteModel.article_id))
+        comments = await session.scalar(select(count()).select_from(CommentModel))
+    assert list(favorites) == [article.id]
+    assert comments == 0
+
+
+@pytest.mark.anyio
+async def test_purged_tag_links_no_longer_count(
+    orphaned_tag: TagModel,
+    db_maintainer: DatabaseMaintainer,
+    test_db: Database,
+) -> None:
+    steps = await db_maintainer.maintain_database()
+
+    assert {step.name: step.rows for step in steps}["purge_articles_tags"] == 1
+    async with test_db.session() as session:
+        query = select(TagModel.usage_count).where(TagModel.id == orphaned_tag.id)
+        assert await session.scalar(query) == 0
+
+
+@pytest.mark.anyio
+async def test_reports_every_step(db_maintainer: DatabaseMaintainer) -> None:
+    steps = await db_maintainer.maintain_database()
+
+    assert [step.name for step in steps] == [
+        "purge_articles_tags",
+        "purge_favorites",
+        "purge_comments",
+        "purge_timeline",
+        "optimize",
+        "incremental_vacuum",
+    ]
+
+
+@pytest.mark.anyio
+async def test_records_metrics_of_every_step(
+    orphans: None,
+    db_maintainer: DatabaseMaintainer,
+    metrics: MetricsRegistry,
+) -> None:
+    del orphans
+
+    await db_maintainer.maintain_database()
+
+    assert metrics.operations["DatabaseMaintainer.purge_favorites"].count == 1
+    assert metrics.operations["DatabaseMaintainer.incremental_vacuum"].count == 1
+    assert (
+        metrics.counters["database_maintenance_purge_favorites_rows_total"]
+        == ORPHANED_FAVORITES
+    )
+
+
+@pytest.mark.anyio
+async def test_gives_free_pages_back(
+    article: ArticleModel,
+    db_maintainer: DatabaseMaintainer,
+    test_db: Database,
+) -> None:
+    async with test_db.session() as session:
+        await session.execute(
+            insert(CommentModel),
+            [
+                {
+                    "article_id": article.id,
+                    "author_id": article.author_id,
+                    "body": "Comment body " * 1000,
+                    "created_at": CREATED_AT,
+                    "updated_at": CREATED_AT,
+                }
+                for _ in range(BATCH_SIZE)
+            ],
+        )
+        await session.execute(delete(CommentModel))
+
+    steps = await db_maintainer.maintain_database()
+
+    assert {step.name: step.rows for step in steps}["incremental_vacuum"] > 0
+
+
+@pytest.mark.anyio
+async def test_deleted_article_cascades_to_its_rows(
+    user: UserModel,
+    article_model_factory: ArticleModelFactory,
+    test_db: Database,
+) -> None:
+    async with test_db.session() as session:
+        article = article_model_factory(author_id=user.id, slug="cascaded-article")
+        session.add(article)
+        await session.flush()
+        session.add(
+            FavoriteModel(
+                user_id=user.id,
+                article_id=article.id,
+                created_at=CREATED_AT,
+            ),
+        )
+
+    async with test_db.session() as session:
+        await session.execute(delete(ArticleModel).where(ArticleModel.id == article.id))
+
+    async with test_db.session() as session:
+        favorites = await session.scalar(select(count()).select_from(FavoriteModel))
+    assert favorites == 0
@@ -0,0 +1,198 @@
+import datetime
+import uuid
+from collections.abc import AsyncGenerator
+
+import pytest
+from sqlalchemy import delete, insert, select
+
+from conduit.containers import Container
+from conduit.infrastructure.persistence.database_repairer import DatabaseRepairer
+from conduit.infrastructure.persistence.database_seeder import Database
+from conduit.infrastructure.persistence.models import (
+    ArticleModel,
+    ArticleTagModel,
+    CommentModel,
+    FavoriteModel,
+    FollowerModel,
+    TagModel,
+    TimelineModel,
+    UserModel,
+)
+from tests.integration.conftest import (
+    AddToDb,
+    ArticleModelFactory,
+    TagModelFactory,
+    UserModelFactory,
+)
+
+CREATED_AT = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+DELETED_ARTICLE_ID = 1_000_000
+
+
+@pytest.fixture
+async def article(
+    user_model_factory: UserModelFactory,
+    article_model_factory: ArticleModelFactory,
+    tag_model_factory: TagModelFactory,
+    add_to_db: AddToDb,
+) -> ArticleModel:
+    author = user_model_factory(username="article_author")
+    await add_to_db(author)
+    article = article_model_factory(
+        author_id=author.id,
+        slug="article-with-drifted-counters",
+        favorites_count=42,
+        comments_count=42,
+    )
+    tag = tag_model_factory(name="drifted", usage_count=42)
+    await add_to_db(article, tag)
+    await add_to_db(
+        FavoriteModel(user_id=author.id, article_id=article.id, created_at=CREATED_AT),
+        ArticleTagModel(article_id=article.id, tag_id=tag.id, created_at=CREATED_AT),
+        CommentModel(
+            article_id=article.id,
+            author_id=author.id,
+            body="Comment body",
+            created_at=CREATED_AT,
+            updated_at=CREATED_AT,
+        ),
+    )
+    return article
+
+
+@pytest.mark.anyio
+async def test_repair_recomputes_favorites_count(
+    article: ArticleModel,
+    test_container: Container,
+    test_db: Database,
+) -> None:
+    await test_container.db_repairer().repair_database()
+
+    async with test_db.session() as session:
+        query = select(ArticleModel.favorites_count).where(
+            ArticleModel.id == article.id,
+        )
+        assert await session.scalar(query) == 1
+
+
+@pytest.mark.anyio
+async def test_repair_recomputes_comments_count(
+    article: ArticleModel,
+    test_container: Container,
+    test_db: Database,
+) -> None:
+    await test_container.db_repairer().repair_database()
+
+    async with test_db.session() as session:
+        query = select(ArticleModel.comments_count).where(
+            ArticleModel.id == article.id,
+        )
+        assert await session.scalar(query) == 1
+
+
+@pytest.fixture
+async def orphaned_tag_link(
+    article: ArticleModel,
+    test_db: Database,
+) -> AsyncGenerator[None, None]:
+    """Link of the tag to an article deleted while foreign keys were not enforced."""
+
+    del article
+    async with test_db.engine.connect() as conn:
+        tag_id = await conn.scalar(
+            select(TagModel.id).where(TagModel.name == "drifted"),
+        )
+        await conn.exec_driver_sql("PRAGMA foreign_keys = OFF")
+        await conn.execute(
+            insert(ArticleTagModel).values(
+                article_id=DELETED_ARTICLE_ID,
+                tag_id=tag_id,
+                created_at=CREATED_AT,
+            ),
+        )
+        await conn.commit()
+        await conn.exec_driver_sql("PRAGMA foreign_keys = ON")
+    yield
+    async with test_db.session() as session:
+        await session.execute(
+            delete(ArticleTagModel).where(
+                ArticleTagModel.article_id == DELETED_ARTICLE_ID,
+            ),
+        )
+
+
+@pytest.mark.anyio
+async def test_repair_recomputes_tags_usage_count(
+    orphaned_tag_link: None,
+    test_container: Container,
+    test_db: Database,
+) -> None:
+    del orphaned_tag_link
+
+    await test_container.db_repairer().repair_database()
+
+    async with test_db.session() as session:
+        query = select(TagModel.usage_count).where(TagModel.name == "drifted")
+        assert await session.scalar(query) == 1
+
+
+@pytest.fixture
+async def follower(
+    article: ArticleModel,
+    user_model_factory: UserModelFactory,
+    add_to_db: AddToDb,
+    test_db: Database,
+) -> AsyncGenerator[UserModel, None]:
+    follower = user_model_factory(user_id=uuid.uuid4(), username="follower")
+    other_user = user_model_factory(user_id=uuid.uuid4(), username="other_user")
+    await add_to_db(follower, other_user)
+    await add_to_db(
+        FollowerModel(
+            follower_id=follower.id,
+            following_id=article.author_id,
+            created_at=CREATED_AT,
+        ),
+        # Followers of other users do not count towards the fan-out limit.
+        FollowerModel(
+            follower_id=other_user.id,
+            following_id=follower.id,
+            created_at=CREATED_AT,
+        ),
+    )
+    yield follower
+    async with test_db.session() as session:
+        await session.execute(
+            delete(TimelineModel).where(TimelineModel.follower_id == follower.id),
+        )
+
+
+@pytest.mark.anyio
+async def test_repair_rebuilds_timeline(
+    article: ArticleModel,
+    follower: UserModel,
+    test_db: Database,
+) -> None:
+    db_repairer = DatabaseRepairer(test_db, feed_followers_limit=1)
+
+    await db_repairer.repair_database()
+
+    async with test_db.session() as session:
+        query = select(TimelineModel.article_id).where(
+            TimelineModel.follower_id == follower.id,
+        )
+        assert list(await session.scalars(query)) == [article.id]
+
+
+@pytest.mark.anyio
+async def test_repair_recomputes_follow_counts(
+    follower: UserModel,
+    test_container: Container,
+    test_db: Database,
+) -> None:
+    await test_container.db_repairer().repair_database()
+
+    async with test_db.session() as session:
+        query = select(UserModel.followers_count, UserModel.following_count).where(
+            UserModel.id == follower.id,
+        )
+        assert (await session.execute(query)).one() == (1, 1)
@@ -0,0 +1,206 @@
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import Final
+
+import pytest
+from sqlalchemy import Connection, inspect, select, text
+
+from conduit.infrastructure.persistence.database_repairer import DatabaseRepairer
+from conduit.infrastructure.persistence.database_schema_upgrader import (
+    DatabaseSchemaUpgrader,
+)
+from conduit.infrastructure.persistence.database_seeder import Database
+from conduit.infrastructure.persistence.models import (
+    ArticleModel,
+    Base,
+    TagModel,
+    TimelineModel,
+    UserModel,
+)
+
+FEED_FOLLOWERS_LIMIT: Final = 100
+
+# Schema the models were created with before counters and the timeline.
+BASELINE_SCHEMA: Final = (
+    """
+    CREATE TABLE tags (
+        id INTEGER NOT NULL,
+        name VARCHAR NOT NULL,
+        created_at DATETIME NOT NULL,
+        PRIMARY KEY (id),
+        UNIQUE (name)
+    )
+    """,
+    """
+    CREATE TABLE users (
+        id INTEGER NOT NULL,
+        user_id CHAR(32) NOT NULL,
+        username VARCHAR NOT NULL,
+        bio VARCHAR NOT NULL,
+        image_url VARCHAR,
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME,
+        PRIMARY KEY (id),
+        UNIQUE (user_id),
+        UNIQUE (username)
+    )
+    """,
+    """
+    CREATE TABLE articles (
+        id INTEGER NOT NULL,
+        author_id INTEGER NOT NULL,
+        slug VARCHAR NOT NULL,
+        title VARCHAR NOT NULL,
+        description VARCHAR NOT NULL,
+        body VARCHAR NOT NULL,
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY(author_id) REFERENCES users (id),
+        UNIQUE (slug)
+    )
+    """,
+    """
+    CREATE TABLE followers (
+        follower_id INTEGER NOT NULL,
+        following_id INTEGER NOT NULL,
+        created_at DATETIME NOT NULL,
+        PRIMARY KEY (follower_id, following_id),
+        FOREIGN KEY(follower_id) REFERENCES users (id),
+        FOREIGN KEY(following_id) REFERENCES users (id)
+    )
+    """,
+    """
+    CREATE TABLE articles_tags (
+        article_id INTEGER NOT NULL,
+        tag_id INTEGER NOT NULL,
+        created_at DATETIME NOT NULL,
+        PRIMARY KEY (article_id, tag_id),
+        FOREIGN KEY(article_id) REFERENCES articles (id) ON DELETE CASCADE,
+        FOREIGN KEY(tag_id) REFERENCES tags (id)
+    )
+    """,
+    """
+    CREATE TABLE comments (
+        id INTEGER NOT NULL,
+        article_id INTEGER NOT NULL,
+        author_id INTEGER NOT NULL,
+        body VARCHAR NOT NULL,
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY(article_id) REFERENCES articles (id) ON DELETE CASCADE,
+        FOREIGN KEY(author_id) REFERENCES users (id)
+    )
+    """,
+    """
+    CREATE TABLE favorites (
+        user_id INTEGER NOT NULL,
+        article_id INTEGER NOT NULL,
+        created_at DATETIME NOT NULL,
+        PRIMARY KEY (user_id, article_id),
+        FOREIGN KEY(user_id) REFERENCES users (id),
+        FOREIGN KEY(article_id) REFERENCES articles (id) ON DELETE CASCADE
+    )
+    """,
+)
+
+BASELINE_ROWS: Final = (
+    """
+    INSERT INTO users VALUES
+        (1, '11111111222222223333333344444444', 'author', '', NULL,
+         '2023-01-01 00:00:00', NULL),
+        (2, '55555555666666667777777788888888', 'reader', '', NULL,
+         '2023-01-01 00:00:00', NULL)
+    """,
+    "INSERT INTO tags VALUES (1, 'baseline', '2023-01-01 00:00:00')",
+    """
+    INSERT INTO articles VALUES
+        (1, 1, 'baseline-article', 'Title', 'Description', 'Body',
+         '2023-01-01 00:00:00', '2023-01-01 00:00:00')
+    """,
+    "INSERT INTO followers VALUES (2, 1, '2023-01-01 00:00:00')",
+    "INSERT INTO articles_tags VALUES (1, 1, '2023-01-01 00:00:00')",
+    """
+    INSERT INTO comments VALUES
+        (1, 1, 2, 'Comment', '2023-01-01 00:00:00', '2023-01-01 00:00:00')
+    """,
+    "INSERT INTO favorites VALUES (2, 1, '2023-01-01 00:00:00')",
+)
+
+
+@pytest.fixture
+async def baseline_db(tmp_path: Path) -> AsyncGenerator[Database, None]:
+    db = Database(f"sqlite+aiosqlite:///{tmp_path / 'baseline.db'}")
+    async with db.engine.begin() as conn:
+        for statement in (*BASELINE_SCHEMA, *BASELINE_ROWS):
+            await conn.execute(text(statement))
+    yield db
+    await db.dispose()
+
+
+@pytest.mark.anyio
+async def test_upgrade_adds_missing_tables_columns_and_indexes(
+    baseline_db: Database,
+) -> None:
+    assert await DatabaseSchemaUpgrader(baseline_db, Base).upgrade_schema()
+
+    def get_schema(conn: Connection) -> dict[str, tuple[set[str], set[str]]]:
+        inspector = inspect(conn)
+        return {
+            table_name: (
+                {column["name"] for column in inspector.get_columns(table_name)},
+                {index["name"] or "" for index in inspector.get_indexes(table_name)},
+            )
+            for table_name in inspector.get_table_names()
+        }
+
+    async with baseline_db.engine.connect() as conn:
+        schema = await conn.run_sync(get_schema)
+
+    for table in Base.metadata.sorted_tables:
+        columns, indexes = schema[table.name]
+        assert columns == {column.name for column in table.columns}
+        assert indexes >= {index.name for index in table.indexes if index.name}
+
+
+@pytest.mark.anyio
+async def test_upgrade_of_an_up_to_date_database_changes_nothing(
+    baseline_db: Database,
+) -> None:
+    upgrader = DatabaseSchemaUpgrader(baseline_db, Base)
+    await upgrader.upgrade_schema()
+
+    assert not await upgrader.upgrade_schema()
+
+
+@pytest.mark.anyio
+async def test_repair_backfills_an_upgraded_database(
+    baseline_db: Database,
+) -> None:
+    await DatabaseSchemaUpgrader(baseline_db, Base).upgrade_schema()
+
+    await DatabaseRepairer(baseline_db, FEED_FOLLOWERS_LIMIT).repair_database()
+
+    async with baseline_db.session() as session:
+        article = (
+            await session.execute(
+                select(ArticleModel.favorites_count, ArticleModel.comments_count),
+            )
+        ).one()
+        assert tuple(article) == (1, 1)
+        assert await session.scalar(select(TagModel.usage_count)) == 1
+        author = (
+            await session.execute(
+                select(UserModel.followers_count, UserModel.following_count).where(
+                    UserModel.username == "author",
+                ),
+            )
+        ).one()
+        assert tuple(author) == (1, 0)
+        timeline = (
+            await session.execute(
+                select(TimelineModel.follower_id, TimelineModel.article_id),
+            )
+        ).all()
+        assert [tuple(row) for row in timeline] == [(2, 1)]
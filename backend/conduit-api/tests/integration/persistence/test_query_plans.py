@@ -0,0 +1,396 @@
+"""Runs `EXPLAIN QUERY PLAN` on every statement issued by the repositories.
+
+A statement fails the check when SQLite plans a full table scan or builds a
+temporary B-tree to sort, group or deduplicate rows. Scans of covering indexes
+are fine: counting every filtered article has to visit each of them anyway.
+"""
+
+import datetime
+import re
+import uuid
+from collections.abc import Generator, Sequence
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+
+from conduit.application.common.paging import Cursor
+from conduit.application.common.repositories.articles import ListFilters
+from conduit.application.common.repositories.favorites import FavoriteChange
+from conduit.containers import Container
+from conduit.domain.articles.articles import (
+    Article,
+    NewArticleDetailsWithSlug,
+    UpdateArticleFields,
+)
+from conduit.domain.comments.comments import NewComment
+from conduit.infrastructure.persistence.database_seeder import Database
+from conduit.infrastructure.persistence.models import (
+    ArticleModel,
+    Base,
+    CommentModel,
+    UserModel,
+)
+from tests.integration.conftest import (
+    AddToDb,
+    ArticleModelFactory,
+    UserModelFactory,
+)
+from tests.integration.persistence.conftest import RolledBackUnitOfWork
+
+CREATED_AT = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+PAGE_LIMIT = 20
+
+TABLE_SCAN = re.compile(r"SCAN (?P<table>\w+?)(?:_\d+)?(?: LEFT-JOIN)?")
+
+
+def _is_slow_step(step: str) -> bool:
+    if "TEMP B-TREE" in step:
+        return True
+    table_scan = TABLE_SCAN.fullmatch(step)
+    return table_scan is not None and table_scan["table"] in Base.metadata.tables
+
+
+def _step_path(parents: dict[int, tuple[int, str]], step_id: int) -> list[str]:
+    path: list[str] = []
+    while step_id in parents:
+        step_id, step = parents[step_id]
+        path.insert(0, step)
+    return path
+
+
+class QueryPlans:
+    def __init__(self, db: Database) -> None:
+        self._db = db
+        self._statements: list[tuple[str, Any]] = []
+
+    def capture(  # noqa: PLR0913
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,  # noqa: FBT001
+    ) -> None:
+        del conn, cursor, context
+        if executemany:
+            parameters = parameters[0]
+        self._statements.append((statement, parameters))
+
+    async def slow_steps(self) -> dict[str, list[str]]:
+        """Returns the slow plan steps of every captured statement that has any.
+
+        Each step is prefixed with the steps it is nested in.
+        """
+
+        statements, self._statements = self._statements, []
+        slow_steps: dict[str, list[str]] = {}
+        async with self._db.engine.connect() as conn:
+            for statement, parameters in statements:
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {statement}",
+                    parameters,
+                )
+                rows = result.all()
+                parents = {
+                    step_id: (parent_id, step) for step_id, parent_id, _, step in rows
+                }
+                steps = [
+                    " > ".join(_step_path(parents, step_id))
+                    for step_id, _, _, step in rows
+                    if _is_slow_step(step)
+                ]
+                if steps:
+                    slow_steps[statement] = steps
+        return slow_steps
+
+
+@pytest.fixture
+def query_plans(test_db: Database) -> Generator[QueryPlans, None, None]:
+    query_plans = QueryPlans(test_db)
+    engine = test_db.engine.sync_engine
+    event.listen(engine, "before_cursor_execute", query_plans.capture)
+    yield query_plans
+    event.remove(engine, "before_cursor_execute", query_plans.capture)
+
+
+@pytest.fixture
+async def author(
+    user_model_factory: UserModelFactory,
+    add_to_db: AddToDb,
+) -> UserModel:
+    author = user_model_factory(user_id=uuid.uuid4(), username="plan_author")
+    await add_to_db(author)
+    return author
+
+
+@pytest.fixture
+async def reader(
+    user_model_factory: UserModelFactory,
+    add_to_db: AddToDb,
+) -> UserModel:
+    reader = user_model_factory(user_id=uuid.uuid4(), username="plan_reader")
+    await add_to_db(reader)
+    return reader
+
+
+@pytest.fixture
+async def article(
+    author: UserModel,
+    article_model_factory: ArticleModelFactory,
+    add_to_db: AddToDb,
+) -> ArticleModel:
+    article = article_model_factory(author_id=author.id, slug="plan-article")
+    await add_to_db(article)
+    return article
+
+
+@pytest.fixture
+async def comment(
+    article: ArticleModel,
+    reader: UserModel,
+    add_to_db: AddToDb,
+) -> CommentModel:
+    comment = CommentModel(
+        article_id=article.id,
+        author_id=reader.id,
+        body="Comment body",
+        created_at=CREATED_AT,
+        updated_at=CREATED_AT,
+    )
+    await add_to_db(comment)
+    return comment
+
+
+def _list_filters() -> Sequence[ListFilters]:
+    return [
+        ListFilters(tag=None, author=None, favorited=None),
+        ListFilters(tag="plan", author=None, favorited=None),
+        ListFilters(tag=None, author="plan_author", favorited=None),
+        ListFilters(tag=None, author=None, favorited="plan_reader"),
+    ]
+
+
+@pytest.mark.anyio
+async def test_articles_queries_use_indexes(
+    article: ArticleModel,
+    test_container: Container,
+    rolled_back_unit_of_work: RolledBackUnitOfWork,
+    query_plans: QueryPlans,
+) -> None:
+    articles_repository = test_container.articles_repository()
+
+    async with rolled_back_unit_of_work():
+        await articles_repository.get_ref_by_slug(article.slug)
+        await articles_repository.get_version_by_slug(
+            article.slug,
+            viewer_id=article.author_id,
+        )
+        await articles_repository.get_with_author_by_slug(
+            article.slug,
+            viewer_id=article.author_id,
+        )
+        await articles_repository.get_versioned_by_slug(
+            article.slug,
+            viewer_id=article.author_id,
+        )
+        for filters in _list_filters():
+            await articles_repository.list_by_filters(
+                limit=PAGE_LIMIT,
+                offset=0,
+                filters=filters,
+                cursor=None,
+            )
+        await articles_repository.list_by_filters(
+            limit=PAGE_LIMIT,
+            offset=0,
+            filters=ListFilters(tag=None, author=None, favorited=None),
+            cursor=Cursor(created_at=CREATED_AT, id=article.id),
+        )
+        await articles_repository.update_by_slug(
+            article.slug,
+            UpdateArticleFields(title=None, description=None, body="New body"),
+        )
+        await articles_repository.add(
+            article.author_id,
+            NewArticleDetailsWithSlug(
+                title="New article",
+                slug="new-plan-article",
+                description="Article description",
+                body="Article body",
+                tags=[],
+            ),
+        )
+        await articles_repository.add_many(
+            article.author_id,
+            [
+                NewArticleDetailsWithSlug(
+                    title="Batch article",
+                    slug=f"batch-plan-article-{i}",
+                    description="Article description",
+                    body="Article body",
+                    tags=[],
+                )
+                for i in range(2)
+            ],
+        )
+        await articles_repository.delete_by_id(article.id)
+
+    assert await query_plans.slow_steps() == {}
+
+
+@pytest.mark.anyio
+async def test_feed_queries_use_indexes(
+    article: ArticleModel,
+    reader: UserModel,
+    test_container: Container,
+    rolled_back_unit_of_work: RolledBackUnitOfWork,
+    query_plans: QueryPlans,
+) -> None:
+    articles_repository = test_container.articles_repository()
+    timeline_repository = test_container.timeline_repository()
+    article_entity = Article(
+        id=article.id,
+        author_id=article.author_id,
+        slug=article.slug,
+        title=article.title,
+        description=article.description,
+        body=article.body,
+        favorites_count=0,
+        created_at=article.created_at,
+        updated_at=article.updated_at,
+    )
+
+    async with rolled_back_unit_of_work():
+        await timeline_repository.backfill(reader.id, article.author_id)
+        await timeline_repository.fan_out(article_entity)
+        await timeline_repository.prune(reader.id, article.author_id)
+        await timeline_repository.delete_by_article_id(article.id)
+        await articles_repository.list_by_followings(
+            user_id=reader.id,
+            limit=PAGE_LIMIT,
+            offset=0,
+            cursor=None,
+        )
+
+    slow_steps = await query_plans.slow_steps()
+
+    # The timeline is read in index order and merged with the pulled articles,
+    # only those are sorted as they come from one index range per author.
+    assert list(slow_steps.values()) == [
+        [
+            "MATERIALIZE page_ids > MERGE (UNION ALL) > RIGHT"
+            " > USE TEMP B-TREE FOR ORDER BY",
+        ],
+    ]
+
+
+@pytest.mark.anyio
+async def test_favorites_and_followers_queries_use_indexes(
+    article: ArticleModel,
+    reader: UserModel,
+    test_container: Container,
+    rolled_back_unit_of_work: RolledBackUnitOfWork,
+    query_plans: QueryPlans,
+) -> None:
+    favorites_repository = test_container.favorites_repository()
+    followers_repository = test_container.followers_repository()
+
+    async with rolled_back_unit_of_work():
+        await favorites_repository.add(article_id=article.id, user_id=reader.id)
+        await favorites_repository.list_favorited(reader.id, [article.id])
+        await favorites_repository.delete(article_id=article.id, user_id=reader.id)
+        await favorites_repository.apply_changes(
+            [
+                FavoriteChange(
+                    article_id=article.id,
+                    user_id=reader.id,
+                    favorited=True,
+                ),
+                FavoriteChange(
+                    article_id=article.id,
+                    user_id=article.author_id,
+                    favorited=False,
+                ),
+            ],
+        )
+        await followers_repository.create(reader.id, article.author_id)
+        await followers_repository.exists(reader.id, article.author_id)
+        await followers_repository.list(reader.id, [article.author_id])
+        await followers_repository.delete(reader.id, article.author_id)
+
+    assert await query_plans.slow_steps() == {}
+
+
+@pytest.mark.anyio
+async def test_comments_and_users_queries_use_indexes(
+    comment: CommentModel,
+    reader: UserModel,
+    test_container: Container,
+    rolled_back_unit_of_work: RolledBackUnitOfWork,
+    query_plans: QueryPlans,
+) -> None:
+    comments_repository = test_container.comments_repository()
+    users_repository = test_container.users_repository()
+
+    async with rolled_back_unit_of_work():
+        await comments_repository.add(
+            NewComment(
+                article_id=comment.article_id,
+                author_id=reader.id,
+                body="New comment",
+            ),
+        )
+        await comments_repository.list_with_authors_by_article_id(
+            comment.article_id,
+            limit=PAGE_LIMIT,
+            cursor=None,
+            viewer_id=reader.id,
+        )
+        await comments_repository.list_with_authors_by_article_id(
+            comment.article_id,
+            limit=PAGE_LIMIT,
+            cursor=Cursor(created_at=CREATED_AT, id=comment.id),
+            viewer_id=None,
+        )
+        await comments_repository.get(comment.id)
+        await comments_repository.delete(comment.id)
+        await users_repository.get_by_id_or_none(reader.id)
+        await users_repository.get_by_user_id_or_none(reader.user_id)
+        await users_repository.get_by_username_or_none(reader.username)
+        await users_repository.get_profile_version_by_username(
+            reader.username,
+            viewer_id=reader.id,
+        )
+        await users_repository.get_versioned_profile_by_username(
+            reader.username,
+            viewer_id=reader.id,
+        )
+
+    assert await query_plans.slow_steps() == {}
+
+
+@pytest.mark.anyio
+async def test_tags_queries_use_indexes(
+    article: ArticleModel,
+    test_container: Container,
+    rolled_back_unit_of_work: RolledBackUnitOfWork,
+    query_plans: QueryPlans,
+) -> None:
+    tags_repository = test_container.tags_repository()
+
+    async with rolled_back_unit_of_work():
+        await tags_repository.add_many(article.id, ["plan", "index"])
+        await tags_repository.add_to_articles({article.id: ["plan", "batch"]})
+        await tags_repository.list_by_article_id(article.id)
+        await tags_repository.get_all_tags()
+        await tags_repository.get_version()
+        await tags_repository.list_popular(limit=PAGE_LIMIT)
+        await tags_repository.delete_by_article_id(article.id)
+
+    slow_steps = await query_plans.slow_steps()
+
+    # Listing all tags reads the whole table by design.
+    assert list(slow_steps.values()) == [["SCAN tags"]]
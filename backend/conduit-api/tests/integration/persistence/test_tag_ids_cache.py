@@ -0,0 +1,126 @@
+import re
+import uuid
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from dependency_injector import providers
+from sqlalchemy import delete, event
+from sqlalchemy.engine import Connection
+
+from conduit.containers import Container
+from conduit.infrastructure.persistence.database_seeder import Database
+from conduit.infrastructure.persistence.models import (
+    ArticleModel,
+    ArticleTagModel,
+    TagModel,
+)
+from conduit.infrastructure.persistence.tag_ids_cache import TagIdsCache
+from tests.integration.conftest import (
+    AddToDb,
+    ArticleModelFactory,
+    TagModelFactory,
+    UserModelFactory,
+)
+from tests.integration.persistence.conftest import RolledBackUnitOfWork
+
+TAGS_TABLE = re.compile(r"\btags\b")
+# Linking a tag only bumps its usage count, it is neither read nor inserted.
+USAGE_COUNT_UPDATE = re.compile(r"^UPDATE tags SET usage_count=")
+
+
+@pytest.fixture
+def tag_ids_cache(
+    test_container: Container,
+    test_db: Database,
+) -> Generator[TagIdsCache, None, None]:
+    tag_ids_cache = TagIdsCache(db=test_db, enabled=True, max_size=16)
+    with test_container.tag_ids_cache.override(  # type: ignore
+        providers.Object(tag_ids_cache),
+    ):
+        yield tag_ids_cache
+
+
+@pytest.fixture
+def statements(test_db: Database) -> Generator[list[str], None, None]:
+    statements: list[str] = []
+
+    def capture(conn: Connection, cursor: Any, statement: str, *_: Any) -> None:
+        del conn, cursor
+        statements.append(statement)
+
+    engine = test_db.engine.sync_engine
+    event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+@pytest.fixture
+async def article(
+    user_model_factory: UserModelFactory,
+    article_model_factory: ArticleModelFactory,
+    tag_model_factory: TagModelFactory,
+    add_to_db: AddToDb,
+) -> ArticleModel:
+    author = user_model_factory(user_id=uuid.uuid4(), username="tags_author")
+    await add_to_db(author)
+    article = article_model_factory(author_id=author.id, slug="tagged-article")
+    await add_to_db(article, tag_model_factory(name="known"))
+    return article
+
+
+@pytest.mark.anyio
+async def test_known_tags_are_linked_without_touching_tags_table(
+    article: ArticleModel,
+    tag_ids_cache: TagIdsCache,
+    test_container: Container,
+    rolled_back_unit_of_work: RolledBackUnitOfWork,
+    statements: list[str],
+) -> None:
+    await tag_ids_cache.warm_up()
+    statements.clear()
+    tags_repository = test_container.tags_repository()
+
+    async with rolled_back_unit_of_work():
+        [tag] = await tags_repository.add_many(article.id, ["known"])
+
+    assert tag.id == tag_ids_cache.get("known")
+    assert not [
+        statement
+        for statement in statements
+        if TAGS_TABLE.search(statement) and not USAGE_COUNT_UPDATE.match(statement)
+    ]
+
+
+@pytest.mark.anyio
+async def test_new_tags_are_cached_after_commit(
+    article: ArticleModel,
+    tag_ids_cache: TagIdsCache,
+    test_container: Container,
+    test_db: Database,
+) -> None:
+    tags_repository = test_container.tags_repository()
+
+    async with test_container.uow_factory()():
+        [tag] = await tags_repository.add_many(article.id, ["new"])
+
+    async with test_db.create_session() as session:
+        await session.execute(delete(ArticleTagModel))
+        await session.execute(delete(TagModel).where(TagModel.id == tag.id))
+        await session.commit()
+    assert tag_ids_cache.get("new") == tag.id
+
+
+@pytest.mark.anyio
+async def test_new_tags_are_not_cached_after_rollback(
+    article: ArticleModel,
+    tag_ids_cache: TagIdsCache,
+    test_container: Container,
+    rolled_back_unit_of_work: RolledBackUnitOfWork,
+) -> None:
+    tags_repository = test_container.tags_repository()
+
+    async with rolled_back_unit_of_work():
+        await tags_repository.add_many(article.id, ["new"])
+
+    assert tag_ids_cache.get("new") is None
@@ -0,0 +1,159 @@
+import logging
+
+import pytest
+
+from conduit.domain.tags.tag import Tag
+from conduit.infrastructure.persistence.database_seeder import Database
+from conduit.infrastructure.persistence.tag_suggestions_index import (
+    RANKED_TAGS_PER_PREFIX,
+    TagSuggestionsIndex,
+)
+from tests.integration.conftest import AddToDb, TagModelFactory
+
+MAX_SIZE = 16
+LIMIT = 10
+
+
+@pytest.fixture
+def index(test_db: Database) -> TagSuggestionsIndex:
+    return TagSuggestionsIndex(db=test_db, enabled=True, max_size=MAX_SIZE)
+
+
+def _names(tags: list[Tag]) -> list[str]:
+    return [tag.name for tag in tags]
+
+
+@pytest.mark.anyio
+async def test_suggests_tags_by_prefix_in_alphabetical_order(
+    index: TagSuggestionsIndex,
+) -> None:
+    index.put_many(
+        [
+            Tag(id=1, name="python"),
+            Tag(id=2, name="pytest"),
+            Tag(id=3, name="rust"),
+            Tag(id=4, name="py"),
+        ],
+    )
+
+    assert _names(index.suggest("py", LIMIT)) == ["py", "pytest", "python"]
+
+
+@pytest.mark.anyio
+async def test_suggests_most_used_tags_first(index: TagSuggestionsIndex) -> None:
+    index.put_many([Tag(id=1, name="python"), Tag(id=2, name="pytest")])
+    index.put_many([Tag(id=3, name="pypy")], usage_count=2)
+    index.add_to_usage_counts({1: 1, 4: 1})
+
+    assert _names(index.suggest("py", 2)) == ["pypy", "python"]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("name", "prefix"),
+    [
+        ("Python", "pY"),
+        ("Straße", "STRASS"),
+        ("ｆｕｌｌｗｉｄｔｈ", "full"),  # noqa: RUF001
+        ("сюрприз с пробелами", "СЮР"),  # noqa: RUF001
+        ("😎 leetcode", "😎"),
+    ],
+)
+async def test_matches_unicode_names_in_any_case_and_form(
+    index: TagSuggestionsIndex,
+    name: str,
+    prefix: str,
+) -> None:
+    index.put_many([Tag(id=1, name=name)])
+
+    assert _names(index.suggest(prefix, LIMIT)) == [name]
+
+
+@pytest.mark.anyio
+async def test_does_not_suggest_names_only_sharing_a_shorter_prefix(
+    index: TagSuggestionsIndex,
+) -> None:
+    index.put_many([Tag(id=1, name="pz"), Tag(id=2, name="p"), Tag(id=3, name="pyz")])
+
+    assert _names(index.suggest("py", LIMIT)) == ["pyz"]
+
+
+@pytest.mark.anyio
+async def test_ignores_tags_beyond_max_size(
+    index: TagSuggestionsIndex,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    with caplog.at_level(logging.WARNING):
+        index.put_many(Tag(id=tag_id, name=f"tag{tag_id}") for tag_id in range(32))
+        index.put_many([Tag(id=100, name="tag100")])
+
+    assert len(index.suggest("tag", MAX_SIZE * 2)) == MAX_SIZE
+    assert len(caplog.records) == 1
+
+
+@pytest.mark.anyio
+async def test_ranking_of_a_common_prefix_follows_usage(test_db: Database) -> None:
+    index = TagSuggestionsIndex(
+        db=test_db,
+        enabled=True,
+        max_size=RANKED_TAGS_PER_PREFIX * 2 + 1,
+    )
+    index.put_many(
+        Tag(id=tag_id, name=f"tag{tag_id:03d}")
+        for tag_id in range(RANKED_TAGS_PER_PREFIX * 2)
+    )
+    assert _names(index.suggest("t", 1)) == ["tag000"]
+
+    index.add_to_usage_counts({RANKED_TAGS_PER_PREFIX: 1})
+    index.put_many([Tag(id=-1, name="t")])
+
+    assert _names(index.suggest("t", 2)) == [f"tag{RANKED_TAGS_PER_PREFIX:03d}", "t"]
+
+
+@pytest.mark.anyio
+async def test_disabled_index_stays_empty(
+    test_db: Database,
+    tag_model_factory: TagModelFactory,
+    add_to_db: AddToDb,
+) -> None:
+    await add_to_db(tag_model_factory(name="unindexed"))
+    index = TagSuggestionsIndex(db=test_db, enabled=False, max_size=MAX_SIZE)
+
+    await index.warm_up()
+    index.put_many([Tag(id=1, name="python")])
+
+    assert index.suggest("unindexed", LIMIT) == []
+    assert index.suggest("python", LIMIT) == []
+
+
+@pytest.mark.anyio
+async def test_warm_up_loads_tags_with_their_usage(
+    index: TagSuggestionsIndex,
+    tag_model_factory: TagModelFactory,
+    add_to_db: AddToDb,
+) -> None:
+    await add_to_db(
+        tag_model_factory(name="warm", usage_count=1),
+        tag_model_factory(name="warmer", usage_count=5),
+    )
+
+    await index.warm_up()
+
+    assert _names(index.suggest("WARM", LIMIT)) == ["warmer", "warm"]
+
+
+@pytest.mark.anyio
+async def test_warm_up_keeps_tags_put_before_it(
+    index: TagSuggestionsIndex,
+    tag_model_factory: TagModelFactory,
+    add_to_db: AddToDb,
+) -> None:
+    await add_to_db(
+        tag_model_factory(name="warmest", usage_count=3),
+        tag_model_factory(name="warm", usage_count=1),
+    )
+    index.put_many([Tag(id=-1, name="warmer")], usage_count=2)
+
+    await index.warm_up()
+
+    assert _names(index.suggest("warm", LIMIT)) == ["warmest", "warmer", "warm"]
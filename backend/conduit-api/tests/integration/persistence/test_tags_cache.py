@@ -0,0 +1,100 @@
+import uuid
+from collections.abc import Generator
+
+import pytest
+from dependency_injector import providers
+from sqlalchemy import delete
+
+from conduit.application.tags.services.tags_cache import TagsCache
+from conduit.containers import Container
+from conduit.infrastructure.persistence.database_seeder import Database
+from conduit.infrastructure.persistence.models import (
+    ArticleModel,
+    ArticleTagModel,
+    TagModel,
+)
+from tests.integration.conftest import (
+    AddToDb,
+    ArticleModelFactory,
+    TagModelFactory,
+    UserModelFactory,
+)
+from tests.integration.persistence.conftest import RolledBackUnitOfWork
+
+
+@pytest.fixture
+def tags_cache(test_container: Container) -> Generator[TagsCache, None, None]:
+    tags_cache = TagsCache(enabled=True, ttl_seconds=60)
+    with test_container.tags_cache.override(  # type: ignore
+        providers.Object(tags_cache),
+    ):
+        yield tags_cache
+
+
+@pytest.fixture
+async def article(
+    user_model_factory: UserModelFactory,
+    article_model_factory: ArticleModelFactory,
+    tag_model_factory: TagModelFactory,
+    add_to_db: AddToDb,
+) -> ArticleModel:
+    author = user_model_factory(user_id=uuid.uuid4(), username="tags_author")
+    await add_to_db(author)
+    article = article_model_factory(author_id=author.id, slug="tagged-article")
+    await add_to_db(article, tag_model_factory(name="known"))
+    return article
+
+
+@pytest.mark.anyio
+async def test_new_tags_invalidate_cache_after_commit(
+    article: ArticleModel,
+    tags_cache: TagsCache,
+    test_container: Container,
+    test_db: Database,
+) -> None:
+    version = tags_cache.version
+    tags_repository = test_container.tags_repository()
+
+    async with test_container.uow_factory()():
+        [tag] = await tags_repository.add_many(article.id, ["new"])
+
+    async with test_db.create_session() as session:
+        await session.execute(delete(ArticleTagModel))
+        await session.execute(delete(TagModel).where(TagModel.id == tag.id))
+        await session.commit()
+    assert tags_cache.version != version
+
+
+@pytest.mark.anyio
+async def test_known_tags_do_not_invalidate_cache(
+    article: ArticleModel,
+    tags_cache: TagsCache,
+    test_container: Container,
+    test_db: Database,
+) -> None:
+    version = tags_cache.version
+    tags_repository = test_container.tags_repository()
+
+    async with test_container.uow_factory()():
+        await tags_repository.add_many(article.id, ["known"])
+
+    async with test_db.create_session() as session:
+        await session.execute(delete(ArticleTagModel))
+        await session.commit()
+    assert tags_cache.version == version
+
+
+@pytest.mark.anyio
+async def test_new_tags_do_not_invalidate_cache_after_rollback(
+    article: ArticleModel,
+    tags_cache: TagsCache,
+    test_container: Container,
+    rolled_back_unit_of_work: RolledBackUnitOfWork,
+) -> None:
+    version = tags_cache.version
+    tags_repository = test_container.tags_repository()
+
+    async with rolled_back_unit_of_work():
+        await tags_repository.add_many(article.id, ["new"])
+
+    assert tags_cache.version == version
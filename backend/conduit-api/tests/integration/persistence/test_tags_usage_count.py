@@ -0,0 +1,67 @@
+import uuid
+
+import pytest
+
+from conduit.containers import Container
+from conduit.infrastructure.persistence.models import ArticleModel
+from tests.integration.conftest import (
+    AddToDb,
+    ArticleModelFactory,
+    TagModelFactory,
+    UserModelFactory,
+)
+from tests.integration.persistence.conftest import RolledBackUnitOfWork
+
+
+@pytest.fixture
+async def articles(
+    user_model_factory: UserModelFactory,
+    article_model_factory: ArticleModelFactory,
+    tag_model_factory: TagModelFactory,
+    add_to_db: AddToDb,
+) -> list[ArticleModel]:
+    author = user_model_factory(user_id=uuid.uuid4(), username="tags_author")
+    await add_to_db(author)
+    articles = [
+        article_model_factory(author_id=author.id, slug=f"tagged-article-{index}")
+        for index in range(2)
+    ]
+    await add_to_db(*articles, tag_model_factory(name="known"))
+    return articles
+
+
+@pytest.mark.anyio
+async def test_linking_tags_counts_their_articles(
+    articles: list[ArticleModel],
+    test_container: Container,
+    rolled_back_unit_of_work: RolledBackUnitOfWork,
+) -> None:
+    first_article, second_article = articles
+    tags_repository = test_container.tags_repository()
+
+    async with rolled_back_unit_of_work():
+        await tags_repository.add_many(first_article.id, ["known", "new"])
+        await tags_repository.add_to_articles(
+            {first_article.id: ["known"], second_article.id: ["known"]},
+        )
+        popular_tags = await tags_repository.list_popular(limit=10)
+
+    assert [tag.name for tag in popular_tags] == ["known", "new"]
+
+
+@pytest.mark.anyio
+async def test_deleting_article_tags_uncounts_them(
+    articles: list[ArticleModel],
+    test_container: Container,
+    rolled_back_unit_of_work: RolledBackUnitOfWork,
+) -> None:
+    first_article, second_article = articles
+    tags_repository = test_container.tags_repository()
+
+    async with rolled_back_unit_of_work():
+        await tags_repository.add_many(first_article.id, ["known", "new"])
+        await tags_repository.add_many(second_article.id, ["new"])
+        await tags_repository.delete_by_article_id(first_article.id)
+        popular_tags = await tags_repository.list_popular(limit=10)
+
+    assert [tag.name for tag in popular_tags] == ["new"]
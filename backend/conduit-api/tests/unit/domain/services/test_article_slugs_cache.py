@@ -0,0 +1,115 @@
+import pytest
+
+from conduit.domain.articles.articles import ArticleRef
+from conduit.infrastructure.persistence.article_slugs_cache import ArticleSlugsCache
+
+TTL_SECONDS = 300
+NEGATIVE_TTL_SECONDS = 5
+MAX_SIZE = 2
+
+ARTICLE = ArticleRef(id=1, author_id=1)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> ArticleSlugsCache:
+    return ArticleSlugsCache(
+        enabled=True,
+        max_size=MAX_SIZE,
+        ttl_seconds=TTL_SECONDS,
+        negative_ttl_seconds=NEGATIVE_TTL_SECONDS,
+        clock=clock,
+    )
+
+
+def test_returns_cached_article(cache: ArticleSlugsCache) -> None:
+    slug = "article-slug"
+    cache.put(slug, ARTICLE, cache.version)
+
+    cached_slug = cache.get(slug)
+
+    assert cached_slug is not None
+    assert cached_slug.article == ARTICLE
+
+
+def test_article_expires_after_ttl(cache: ArticleSlugsCache, clock: FakeClock) -> None:
+    slug = "article-slug"
+    cache.put(slug, ARTICLE, cache.version)
+
+    clock.now += TTL_SECONDS
+
+    assert cache.get(slug) is None
+
+
+def test_unknown_slug_expires_after_negative_ttl(
+    cache: ArticleSlugsCache,
+    clock: FakeClock,
+) -> None:
+    slug = "article-slug"
+    cache.put(slug, None, cache.version)
+
+    cached_slug = cache.get(slug)
+    clock.now += NEGATIVE_TTL_SECONDS
+
+    assert cached_slug is not None
+    assert cached_slug.article is None
+    assert cache.get(slug) is None
+
+
+def test_invalidate_drops_slug(cache: ArticleSlugsCache) -> None:
+    slug = "article-slug"
+    cache.put(slug, ARTICLE, cache.version)
+
+    cache.invalidate(slug)
+
+    assert cache.get(slug) is None
+
+
+def test_slug_read_before_invalidation_is_not_cached(
+    cache: ArticleSlugsCache,
+) -> None:
+    slug = "article-slug"
+    version = cache.version
+    cache.invalidate(slug)
+
+    cache.put(slug, ARTICLE, version)
+
+    assert cache.get(slug) is None
+
+
+def test_evicts_least_recently_used_slug(cache: ArticleSlugsCache) -> None:
+    first_slug, second_slug, third_slug = "first-slug", "second-slug", "third-slug"
+    cache.put(first_slug, ARTICLE, cache.version)
+    cache.put(second_slug, ARTICLE, cache.version)
+    cache.get(first_slug)
+
+    cache.put(third_slug, ARTICLE, cache.version)
+
+    assert cache.get(second_slug) is None
+    assert cache.get(first_slug) is not None
+
+
+def test_disabled_cache_never_returns_slugs() -> None:
+    cache = ArticleSlugsCache(
+        enabled=False,
+        max_size=MAX_SIZE,
+        ttl_seconds=TTL_SECONDS,
+        negative_ttl_seconds=NEGATIVE_TTL_SECONDS,
+    )
+    slug = "article-slug"
+
+    cache.put(slug, ARTICLE, cache.version)
+
+    assert cache.get(slug) is None
@@ -0,0 +1,102 @@
+import pytest
+
+from conduit.application.articles.services.articles_list_cache import (
+    ArticlesListCache,
+    ArticlesPageKey,
+)
+from conduit.application.common.repositories.articles import ArticlesPage, ListFilters
+
+TTL_SECONDS = 30
+MAX_SIZE = 2
+
+PAGE = ArticlesPage(articles=[], articles_count=0, read_count=0)
+
+
+def _page_key(offset: int = 0) -> ArticlesPageKey:
+    return ArticlesPageKey(
+        filters=ListFilters(tag=None, author=None, favorited=None),
+        limit=20,
+        offset=offset,
+        cursor=None,
+    )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> ArticlesListCache:
+    return ArticlesListCache(
+        enabled=True,
+        ttl_seconds=TTL_SECONDS,
+        max_size=MAX_SIZE,
+        clock=clock,
+    )
+
+
+def test_returns_cached_page(cache: ArticlesListCache) -> None:
+    cache.put(_page_key(), PAGE, cache.version)
+
+    assert cache.get(_page_key()) is PAGE
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_counts_misses(cache: ArticlesListCache) -> None:
+    assert cache.get(_page_key()) is None
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_page_expires_after_ttl(cache: ArticlesListCache, clock: FakeClock) -> None:
+    cache.put(_page_key(), PAGE, cache.version)
+
+    clock.now += TTL_SECONDS
+
+    assert cache.get(_page_key()) is None
+
+
+def test_invalidate_drops_cached_pages(cache: ArticlesListCache) -> None:
+    cache.put(_page_key(), PAGE, cache.version)
+
+    cache.invalidate()
+
+    assert cache.get(_page_key()) is None
+
+
+def test_page_read_before_invalidation_is_not_cached(
+    cache: ArticlesListCache,
+) -> None:
+    version = cache.version
+    cache.invalidate()
+
+    cache.put(_page_key(), PAGE, version)
+
+    assert cache.get(_page_key()) is None
+
+
+def test_evicts_least_recently_used_page(cache: ArticlesListCache) -> None:
+    cache.put(_page_key(offset=0), PAGE, cache.version)
+    cache.put(_page_key(offset=1), PAGE, cache.version)
+    cache.get(_page_key(offset=0))
+
+    cache.put(_page_key(offset=2), PAGE, cache.version)
+
+    assert cache.get(_page_key(offset=1)) is None
+    assert cache.get(_page_key(offset=0)) is PAGE
+
+
+def test_disabled_cache_never_returns_pages() -> None:
+    cache = ArticlesListCache(enabled=False, ttl_seconds=TTL_SECONDS, max_size=1)
+
+    cache.put(_page_key(), PAGE, cache.version)
+
+    assert cache.get(_page_key()) is None
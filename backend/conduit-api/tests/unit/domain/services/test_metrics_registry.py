@@ -0,0 +1,119 @@
+import pytest
+
+from conduit.infrastructure.metrics.instrumentation import instrument
+from conduit.infrastructure.metrics.registry import (
+    LATENCY_BUCKETS_MS,
+    NS_IN_ONE_MS,
+    MetricsRegistry,
+    OperationMetrics,
+)
+
+GAUGE_VALUE = 3.0
+ONE_MS_BUCKET = 1.0
+NEXT_BUCKET = 2.5
+TWO_CALLS = 2
+
+
+class CustomError(Exception):
+    pass
+
+
+class Repository:
+    prefix = "tag"
+
+    async def get(self, name: str) -> str:
+        return f"{self.prefix}:{name}"
+
+    async def fail(self) -> None:
+        raise CustomError
+
+
+class UseCase:
+    async def __call__(self) -> int:
+        return 1
+
+
+@pytest.fixture
+def metrics() -> MetricsRegistry:
+    return MetricsRegistry(enabled=True, gauges={"cache_hits": lambda: GAUGE_VALUE})
+
+
+def test_observations_fall_into_their_bucket() -> None:
+    operation = OperationMetrics()
+
+    operation.observe(NS_IN_ONE_MS)
+    operation.observe(NS_IN_ONE_MS + 1)
+
+    assert operation.bucket_counts[LATENCY_BUCKETS_MS.index(ONE_MS_BUCKET)] == 1
+    assert operation.bucket_counts[LATENCY_BUCKETS_MS.index(NEXT_BUCKET)] == 1
+    assert operation.quantile_ms(0.5) == ONE_MS_BUCKET
+    assert operation.quantile_ms(1) == NEXT_BUCKET
+
+
+def test_quantile_above_last_bucket_is_unknown() -> None:
+    operation = OperationMetrics()
+
+    operation.observe(int(LATENCY_BUCKETS_MS[-1] * NS_IN_ONE_MS) + 1)
+
+    assert operation.quantile_ms(0.5) is None
+
+
+@pytest.mark.anyio
+async def test_records_latency_of_repository_methods(metrics: MetricsRegistry) -> None:
+    repository = instrument(Repository(), metrics)
+
+    assert await repository.get("python") == "tag:python"
+
+    assert repository.prefix == "tag"
+    assert metrics.snapshot()["operations"]["Repository.get"]["count"] == 1
+
+
+@pytest.mark.anyio
+async def test_records_latency_of_use_cases(metrics: MetricsRegistry) -> None:
+    use_case = instrument(UseCase(), metrics)
+
+    assert await use_case() == 1
+
+    assert metrics.operations["UseCase.__call__"].count == 1
+
+
+@pytest.mark.anyio
+async def test_instances_share_timed_methods(metrics: MetricsRegistry) -> None:
+    await instrument(Repository(), metrics).get("python")
+    await instrument(Repository(), metrics).get("rust")
+
+    assert metrics.timed_method(Repository, "get") is metrics.timed_method(
+        Repository,
+        "get",
+    )
+    assert metrics.operations["Repository.get"].count == TWO_CALLS
+
+
+@pytest.mark.anyio
+async def test_counts_errors(metrics: MetricsRegistry) -> None:
+    repository = instrument(Repository(), metrics)
+
+    with pytest.raises(CustomError):
+        await repository.fail()
+
+    operation = metrics.operations["Repository.fail"]
+    assert (operation.count, operation.errors) == (1, 1)
+
+
+def test_disabled_registry_leaves_targets_alone() -> None:
+    repository = Repository()
+
+    metrics = MetricsRegistry(enabled=False)
+
+    assert instrument(repository, metrics) is repository
+
+
+def test_snapshot_reads_gauges(metrics: MetricsRegistry) -> None:
+    assert metrics.snapshot()["gauges"] == {"cache_hits": GAUGE_VALUE}
+
+
+def test_snapshot_sums_counters(metrics: MetricsRegistry) -> None:
+    metrics.increment("purged_rows_total", 2)
+    metrics.increment("purged_rows_total")
+
+    assert metrics.snapshot()["counters"] == {"purged_rows_total": 3}
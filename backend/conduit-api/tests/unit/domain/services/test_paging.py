@@ -0,0 +1,36 @@
+import datetime
+from dataclasses import dataclass
+
+from conduit.application.common.paging import Cursor, page_read_limit, split_page
+
+CREATED_AT = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+LIMIT = 2
+
+
+@dataclass(frozen=True)
+class Item:
+    id: int
+    created_at: datetime.datetime
+
+
+ITEMS = [Item(id=item_id, created_at=CREATED_AT) for item_id in (3, 2, 1)]
+
+
+def test_extra_item_gives_cursor_after_last_item_of_page() -> None:
+    page, cursor = split_page(ITEMS, LIMIT)
+
+    assert page == ITEMS[:LIMIT]
+    assert cursor == Cursor(created_at=CREATED_AT, id=ITEMS[LIMIT - 1].id)
+
+
+def test_last_page_has_no_cursor() -> None:
+    assert split_page(ITEMS[:LIMIT], LIMIT) == (ITEMS[:LIMIT], None)
+
+
+def test_item_dropped_after_read_keeps_cursor() -> None:
+    items = [ITEMS[0], ITEMS[2]]
+
+    page, cursor = split_page(items, LIMIT, read_count=page_read_limit(LIMIT))
+
+    assert page == items
+    assert cursor == Cursor(created_at=CREATED_AT, id=ITEMS[2].id)
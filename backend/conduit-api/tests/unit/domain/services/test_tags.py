@@ -1,27 +1,27 @@
-import logging
 from typing import Any
 from unittest import mock
 
 import pytest
 
 from conduit.application.common.repositories.tags import TagsRepository
+from conduit.application.tags.services.tags_cache import TagsCache
 from conduit.application.tags.services.tags_service import TagsService
 from conduit.domain.tags.tag import Tag
 
 
 @pytest.fixture
-def tags_service_logger() -> Any:
-    return mock.create_autospec(spec=logging.Logger, spec_set=True)
+def tags_cache() -> TagsCache:
+    return TagsCache(enabled=True, ttl_seconds=60)
 
 
 @pytest.fixture
 def tags_service(
     tags_repository: TagsRepository,
-    tags_service_logger: logging.Logger,
+    tags_cache: TagsCache,
 ) -> TagsService:
     return TagsService(
         tags_repository=tags_repository,
-        logger=tags_service_logger,
+        tags_cache=tags_cache,
     )
 
 
@@ -62,29 +62,39 @@ class TestSuccessullyGetAllTags:
 
         tags_repository.get_all_tags.assert_awaited_once()
 
+
+class TestGetTagsList:
+    @pytest.fixture(autouse=True)
+    def returned_tags(self, tags_repository: mock.AsyncMock) -> None:
+        tags_repository.get_all_tags.return_value = [Tag(id=1, name="angularjs")]
+        tags_repository.get_version.return_value = 1
+
     @pytest.mark.anyio
-    async def test_logs_the_initial_message(
+    async def test_reads_tags_once_while_cached(
         self,
         tags_service: TagsService,
-        tags_service_logger: mock.Mock,
+        tags_repository: mock.AsyncMock,
     ) -> None:
-        await tags_service.get_all_tags()
+        first_list = await tags_service.get_tags_list()
+        second_list = await tags_service.get_tags_list()
 
-        tags_service_logger.info.assert_any_call("Retrieving tags")
+        assert second_list is first_list
+        assert first_list.tags == [Tag(id=1, name="angularjs")]
+        tags_repository.get_all_tags.assert_awaited_once()
 
     @pytest.mark.anyio
-    async def test_logs_the_final_message_with_time(
+    async def test_reads_tags_again_after_invalidation(
         self,
         tags_service: TagsService,
-        tags_service_logger: mock.Mock,
+        tags_cache: TagsCache,
+        tags_repository: mock.AsyncMock,
     ) -> None:
-        await tags_service.get_all_tags()
+        first_list = await tags_service.get_tags_list()
+        tags_cache.invalidate()
+        second_list = await tags_service.get_tags_list()
 
-        tags_service_logger.info.assert_any_call(
-            "Retrieving tags took %dms",
-            mock.ANY,
-            extra=mock.ANY,
-        )
+        assert second_list is not first_list
+        assert tags_repository.get_all_tags.await_args_list == [mock.call()] * 2
 
 
 class TestRepositoryRaisesException:
@@ -115,28 +125,3 @@ class TestRepositoryRaisesException:
             await tags_service.get_all_tags()
 
         tags_repository.get_all_tags.assert_awaited_once()
-
-    @pytest.mark.anyio
-    async def test_logs_the_initial_message(
-        self,
-        tags_service: TagsService,
-        tags_service_logger: mock.Mock,
-    ) -> None:
-        with pytest.raises(TestRepositoryRaisesException.CustomError):
-            await tags_service.get_all_tags()
-
-        tags_service_logger.info.assert_any_call("Retrieving tags")
-
-    @pytest.mark.anyio
-    async def test_tags_service_logger_logs_error(
-        self,
-        tags_service: TagsService,
-        tags_service_logger: mock.AsyncMock,
-    ) -> None:
-        with pytest.raises(TestRepositoryRaisesException.CustomError):
-            await tags_service.get_all_tags()
-
-        tags_service_logger.exception.assert_called_once_with(
-            "Error retrieving tags",
-            extra=mock.ANY,
-        )
@@ -0,0 +1,69 @@
+import pytest
+
+from conduit.application.tags.services.tags_cache import TagsCache, TagsList
+from conduit.domain.tags.tag import Tag
+
+TTL_SECONDS = 60
+REBUILD_DURATION_MS = 1.5
+
+TAGS_LIST = TagsList(tags=[Tag(id=1, name="python")], version=1)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> TagsCache:
+    return TagsCache(enabled=True, ttl_seconds=TTL_SECONDS, clock=clock)
+
+
+def test_returns_cached_tags(cache: TagsCache) -> None:
+    cache.put(TAGS_LIST, cache.version, REBUILD_DURATION_MS)
+
+    assert cache.get() is TAGS_LIST
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert cache.rebuild_duration_ms == REBUILD_DURATION_MS
+
+
+def test_counts_misses(cache: TagsCache) -> None:
+    assert cache.get() is None
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_tags_expire_after_ttl(cache: TagsCache, clock: FakeClock) -> None:
+    cache.put(TAGS_LIST, cache.version, REBUILD_DURATION_MS)
+    clock.now += TTL_SECONDS
+
+    assert cache.get() is None
+
+
+def test_invalidate_drops_cached_tags(cache: TagsCache) -> None:
+    cache.put(TAGS_LIST, cache.version, REBUILD_DURATION_MS)
+    cache.invalidate()
+
+    assert cache.get() is None
+
+
+def test_does_not_cache_tags_read_before_invalidation(cache: TagsCache) -> None:
+    version = cache.version
+    cache.invalidate()
+    cache.put(TAGS_LIST, version, REBUILD_DURATION_MS)
+
+    assert cache.get() is None
+
+
+def test_disabled_cache_never_returns_tags() -> None:
+    cache = TagsCache(enabled=False, ttl_seconds=TTL_SECONDS)
+    cache.put(TAGS_LIST, cache.version, REBUILD_DURATION_MS)
+
+    assert cache.get() is None
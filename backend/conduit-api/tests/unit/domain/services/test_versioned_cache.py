@@ -0,0 +1,68 @@
+import pytest
+
+from conduit.application.common.versioned_cache import VersionedCache
+
+TTL_SECONDS = 60
+SHORT_TTL_SECONDS = 5
+MAX_SIZE = 2
+FIRST_VALUE = 1
+SECOND_VALUE = 2
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> VersionedCache[str, int]:
+    return VersionedCache(
+        enabled=True,
+        ttl_seconds=TTL_SECONDS,
+        max_size=MAX_SIZE,
+        clock=clock,
+    )
+
+
+def test_invalidate_makes_every_value_stale(cache: VersionedCache[str, int]) -> None:
+    cache.put("first", FIRST_VALUE, cache.version)
+    cache.put("second", SECOND_VALUE, cache.version)
+
+    cache.invalidate()
+
+    assert cache.get("first") is None
+    assert cache.get("second") is None
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_invalidate_key_keeps_other_values(cache: VersionedCache[str, int]) -> None:
+    version = cache.version
+    cache.put("first", FIRST_VALUE, version)
+    cache.put("second", SECOND_VALUE, version)
+
+    cache.invalidate_key("first")
+    cache.put("first", FIRST_VALUE, version)
+
+    assert cache.get("first") is None
+    assert cache.get("second") == SECOND_VALUE
+
+
+def test_value_expires_after_its_own_ttl(
+    cache: VersionedCache[str, int],
+    clock: FakeClock,
+) -> None:
+    cache.put("short", FIRST_VALUE, cache.version, ttl_seconds=SHORT_TTL_SECONDS)
+    cache.put("long", SECOND_VALUE, cache.version)
+
+    clock.now += SHORT_TTL_SECONDS
+
+    assert cache.get("short") is None
+    assert cache.get("long") is not None
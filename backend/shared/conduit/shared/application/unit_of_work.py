@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Callable
 from contextvars import ContextVar, Token
 from types import TracebackType
 from typing import Optional, final
@@ -49,6 +50,10 @@ class UnitOfWork(abc.ABC):
             raise NoContextSessionError
         return context
 
+    @abc.abstractmethod
+    def add_commit_hook(self, hook: Callable[[], None]) -> None:
+        """Registers a hook to run once the unit of work is committed."""
+
     @abc.abstractmethod
     async def commit(self) -> None: ...
 
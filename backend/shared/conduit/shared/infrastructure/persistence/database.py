@@ -1,20 +1,49 @@
 import contextlib
-from collections.abc import AsyncIterator
+import functools
+from collections.abc import AsyncIterator, Sequence
 from pathlib import Path
-from typing import Final
-
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from typing import Any, Final
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
 DATABASE_THERSHOLD_SIZE: Final = 100
 
 
+def _set_sqlite_pragmas(
+    pragmas: Sequence[str],
+    dbapi_connection: Any,
+    connection_record: Any,
+) -> None:
+    del connection_record
+    cursor = dbapi_connection.cursor()
+    for pragma in pragmas:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
 class Database:
-    def __init__(self, db_url: str) -> None:
+    def __init__(self, db_url: str, sqlite_pragmas: Sequence[str] = ()) -> None:
+        """`sqlite_pragmas`, like `"foreign_keys = ON"`, are set on every new
+        connection to a SQLite database.
+        """
+
         self._engine = create_async_engine(
             db_url,
             echo=True,
         )
+        if sqlite_pragmas and self._engine.dialect.name == "sqlite":
+            event.listen(
+                self._engine.sync_engine,
+                "connect",
+                functools.partial(_set_sqlite_pragmas, tuple(sqlite_pragmas)),
+            )
 
         # If I want to EXPLICITLY start any transaction,
         # "autobegin=False" can be passed to session maker factory.
@@ -24,6 +53,10 @@ class Database:
             close_resets_only=False,
         )
 
+    @property
+    def engine(self) -> AsyncEngine:
+        return self._engine
+
     async def database_exists(self) -> bool:
         database = self._engine.url.database
         if database is None:
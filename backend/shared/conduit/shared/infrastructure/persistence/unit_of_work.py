@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from types import TracebackType
 from typing import Optional, final
 
@@ -24,6 +25,7 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
     def __init__(self, db: Database) -> None:
         self._db = db
         self._session: Optional[AsyncSession] = None
+        self._commit_hooks: list[Callable[[], None]] = []
 
     @property
     def session(self) -> AsyncSession:
@@ -32,10 +34,18 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
 
         return self._session
 
+    def add_commit_hook(self, hook: Callable[[], None]) -> None:
+        self._commit_hooks.append(hook)
+
     async def commit(self) -> None:
         await self.session.commit()
 
+        hooks, self._commit_hooks = self._commit_hooks, []
+        for hook in hooks:
+            hook()
+
     async def rollback(self) -> None:
+        self._commit_hooks.clear()
         await self.session.rollback()
 
     async def close(self) -> None: